@@ -0,0 +1,83 @@
+import time
+import numpy as np
+from ga_hypertuner.evaluation import Scorer
+
+
+def sphere(x):
+    """
+    Sphere function. Its minimum is 0 at the origin.
+
+    :param x: A NumpyArray of coordinates.
+    :type x: NumpyArray
+
+    :return: value of the function.
+    :rtype: float
+    """
+    return float(np.sum(x ** 2))
+
+
+def rastrigin(x):
+    """
+    Rastrigin function, a multimodal function with many local minima. Its global minimum is 0 at the origin.
+
+    :param x: A NumpyArray of coordinates.
+    :type x: NumpyArray
+
+    :return: value of the function.
+    :rtype: float
+    """
+    return float(10 * len(x) + np.sum(x ** 2 - 10 * np.cos(2 * np.pi * x)))
+
+
+objectives = {"sphere": sphere, "rastrigin": rastrigin}
+
+
+def analytic_space(dim, int_fraction=0.0):
+    """
+    Builds model parameters and boundaries of an analytic benchmark, with parameters named x0, x1, ...
+
+    :param dim: number of optimized parameters.
+    :type dim: int
+
+    :param int_fraction: fraction of parameters that are integers. Default is 0.
+    :type int_fraction: float
+
+    :return: model parameters and boundaries.
+    :rtype: tuple
+    """
+    n_int = int(round(dim * int_fraction))
+    model_parameters = {}
+    boundaries = {}
+    for j in range(dim):
+        model_parameters["x" + str(j)] = [None, int] if j < n_int else [None, float]
+        boundaries["x" + str(j)] = [-5, 5] if j < n_int else [-5.12, 5.12]
+    return model_parameters, boundaries
+
+
+class AnalyticScorer(Scorer):
+    """
+    Scorer that returns the negated value of an analytic function instead of cross validating a model, so a benchmark measures only the cost of the algorithm itself.
+
+    :param objective: name of the function, a key of objectives.
+    :type objective: str
+
+    :param k: Number of folds reported as evaluated, so evaluations count as complete.
+    :type k: int
+
+    :ivar evaluations: number of evaluations done by this scorer.
+    """
+
+    def __init__(self, objective, k=5):
+        super().__init__(None, np.zeros((2 * k, 1)), np.zeros(2 * k), None, k=k)
+        self.objective = objectives[objective]
+        self.evaluations = 0
+
+    def race(self, params, threshold, fidelity=1.0):
+        self.evaluations += 1
+        start = time.time()
+        x = np.array([params[p] for p in sorted(params, key=lambda name: int(name[1:]))], dtype=float)
+        score = -self.objective(x)
+        end = time.time()
+        return {"params": params, "score": score, "folds": self.k, "fold_scores": [score] * self.k,
+                "fit_time": 0.0, "score_time": end - start, "fold_times": [], "model_size": np.nan, "start": start,
+                "end": end, "worker": None, "fidelity": fidelity, "timed_out": False}
@@ -0,0 +1,258 @@
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import time
+import warnings
+import numpy as np
+from ga_hypertuner.ga import GA
+from benchmarks.objectives import AnalyticScorer, analytic_space
+from ga_hypertuner.sandbox import Sandbox
+
+# modules only the features that use them should load
+heavy_modules = ["matplotlib", "pandas", "scipy", "sklearn"]
+
+
+def build_ga(model_class, model_parameters, boundaries, x_train, y_train, scoring, pop_size, gmax, **kwargs):
+    """
+    Builds a GA with benchmark defaults: maximization, fixed seed and no reporting.
+
+    :return: A GA instance.
+    :rtype: GA
+    """
+    ga_parameters = {"pop_size": pop_size, "fscale": 0.5, "gmax": gmax, "direction": "max", "cp": 0.5}
+    kwargs.setdefault("random_state", 0)
+    return GA(ga_parameters, model_class, model_parameters, boundaries, x_train, y_train, scoring, verbosity=0,
+              **kwargs)
+
+
+def run_ga(ga):
+    """
+    Runs a GA with its output silenced.
+
+    :return: best params and wall-clock seconds of the run.
+    :rtype: tuple
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        best_params = ga.main()
+    return best_params, time.perf_counter() - start
+
+
+def analytic_ga(objective, dim, pop_size, gmax, int_fraction=0.0, **kwargs):
+    """
+    Builds a GA that optimizes an analytic objective, with an AnalyticScorer in place of cross validation.
+
+    :return: the GA and its scorer.
+    :rtype: tuple
+    """
+    model_parameters, boundaries = analytic_space(dim, int_fraction)
+    scorer = AnalyticScorer(objective)
+    ga = build_ga(None, model_parameters, boundaries, scorer.x_t, scorer.y_t, None, pop_size, gmax, **kwargs)
+    ga.scorer = scorer
+    ga.evaluator.scorer = scorer
+    return ga, scorer
+
+
+def overhead(quick=False):
+    """
+    Measures the cost of the algorithm itself, per evaluation, on analytic objectives with a near-zero-cost scorer.
+
+    :return: A generator of result records.
+    """
+    pop_sizes = [10, 50] if quick else [10, 20, 50, 100, 200]
+    dims = [2, 10] if quick else [2, 5, 10, 20, 50]
+    caches = [0, 1024]
+    gmax = 10 if quick else 30
+    for objective, pop_size, dim, cache_size in itertools.product(["sphere", "rastrigin"], pop_sizes, dims, caches):
+        ga, scorer = analytic_ga(objective, dim, pop_size, gmax, int_fraction=0.5, cache_size=cache_size)
+        _, seconds = run_ga(ga)
+        evaluations = pop_size * gmax
+        yield {"suite": "overhead", "objective": objective, "pop_size": pop_size, "dim": dim,
+               "cache_size": cache_size, "evaluations": evaluations, "fits": scorer.evaluations,
+               "seconds": seconds, "us_per_evaluation": 1e6 * seconds / evaluations}
+
+
+def throughput(quick=False):
+    """
+    Measures end-to-end evaluations per second of scikit-learn models on generated datasets of increasing size, for each backend and number of workers.
+
+    :return: A generator of result records.
+    """
+    from sklearn.datasets import make_classification
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.tree import DecisionTreeClassifier
+
+    models = {
+        "logistic_regression": (LogisticRegression, {"C": [None, float], "max_iter": 200}, {"C": [0.01, 10]}),
+        "decision_tree": (DecisionTreeClassifier, {"max_depth": [None, int], "min_samples_leaf": [None, int]},
+                          {"max_depth": [1, 20], "min_samples_leaf": [1, 50]}),
+    }
+    sizes = [1000, 10000] if quick else [1000, 10000, 100000]
+    workers = [(1, "serial"), (4, "thread"), (4, "process")] if quick else \
+        [(1, "serial")] + [(n, backend) for backend in ["thread", "process"] for n in [2, 4, 8, os.cpu_count()]]
+    pop_size = 10 if quick else 20
+    gmax = 3 if quick else 5
+    for (name, (model, model_parameters, boundaries)), n_samples in itertools.product(models.items(), sizes):
+        x, y = make_classification(n_samples=n_samples, n_features=20, random_state=0)
+        for n_workers, backend in workers:
+            ga = build_ga(model, model_parameters, boundaries, x, y, "accuracy", pop_size, gmax, k=3,
+                          n_workers=n_workers, backend=backend)
+            _, seconds = run_ga(ga)
+            evaluations = pop_size * gmax
+            yield {"suite": "throughput", "model": name, "n_samples": n_samples, "backend": backend,
+                   "n_workers": n_workers, "evaluations": evaluations, "seconds": seconds,
+                   "evaluations_per_second": evaluations / seconds}
+
+
+def convergence(quick=False, seeds=None, **kwargs):
+    """
+    Records the best score reached for each evaluation budget on analytic objectives. Extra keyword arguments are passed to GA, so variants of the algorithm can be compared on the same budgets.
+
+    :return: A generator of result records.
+    """
+    seeds = seeds if seeds is not None else (range(3) if quick else range(10))
+    dims = [5] if quick else [5, 10, 20]
+    pop_size = 20
+    gmax = 30 if quick else 100
+    for objective, dim, seed in itertools.product(["sphere", "rastrigin"], dims, seeds):
+        ga, _ = analytic_ga(objective, dim, pop_size, gmax, random_state=seed, **kwargs)
+        run_ga(ga)
+        # evaluations done by the end of each generation, the initial population is not one of them
+        budgets = np.cumsum([s["evaluations"] + s["cached"] for s in ga.generation_stats])[1:].tolist()
+        yield {"suite": "convergence", "objective": objective, "dim": dim, "seed": seed, "pop_size": pop_size,
+               "variant": kwargs, "evaluations": budgets, "best_score": [float(s) for s in ga.max_scores]}
+
+
+def compare(suite, variants, quick=False):
+    """
+    Compares variants of the algorithm with the default one, the first variant, on the convergence budgets. Each variant yields its convergence records, then a summary for each objective and dimension: the mean best score at the final budget, and the mean number of evaluations needed to reach the mean final best score of the default, over seeds that reached it.
+
+    :return: A generator of result records.
+    """
+    runs = {}
+    for variant in variants:
+        for record in convergence(quick=quick, **variant):
+            runs.setdefault((record["objective"], record["dim"]), []).append(record)
+            yield record
+    for (objective, dim), records in runs.items():
+        baseline = [r for r in records if r["variant"] == variants[0]]
+        target = float(np.mean([r["best_score"][-1] for r in baseline]))
+        for variant in variants:
+            results = [r for r in records if r["variant"] == variant]
+            reached = [next(e for e, b in zip(r["evaluations"], r["best_score"]) if b >= target) for r in results
+                       if max(r["best_score"]) >= target]
+            yield {"suite": suite, "objective": objective, "dim": dim, "variant": variant, "target": target,
+                   "mean_final_best": float(np.mean([r["best_score"][-1] for r in results])),
+                   "reached": len(reached), "runs": len(results),
+                   "mean_evaluations_to_target": float(np.mean(reached)) if reached else None}
+
+
+def strategies(quick=False):
+    """
+    Compares mutation strategies and parameter adaptation with rand/1. see :func:`compare`.
+
+    :return: A generator of result records.
+    """
+    return compare("strategies", [{}, {"strategy": "best/1"}, {"strategy": "current-to-best/1"},
+                                  {"strategy": "rand/2"}, {"strategy": "current-to-pbest/1", "adaptation": "jade"},
+                                  {"strategy": "current-to-pbest/1", "adaptation": "shade"}], quick)
+
+
+def initializers(quick=False):
+    """
+    Compares space-filling and opposition-based initialization with random initialization. Budgets include the extra evaluations of opposites. see :func:`compare`.
+
+    :return: A generator of result records.
+    """
+    return compare("initializers", [{}, {"init": "lhs"}, {"init": "sobol"}, {"init": "halton"},
+                                    {"opposition": True}, {"init": "lhs", "opposition": True}], quick)
+
+
+def probe(code, repeats):
+    """
+    Runs code in fresh interpreters. The code sets start before the measured part, and the probe prints seconds since start and heavy modules loaded by then.
+
+    :return: median and minimum seconds of the measured part, median seconds of the whole process, and heavy modules loaded.
+    :rtype: tuple
+    """
+    code = "import json, sys, time\nstart = time.perf_counter()\n" + code + "\nprint(json.dumps([" \
+        "time.perf_counter() - start, [m for m in " + repr(heavy_modules) + " if m in sys.modules]]))"
+    seconds = []
+    process_seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        process_seconds.append(time.perf_counter() - start)
+        measured, loaded = json.loads(output.splitlines()[-1])
+        seconds.append(measured)
+    return float(np.median(seconds)), min(seconds), float(np.median(process_seconds)), loaded
+
+
+def imports(quick=False):
+    """
+    Measures, in fresh interpreters, import time of the package entry points and bootstrap time of a worker, which imports the package and receives a scorer, and lists heavy modules they load. Heavy modules should only be loaded by the features that use them, see --check. Also measures start time of a sandbox process.
+
+    :return: A generator of result records.
+    """
+    repeats = 3 if quick else 10
+    targets = {module: "import " + module for module in ["ga_hypertuner.tuner", "ga_hypertuner.worker"]}
+    targets["worker_bootstrap"] = "import pickle\nimport ga_hypertuner.evaluation\nscorer = pickle.loads(" + \
+        repr(pickle.dumps(AnalyticScorer("sphere"))) + ")"
+    for target, code in targets.items():
+        seconds, min_seconds, process_seconds, loaded = probe(code, repeats)
+        yield {"suite": "imports", "target": target, "repeats": repeats, "seconds": seconds,
+               "min_seconds": min_seconds, "process_seconds": process_seconds, "heavy_modules": loaded}
+
+    seconds = []
+    for _ in range(repeats):
+        sandbox = Sandbox(AnalyticScorer("sphere"))
+        start = time.perf_counter()
+        sandbox.start()
+        seconds.append(time.perf_counter() - start)
+        sandbox.close()
+    yield {"suite": "imports", "target": "sandbox_start", "repeats": repeats, "seconds": float(np.median(seconds)),
+           "min_seconds": min(seconds)}
+
+
+suites = {"overhead": overhead, "throughput": throughput, "convergence": convergence, "strategies": strategies,
+          "initializers": initializers, "imports": imports}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of ga_hypertuner throughput and convergence.")
+    parser.add_argument("suites", nargs="*", default=list(suites.keys()), choices=list(suites.keys()))
+    parser.add_argument("--out", default=None, help="JSON lines file results are appended to. Default is stdout.")
+    parser.add_argument("--quick", action="store_true", help="Run a small sweep, for smoke testing.")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with status 1 if an entry point of the imports suite loads a heavy module.")
+    args = parser.parse_args(argv)
+
+    environment = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+                   "cpu_count": os.cpu_count(), "time": time.time()}
+    out = open(args.out, "a") if args.out else sys.stdout
+    failures = []
+    try:
+        for name in args.suites:
+            for record in suites[name](quick=args.quick):
+                record["environment"] = environment
+                out.write(json.dumps(record, default=str) + "\n")
+                out.flush()
+                if record.get("heavy_modules"):
+                    failures.append(record["target"] + " loads " + ", ".join(record["heavy_modules"]))
+    finally:
+        if args.out:
+            out.close()
+    if args.check and failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import numpy as np
+
+
+class Adaptation:
+    """
+    Self-adaptive control of the scaling factor (fscale) and crossover probability (cp) of differential evolution. Each child gets its own fscale, drawn from a Cauchy distribution, and cp, drawn from a normal distribution, around centers that move toward values that produced children better than their parents.
+
+    With "jade", a single center of each parameter moves toward the mean of successful values of each generation by a learning rate. With "shade", a memory of centers keeps the weighted means of successful values of the last memory_size generations, each weighted by how much the child improved on its parent, and each child draws around a random memory slot.
+
+    :param method: Accepted values are "jade" and "shade".
+    :type method: str
+
+    :param fscale: Initial center of scaling factors.
+    :type fscale: float
+
+    :param cp: Initial center of crossover probabilities.
+    :type cp: float
+
+    :param memory_size: Number of memory slots of "shade". Default is 5.
+    :type memory_size: int
+
+    :param learning_rate: Weight of the successful values of a generation in the new centers of "jade". Default is 0.1.
+    :type learning_rate: float
+
+    :ivar methods: accepted values for method.
+    :ivar memory_f: centers of scaling factors, a single one for "jade".
+    :ivar memory_cr: centers of crossover probabilities, a single one for "jade".
+    """
+    methods = ["jade", "shade"]
+
+    def __init__(self, method: str, fscale: float, cp: float, memory_size: int = 5, learning_rate: float = 0.1):
+        self.method = method
+        self.learning_rate = learning_rate
+        size = memory_size if method == "shade" else 1
+        # scaling factors are drawn from a Cauchy distribution, so a zero center would never move
+        self.memory_f = np.full(size, max(fscale, 0.1))
+        self.memory_cr = np.full(size, cp)
+        self.slot = 0
+        self.successes = []
+
+    def sample(self, rng, n):
+        """
+        Draws scaling factors and crossover probabilities of children.
+
+        :param rng: random number generator of the algorithm.
+        :type rng: numpy.random.Generator
+
+        :param n: number of children.
+        :type n: int
+
+        :return: A NumpyArray of scaling factors in (0, 1] and a NumpyArray of crossover probabilities in [0, 1].
+        :rtype: tuple
+        """
+        slots = rng.integers(len(self.memory_f), size=n)
+        cr = np.clip(self.memory_cr[slots] + 0.1 * rng.standard_normal(n), 0.0, 1.0)
+        f = self.memory_f[slots] + 0.1 * rng.standard_cauchy(n)
+        # non positive scaling factors are drawn again, too large ones are truncated
+        redraw = f <= 0
+        while redraw.any():
+            f[redraw] = self.memory_f[slots[redraw]] + 0.1 * rng.standard_cauchy(int(redraw.sum()))
+            redraw = f <= 0
+        return np.minimum(f, 1.0), cr
+
+    def success(self, f, cr, improvement):
+        """
+        Collects parameters of children that were better than their parents, until the next update.
+
+        :param f: scaling factors of successful children.
+        :type f: NumpyArray
+
+        :param cr: crossover probabilities of successful children.
+        :type cr: NumpyArray
+
+        :param improvement: absolute differences between scores of successful children and their parents.
+        :type improvement: NumpyArray
+
+        :return: None
+        """
+        for values in zip(np.atleast_1d(f), np.atleast_1d(cr), np.atleast_1d(improvement)):
+            self.successes.append(values)
+
+    def update(self):
+        """
+        Moves centers toward parameters collected since the last update, and forgets them. Scaling factors are averaged with the Lehmer mean, which favors larger values, so progress does not stall on tiny steps. Nothing changes if no child was successful.
+
+        :return: None
+        """
+        if not self.successes:
+            return
+        f, cr, improvement = (np.array(values, dtype=float) for values in zip(*self.successes))
+        self.successes = []
+        if self.method == "jade":
+            weights = np.full(len(f), 1.0 / len(f))
+        else:
+            weights = improvement / improvement.sum() if improvement.sum() > 0 else np.full(len(f), 1.0 / len(f))
+        mean_f = np.sum(weights * f ** 2) / np.sum(weights * f)
+        mean_cr = np.sum(weights * cr)
+        if self.method == "jade":
+            c = self.learning_rate
+            self.memory_f[0] = (1 - c) * self.memory_f[0] + c * mean_f
+            self.memory_cr[0] = (1 - c) * self.memory_cr[0] + c * mean_cr
+        else:
+            self.memory_f[self.slot] = mean_f
+            self.memory_cr[self.slot] = mean_cr
+            self.slot = (self.slot + 1) % len(self.memory_f)
+
+    def means(self):
+        """
+        Current centers, averaged over memory slots.
+
+        :return: mean center of scaling factors and of crossover probabilities.
+        :rtype: tuple
+        """
+        return float(self.memory_f.mean()), float(self.memory_cr.mean())
+
+    def state(self):
+        """
+        Collects memory of the adaptation, so it can be restored from a checkpoint.
+
+        :return: state of the adaptation.
+        :rtype: dict
+        """
+        return {"memory_f": self.memory_f.copy(), "memory_cr": self.memory_cr.copy(), "slot": self.slot,
+                "successes": list(self.successes)}
+
+    def restore(self, state):
+        """
+        Sets memory of the adaptation from a checkpoint.
+
+        :param state: state of the adaptation. see :meth:`Adaptation.state`.
+        :type state: dict
+
+        :return: None
+        """
+        self.memory_f = state["memory_f"].copy()
+        self.memory_cr = state["memory_cr"].copy()
+        self.slot = state["slot"]
+        self.successes = list(state["successes"])
@@ -0,0 +1,375 @@
+import collections
+import itertools
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing.managers import BaseManager
+
+AUTHKEY_ENV = "GA_HYPERTUNER_AUTHKEY"
+
+
+class BrokerState:
+    """
+    Work queue shared by the driver and workers. The driver puts tasks in it and collects results, workers take tasks, stream back results and send heartbeats. It lives in a manager process, and driver and workers reach it over the network through :class:`BrokerManager` proxies, each from several threads, so all methods are thread safe.
+
+    :param payload: object every worker receives when it registers, the scorer that evaluates tasks.
+
+    :param heartbeat_timeout: Number of seconds without heartbeat after which a worker is considered lost, and its running tasks are queued again.
+    :type heartbeat_timeout: int or float
+    """
+
+    def __init__(self, payload, heartbeat_timeout=10.0):
+        self.payload = payload
+        self.heartbeat_timeout = heartbeat_timeout
+        self.condition = threading.Condition()
+        self.tasks = collections.deque()
+        # running tasks by worker, and the task itself by task id
+        self.running = {}
+        self.task_args = {}
+        self.results = collections.deque()
+        self.heartbeats = {}
+        self.closed = False
+
+    def register(self, worker):
+        """
+        Registers a worker.
+
+        :param worker: identifier of the worker.
+        :type worker: str
+
+        :return: the payload of the run, or None if the broker is closed.
+        """
+        with self.condition:
+            if self.closed:
+                return None
+            self.heartbeats[worker] = time.time()
+            self.running.setdefault(worker, set())
+            return self.payload
+
+    def heartbeat(self, worker):
+        """
+        Records that a worker is alive.
+
+        :param worker: identifier of the worker.
+        :type worker: str
+
+        :return: A bool determining whether the worker should keep running.
+        """
+        with self.condition:
+            if worker in self.heartbeats:
+                self.heartbeats[worker] = time.time()
+            return not self.closed
+
+    def get_task(self, worker, timeout=1.0):
+        """
+        Takes the next task, waiting up to timeout seconds for one.
+
+        :param worker: identifier of the worker.
+        :type worker: str
+
+        :param timeout: Number of seconds to wait for a task.
+        :type timeout: int or float
+
+        :return: A tuple of task id and task arguments, None if no task is available, or False if the broker is closed.
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.tasks or self.closed, timeout=timeout)
+            if self.closed:
+                return False
+            # a task queued again after its lost worker came back may be done already
+            while self.tasks and self.tasks[0] not in self.task_args:
+                self.tasks.popleft()
+            if not self.tasks:
+                return None
+            task_id = self.tasks.popleft()
+            self.heartbeats[worker] = time.time()
+            self.running.setdefault(worker, set()).add(task_id)
+            return task_id, self.task_args[task_id]
+
+    def put_result(self, worker, task_id, record, error=None):
+        """
+        Streams the result of a task back to the driver.
+
+        :param worker: identifier of the worker.
+        :type worker: str
+
+        :param task_id: identifier of the task.
+        :type task_id: int
+
+        :param record: record of the evaluation, or None if it failed.
+        :type record: dict
+
+        :param error: traceback of the failure, if the task failed. Default is None.
+        :type error: str
+
+        :return: None
+        """
+        with self.condition:
+            self.heartbeats[worker] = time.time()
+            self.running.get(worker, set()).discard(task_id)
+            self.results.append((task_id, record, error))
+            self.condition.notify_all()
+
+    def add_task(self, task_id, args):
+        """
+        Queues a task. Called by the driver.
+
+        :param task_id: identifier of the task.
+        :type task_id: int
+
+        :param args: arguments of the task.
+        :type args: tuple
+
+        :return: None
+        """
+        with self.condition:
+            self.task_args[task_id] = args
+            self.tasks.append(task_id)
+            self.condition.notify_all()
+
+    def take_results(self, timeout):
+        """
+        Waits up to timeout seconds for results, and takes all available results. Called by the driver.
+
+        :param timeout: Number of seconds to wait.
+        :type timeout: int or float
+
+        :return: A list of (task id, record, error) tuples.
+        :rtype: list
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.results or self.closed, timeout=timeout)
+            results = list(self.results)
+            self.results.clear()
+            for task_id, _, _ in results:
+                self.task_args.pop(task_id, None)
+            return results
+
+    def requeue_lost(self):
+        """
+        Forgets workers whose last heartbeat is older than heartbeat_timeout, and queues their running tasks again, in front of other tasks. Called by the driver.
+
+        :return: number of queued again tasks.
+        :rtype: int
+        """
+        now = time.time()
+        requeued = 0
+        with self.condition:
+            for worker, last in list(self.heartbeats.items()):
+                if now - last <= self.heartbeat_timeout:
+                    continue
+                del self.heartbeats[worker]
+                for task_id in sorted(self.running.pop(worker, set()), reverse=True):
+                    if task_id in self.task_args:
+                        self.tasks.appendleft(task_id)
+                        requeued += 1
+            if requeued:
+                self.condition.notify_all()
+        return requeued
+
+    def workers(self):
+        """
+        Returns number of live workers.
+
+        :return: number of workers that sent a heartbeat recently.
+        :rtype: int
+        """
+        with self.condition:
+            return len(self.heartbeats)
+
+    def close(self):
+        """
+        Closes the broker. Waiting workers and driver are woken up, and workers stop.
+
+        :return: None
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+# work queue of the broker process, created by the manager initializer
+_state = None
+
+
+def _init_state(payload, heartbeat_timeout):
+    """
+    Initializer of the broker process. Creates the work queue served to driver and workers.
+
+    :return: None
+    """
+    global _state
+    _state = BrokerState(payload, heartbeat_timeout=heartbeat_timeout)
+
+
+def _get_state():
+    """
+    Returns the work queue of the broker process.
+
+    :return: work queue of the broker.
+    :rtype: BrokerState
+    """
+    return _state
+
+
+class BrokerManager(BaseManager):
+    """
+    Manager that serves a :class:`BrokerState` over TCP, to the driver and to workers.
+    """
+
+
+BrokerManager.register("broker", callable=_get_state)
+
+
+class Broker:
+    """
+    Executor that runs evaluations on workers connected over the network, possibly on other hosts. Tasks are queued in a :class:`BrokerState` served by a manager process, results are streamed back as soon as workers finish them and complete the futures returned by :meth:`Broker.submit`. Tasks of workers that stop sending heartbeats are queued again, and a result that arrives after its task was queued again is only used once.
+
+    Workers are started with the ga_hypertuner-worker command, see :mod:`ga_hypertuner.worker`. n_workers workers are also started on the local host.
+
+    :param payload: the scorer workers evaluate tasks with. It is sent once to each worker.
+    :type payload: Scorer
+
+    :param address: "host:port" the broker listens on. Port 0 picks a free port. Default is "127.0.0.1:0".
+    :type address: str
+
+    :param authkey: Key workers authenticate with. If None, a random key is generated, which only local workers know. Default is None.
+    :type authkey: str
+
+    :param n_workers: Number of workers started on the local host. Default is 0.
+    :type n_workers: int
+
+    :param heartbeat_timeout: Number of seconds without heartbeat after which a worker is considered lost. Default is 10.
+    :type heartbeat_timeout: int or float
+
+    :param grace_period: Number of seconds evaluations wait while no worker is alive, for workers to start or reconnect. Pending evaluations then fail, instead of waiting forever for workers that died. Default is 60.
+    :type grace_period: int or float
+
+    :ivar address: "host:port" the broker is listening on.
+    """
+
+    def __init__(self, payload, address: str = "127.0.0.1:0", authkey: str = None, n_workers: int = 0,
+                 heartbeat_timeout=10.0, grace_period=60.0):
+        self.grace_period = grace_period
+        self.authkey = authkey.encode() if authkey is not None else os.urandom(16).hex().encode()
+        host, port = address.rsplit(":", 1)
+        self.manager = BrokerManager(address=(host, int(port)), authkey=self.authkey)
+        self.manager.start(initializer=_init_state, initargs=(payload, heartbeat_timeout))
+        self.address = self.manager.address[0] + ":" + str(self.manager.address[1])
+        self.state = self.manager.broker()
+        self.closed = False
+
+        self.futures = {}
+        self.ids = itertools.count()
+        self.lock = threading.Lock()
+        self.collector = threading.Thread(target=self._collect, name="ga_hypertuner-collector", daemon=True)
+        self.collector.start()
+
+        self.processes = []
+        env = dict(os.environ, **{AUTHKEY_ENV: self.authkey.decode()})
+        for _ in range(n_workers):
+            self.processes.append(subprocess.Popen([sys.executable, "-m", "ga_hypertuner.worker", self.address],
+                                                   env=env))
+
+    def submit(self, *args):
+        """
+        Queues an evaluation.
+
+        :param args: arguments of the task, as (params, threshold, epoch, fidelity). see :meth:`Scorer.race`.
+
+        :return: A future of the evaluation record.
+        :rtype: Future
+        """
+        future = Future()
+        with self.lock:
+            task_id = next(self.ids)
+            self.futures[task_id] = future
+        self.state.add_task(task_id, args)
+        return future
+
+    def _collect(self):
+        """
+        Completes futures with results streamed back by workers, and queues again tasks of lost workers. Pending futures fail once no worker was alive for grace_period seconds. Runs in a background thread until the broker is shut down.
+
+        :return: None
+        """
+        # since when evaluations are pending while no worker is alive
+        unattended = None
+        while not self.closed:
+            try:
+                results = self.state.take_results(1.0)
+                self.state.requeue_lost()
+                alive = self.state.workers() > 0
+            except (EOFError, OSError):
+                # broker process is gone, the broker is being shut down
+                return
+            with self.lock:
+                pending = bool(self.futures)
+            if alive or not pending:
+                unattended = None
+            elif unattended is None:
+                unattended = time.time()
+            elif time.time() - unattended > self.grace_period:
+                self._fail_pending(RuntimeError("No worker was alive for " + str(self.grace_period) + " seconds, "
+                                                "workers died or could not connect to " + self.address))
+                unattended = None
+            for task_id, record, error in results:
+                with self.lock:
+                    future = self.futures.pop(task_id, None)
+                # a task that was queued again may be finished twice
+                if future is None or future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(RuntimeError("Evaluation failed on worker:\n" + error))
+                else:
+                    future.set_result(record)
+
+    def _fail_pending(self, error):
+        """
+        Fails every pending evaluation.
+
+        :param error: exception pending futures are completed with.
+        :type error: Exception
+
+        :return: None
+        """
+        with self.lock:
+            futures = list(self.futures.values())
+            self.futures = {}
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def workers(self):
+        """
+        Returns number of live workers.
+
+        :return: number of workers.
+        :rtype: int
+        """
+        return self.state.workers()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Stops workers, the broker process and its collector. Pending evaluations are cancelled.
+
+        :return: None
+        """
+        self.closed = True
+        self.state.close()
+        self.collector.join()
+        with self.lock:
+            futures = list(self.futures.values())
+            self.futures = {}
+        for future in futures:
+            future.cancel()
+        for process in self.processes:
+            try:
+                process.wait(timeout=5 if wait else 0)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+        self.processes = []
+        self.manager.shutdown()
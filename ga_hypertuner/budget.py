@@ -0,0 +1,154 @@
+import heapq
+import inspect
+import os
+from ga_hypertuner.callbacks import Callback
+
+
+class CpuBudget(Callback):
+    """
+    Splits a budget of CPU cores between the three levels of parallelism of an optimization: evaluations running at the same time (workers of the population), cross validation folds fitted at the same time within an evaluation, and threads of each model (BLAS and OpenMP threads, and the thread parameter of the model, like n_jobs or nthread). The product of the three never exceeds the budget, so nested parallelism does not oversubscribe cores.
+
+    Before anything is measured, cores go to the outermost level first, since it has the least synchronization. Evaluations of the first generation are recorded, and :meth:`CpuBudget.allocate` then picks the split that finishes a generation of those evaluations first.
+
+    :param n_cpus: Number of cores of the budget. If -1, all cores of the host. Default is -1.
+    :type n_cpus: int
+
+    :param pop_size: Number of individuals in the population.
+    :type pop_size: int
+
+    :param k: Number of cross validation folds.
+    :type k: int
+
+    :param model_class: The machine learning model class whose thread parameter is set.
+
+    :param backend: Backend used for evaluating individuals. Serial backend always has a single worker. Default is "serial".
+    :type backend: str
+
+    :param parallel_fraction: Fraction of a fit that runs in parallel on model threads, used to estimate the speedup of model threads. Only used if the model has a thread parameter, otherwise model threads are assumed to give no speedup. Default is 0.8.
+    :type parallel_fraction: float
+
+    :param tolerance: Splits whose estimated generation time is within this fraction of the best are considered equal, and the one with most workers, then most parallel folds, is picked. Default is 0.05.
+    :type tolerance: float
+
+    :ivar thread_parameters: names of model parameters that set the number of threads of a model, in order of preference.
+    :ivar split: current split, a tuple of number of workers, number of folds fitted at the same time and number of threads of each model.
+    :ivar allocated: whether the split was picked from measured evaluations.
+    """
+    thread_parameters = ["n_jobs", "nthread", "n_threads", "num_threads", "thread_count"]
+
+    def __init__(self, n_cpus: int = -1, pop_size: int = 1, k: int = 5, model_class=None, backend: str = "serial",
+                 parallel_fraction: float = 0.8, tolerance: float = 0.05):
+        self.n_cpus = n_cpus if n_cpus != -1 else os.cpu_count() or 1
+        self.pop_size = pop_size
+        self.k = k
+        self.backend = backend
+        self.thread_parameter = CpuBudget.thread_parameter_of(model_class)
+        self.parallel_fraction = parallel_fraction if self.thread_parameter is not None else 0.0
+        self.tolerance = tolerance
+        self.records = []
+        self.allocated = False
+        self.split = self.initial_split()
+
+    @staticmethod
+    def thread_parameter_of(model_class):
+        """
+        Finds the parameter that sets the number of threads of a model, from the signature of its constructor, so the model is not created.
+
+        :param model_class: The machine learning model class.
+
+        :return: name of the parameter, or None if the model has none or its signature can not be read.
+        :rtype: str
+        """
+        if model_class is None:
+            return None
+        try:
+            names = inspect.signature(model_class).parameters
+        except (TypeError, ValueError):
+            return None
+        for name in CpuBudget.thread_parameters:
+            if name in names:
+                return name
+        return None
+
+    def candidates(self):
+        """
+        Lists every split that uses at most the budget. Model threads take all cores left by workers and folds.
+
+        :return: A list of (workers, folds, threads) tuples.
+        :rtype: list
+        """
+        max_workers = 1 if self.backend == "serial" else min(self.n_cpus, self.pop_size)
+        splits = []
+        for workers in range(1, max_workers + 1):
+            for folds in range(1, min(self.k, self.n_cpus // workers) + 1):
+                splits.append((workers, folds, self.n_cpus // (workers * folds)))
+        return splits
+
+    def initial_split(self):
+        """
+        Split used before anything is measured. Cores go to workers first, then to folds, and what is left to model threads.
+
+        :return: A tuple of workers, folds and threads.
+        :rtype: tuple
+        """
+        workers = 1 if self.backend == "serial" else max(min(self.n_cpus, self.pop_size), 1)
+        folds = max(min(self.k, self.n_cpus // workers), 1)
+        return workers, folds, max(self.n_cpus // (workers * folds), 1)
+
+    def speedup(self, threads):
+        """
+        Estimated speedup of a fit on a number of threads, by Amdahl's law.
+
+        :param threads: number of threads of the model.
+        :type threads: int
+
+        :return: speedup over a single thread.
+        :rtype: float
+        """
+        return 1.0 / (1.0 - self.parallel_fraction + self.parallel_fraction / threads)
+
+    def generation_time(self, split):
+        """
+        Estimates the wall time of evaluating the recorded evaluations with a split. Fold times are scaled from the split they were measured with to a single thread, folds of an evaluation are fitted in batches that take as long as their slowest fold, and evaluations are scheduled longest first on the least busy worker.
+
+        :param split: A tuple of workers, folds and threads.
+        :type split: tuple
+
+        :return: estimated seconds.
+        :rtype: float
+        """
+        workers, folds, threads = split
+        measured_threads = self.measured_split[2]
+        scale = self.speedup(measured_threads) / self.speedup(threads)
+        times = []
+        for record in self.records:
+            fold_times = record["fold_times"]
+            times.append(sum(max(fold_times[i:i + folds]) for i in range(0, len(fold_times), folds)) * scale)
+        loads = [0.0] * workers
+        for t in sorted(times, reverse=True):
+            heapq.heapreplace(loads, loads[0] + t)
+        return max(loads)
+
+    def allocate(self):
+        """
+        Picks the split from evaluations recorded since the budget was created, and stops recording. If nothing was recorded, the current split is kept.
+
+        :return: A tuple of workers, folds and threads.
+        :rtype: tuple
+        """
+        if self.allocated or not self.records:
+            return self.split
+        self.measured_split = self.split
+        times = {split: self.generation_time(split) for split in self.candidates()}
+        best = min(times.values())
+        self.split = max((split for split, t in times.items() if t <= best * (1 + self.tolerance)),
+                         key=lambda split: (split[0], split[1]))
+        self.allocated = True
+        self.records = []
+        return self.split
+
+    def on_eval_end(self, record):
+        # timed out and raced out evaluations do not tell how long a full evaluation takes
+        if self.allocated or record["cached"] or not record["complete"] or record["fidelity"] < 1.0:
+            return
+        self.records.append(record)
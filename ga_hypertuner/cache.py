@@ -0,0 +1,196 @@
+import hashlib
+import json
+import pickle
+import sqlite3
+from collections import OrderedDict
+import numpy as np
+
+
+class FitnessCache:
+    """
+    In-memory cache of individuals scores with least recently used eviction. Individuals are identified by a canonical hash of their hyperparameters and a context, so scores are only reused for the same model, cross validation configuration and dataset.
+
+    :param max_size: Maximum number of scores that are kept in memory. When cache is full, least recently used score is removed.
+    :type max_size: int
+
+    :param decimals: If given, float hyperparameters are rounded to this number of decimals before hashing, so individuals closer than this tolerance share a score. Default is None.
+    :type decimals: int
+
+    :param context: A string identifying the model, cross validation configuration and dataset. See :meth:`FitnessCache.context_of`.
+    :type context: str
+
+    :ivar hits: number of lookups that found a score since the last reset.
+    :ivar misses: number of lookups that did not find a score since the last reset.
+    """
+
+    def __init__(self, max_size: int = 1024, decimals: int = None, context: str = ""):
+        self.max_size = max_size
+        self.decimals = decimals
+        self.context = context
+        self.scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(data):
+        """
+        Calculates a fingerprint of a dataset, that changes whenever values, shape or type of the dataset change.
+
+        :param data: Training features or target.
+        :type data: Dataframe
+
+        :return: hex digest of the dataset.
+        :rtype: str
+        """
+        array = np.asarray(data)
+        h = hashlib.sha256(str((array.shape, array.dtype.str)).encode())
+        if array.dtype == object:
+            h.update(pickle.dumps(array))
+        else:
+            h.update(np.ascontiguousarray(array).tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def context_of(scorer):
+        """
+        Builds the cache context of a scorer from its model class, cross validation configuration and dataset fingerprint.
+
+        :param scorer: scorer that calculates the cached scores.
+        :type scorer: Scorer
+
+        :return: context string.
+        :rtype: str
+        """
+        model = getattr(scorer.model_class, "__module__", "") + "." + getattr(scorer.model_class, "__qualname__",
+                                                                             repr(scorer.model_class))
+        cv = [scorer.s if isinstance(scorer.s, str) else repr(scorer.s), scorer.k, scorer.stratified,
+              scorer.random_state]
+        return json.dumps([model, cv, FitnessCache.fingerprint(scorer.x_t), FitnessCache.fingerprint(scorer.y_t)])
+
+    def key(self, params):
+        """
+        Calculates the canonical hash of an individual.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :return: hex digest identifying the individual in this context.
+        :rtype: str
+        """
+        canonical = {}
+        for p, x in params.items():
+            if isinstance(x, (float, np.floating)):
+                x = float(x)
+                if self.decimals is not None:
+                    x = round(x, self.decimals)
+            elif isinstance(x, np.integer):
+                x = int(x)
+            canonical[p] = x
+        text = json.dumps(canonical, sort_keys=True, default=repr)
+        return hashlib.sha256((self.context + text).encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Looks up the score of an individual and counts the lookup as a hit or a miss.
+
+        :param key: hash of the individual.
+        :type key: str
+
+        :return: score of the individual, or None if it is not cached.
+        """
+        if key in self.scores:
+            self.scores.move_to_end(key)
+            self.hits += 1
+            return self.scores[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, score):
+        """
+        Stores the score of an individual, evicting the least recently used score when cache is full.
+
+        :param key: hash of the individual.
+        :type key: str
+
+        :param score: score of the individual.
+        :type score: float
+
+        :return: None
+        """
+        self.scores[key] = score
+        self.scores.move_to_end(key)
+        while len(self.scores) > self.max_size:
+            self.scores.popitem(last=False)
+
+    def flush(self):
+        """
+        Writes pending scores to persistent storage. In-memory cache has no storage, so nothing is done.
+
+        :return: None
+        """
+
+    def reset_counters(self):
+        """
+        Resets hit and miss counters and returns their values.
+
+        :return: a tuple of hits and misses since the last reset.
+        :rtype: tuple
+        """
+        counters = (self.hits, self.misses)
+        self.hits = 0
+        self.misses = 0
+        return counters
+
+    def close(self):
+        """
+        Releases resources used by the cache.
+
+        :return: None
+        """
+        self.flush()
+
+
+class SqliteFitnessCache(FitnessCache):
+    """
+    Fitness cache that persists scores in a SQLite database, so repeated runs on the same data skip individuals that are already scored. Recently used scores are also kept in memory, like :class:`FitnessCache`. A nan score, of an individual whose fits failed, is stored as NULL and read back as nan.
+
+    Several processes can share a database, like islands of an :class:`Archipelago` or concurrent runs. The database is in write-ahead log mode, so readers do not block the writer, and a writer waits for the lock of another one instead of failing.
+
+    :param path: Path of the SQLite database file. It is created if it does not exist.
+    :type path: str
+
+    :param timeout: Number of seconds a write waits for another process holding the lock of the database. Default is 30.
+    :type timeout: int or float
+    """
+
+    def __init__(self, path: str, max_size: int = 1024, decimals: int = None, context: str = "", timeout=30.0):
+        super().__init__(max_size=max_size, decimals=decimals, context=context)
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS fitness (key TEXT PRIMARY KEY, score REAL)")
+        self.connection.commit()
+
+    def get(self, key):
+        if key in self.scores:
+            return super().get(key)
+        row = self.connection.execute("SELECT score FROM fitness WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # SQLite stores nan, the score of failed fits, as NULL
+        score = np.nan if row[0] is None else row[0]
+        super().put(key, score)
+        return score
+
+    def put(self, key, score):
+        super().put(key, score)
+        self.connection.execute("INSERT OR REPLACE INTO fitness (key, score) VALUES (?, ?)", (key, float(score)))
+
+    def flush(self):
+        self.connection.commit()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
@@ -0,0 +1,44 @@
+class Callback:
+    """
+    Base class of callbacks that are notified about evaluations and generations of the algorithm, so profilers and metric exporters can be attached without changing the algorithm. Subclasses override the methods they need. All methods are called in the process running the algorithm, whatever backend evaluates individuals. An error raised by a callback does not stop the algorithm or other callbacks, the first one is raised once the run ended. With islands, events of each island process are sent back to the process that started the islands and callbacks are notified there, with the index of the island as "island" in records and aggregates. see :class:`Archipelago`.
+    """
+
+    def on_eval_start(self, params):
+        """
+        Called when evaluation of an individual is dispatched, or looked up in cache.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :return: None
+        """
+
+    def on_eval_end(self, record):
+        """
+        Called when evaluation of an individual is done.
+
+        :param record: record of the evaluation, a dictionary containing "params", "score", "folds", "fold_scores", "fit_time", "score_time", "fold_times", "model_size", "start", "end", "worker", "fidelity", "timed_out", "submitted", "queue_wait", "cached" and "complete". Times are in seconds, "start", "end" and "submitted" are unix timestamps. "model_size" is the mean size of fitted models in bytes, or nan if it is not measured.
+        :type record: dict
+
+        :return: None
+        """
+
+    def on_generation_end(self, generation, stats):
+        """
+        Called at the end of each generation, after reporting.
+
+        :param generation: number of the generation.
+        :type generation: int
+
+        :param stats: aggregates of the generation. see :meth:`GA.generation_summary` and :meth:`GA.score_summary`.
+        :type stats: dict
+
+        :return: None
+        """
+
+    def on_run_end(self):
+        """
+        Called once when the algorithm stops, or fails, so callbacks can flush and release what they hold.
+
+        :return: None
+        """
@@ -0,0 +1,56 @@
+import os
+import pickle
+import tempfile
+
+
+class Checkpoint:
+    """
+    A class containing methods for saving and loading the state of an optimization, so a long run can be resumed after the process dies.
+
+    :ivar version: version of the checkpoint format.
+    """
+    version = 1
+
+    @staticmethod
+    def save(state, path):
+        """
+        Writes a state to path atomically. The state is first written to a temporary file in the same directory, then moved over the path, so an interrupted write never leaves a broken checkpoint behind.
+
+        :param state: state of the optimization. see :meth:`GA.checkpoint_state`.
+        :type state: dict
+
+        :param path: Path of the checkpoint file.
+        :type path: str
+
+        :return: None
+        """
+        state = dict(state, version=Checkpoint.version)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def load(path):
+        """
+        Reads a state written by :meth:`Checkpoint.save`.
+
+        :param path: Path of the checkpoint file.
+        :type path: str
+
+        :return: state of the optimization.
+        :rtype: dict
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != Checkpoint.version:
+            raise ValueError("Unsupported checkpoint version: " + str(state.get("version")))
+        return state
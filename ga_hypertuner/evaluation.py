@@ -0,0 +1,799 @@
+import copy
+import itertools
+import os
+import pickle
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED
+import numpy as np
+from ga_hypertuner.folds import Folds
+from ga_hypertuner.shared import SharedDataset
+from ga_hypertuner.broker import Broker
+from ga_hypertuner.sandbox import Sandbox
+
+# scorer of the current worker process, set once by the process pool initializer
+_worker_scorer = None
+
+
+def _init_worker(scorer, shared=None):
+    """
+    Initializer of process pool workers. Stores the scorer in the worker, so training data is sent once per worker instead of once per task, and limits threads of the worker to the model threads of the scorer. If training data is shared, the worker maps it read-only instead of receiving a copy.
+
+    :param scorer: scorer that worker uses for evaluating individuals.
+    :type scorer: Scorer
+
+    :param shared: shared training data. Default is None.
+    :type shared: SharedDataset
+
+    :return: None
+    """
+    global _worker_scorer
+    scorer.limit_threads()
+    if shared is not None:
+        x_train, y_train = shared.attach()
+        scorer.set_data(x_train, y_train, materialize=False)
+        # sandboxes of the worker map the same data
+        scorer.shared = shared
+    _worker_scorer = scorer
+
+
+def _worker_race(params, threshold, epoch, fidelity=1.0):
+    """
+    Races an individual against a threshold inside a process pool worker.
+
+    :param params: attributes of individual. (hyperparameters)
+    :type params: dict
+
+    :param threshold: score the individual has to beat.
+    :type threshold: float
+
+    :param epoch: epoch of cross validation folds the driver is using.
+    :type epoch: int
+
+    :param fidelity: fraction of training data the individual is cross validated on. Default is 1.0.
+    :type fidelity: float
+
+    :return: record of the evaluation. see :meth:`Scorer.race`.
+    :rtype: dict
+    """
+    _worker_scorer.folds.set_epoch(epoch)
+    return _worker_scorer.race(params, threshold, fidelity)
+
+
+class Scorer:
+    """
+    Calculates score of individuals. Holds everything that is needed to cross validate a model, so it can be sent to worker processes. All evaluations use the same cross validation folds, see :class:`Folds`.
+
+    :param model_class: Model class that its hyperparameters are being optimized. Any model class that scikit cross-validate module can accept.
+
+    :param x_train: Training features for the given model.
+    :type x_train: Dataframe
+
+    :param y_train: Training target for the given model.
+    :type y_train: Dataframe
+
+    :param scoring: The scoring criteria that the algorithm tries to optimize. Accepted values are scores that scikit cross validation accepts.
+    :type scoring: str
+
+    :param k: Number of splits for k-fold cross validation.
+    :type k: int
+
+    :param stratified: Whether to use stratified cross validation or not.
+    :type stratified: bool
+
+    :param random_state: Seed used for shuffling the cross validation folds. If None, folds are shuffled differently for each run.
+    :type random_state: int
+
+    :param direction: Whether the score is maximized or minimized. Accepted values are ["max","min"]. Used for racing.
+    :type direction: str
+
+    :param racing_bound: Margin used for racing. An individual stops being cross validated once its running mean score, moved by this margin in its favor, is still worse than the score it has to beat.
+    :type racing_bound: float
+
+    :param timeout: If given, number of seconds an evaluation may take. Evaluations then run in a :class:`Sandbox` process, which is killed when an evaluation takes longer, and the individual gets the penalty score. Default is None.
+    :type timeout: int or float
+
+    :param penalty: Score of individuals whose evaluation timed out. If None, the worst possible score, -inf when maximizing and inf when minimizing. Default is None.
+    :type penalty: float
+
+    :ivar fold_jobs: number of folds of an evaluation fitted at the same time, on threads. Default is 1.
+    :ivar model_threads: If not None, number of BLAS and OpenMP threads of each fit, also given to the model as its thread_parameter. see :class:`CpuBudget`.
+    :ivar thread_parameter: name of the parameter that sets the number of threads of the model, or None.
+    :ivar measure_size: whether the size of each fitted model, in bytes of its pickle, is measured. Default is False.
+    :ivar shared: If not None, shared training data the scorer uses, which its sandboxes map instead of receiving a copy. see :class:`SharedDataset`. Default is None.
+    """
+
+    def __init__(self, model_class, x_train, y_train, scoring, k: int = 5, stratified: bool = False,
+                 random_state: int = None, direction: str = "max", racing_bound: float = 0.0, timeout=None,
+                 penalty: float = None):
+        self.model_class = model_class
+        self.x_t = x_train
+        self.y_t = y_train
+        self.s = scoring
+        self.k = k
+        self.stratified = stratified
+        self.random_state = random_state
+        self.direction = direction
+        self.racing_bound = racing_bound
+        self.folds = Folds(x_train, y_train, k=k, stratified=stratified, random_state=random_state)
+        # folds of subsamples used by low fidelity evaluations, by fraction of training data
+        self.fidelity_folds = {}
+        self.timeout = timeout
+        if penalty is None:
+            penalty = -np.inf if direction == "max" else np.inf
+        self.penalty = penalty
+        # sandbox of each thread evaluating with a timeout
+        self.sandboxes = threading.local()
+        self.sandbox_list = []
+        self.fold_jobs = 1
+        self.model_threads = None
+        self.thread_parameter = None
+        self.measure_size = False
+        self.shared = None
+
+    def __getstate__(self):
+        # sandboxes belong to the process that started them
+        state = self.__dict__.copy()
+        del state["sandboxes"]
+        state["sandbox_list"] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.sandboxes = threading.local()
+
+    def set_data(self, x_train, y_train, materialize: bool = True):
+        """
+        Replaces training data of the scorer and its folds.
+
+        :param x_train: Training features.
+        :type x_train: Dataframe
+
+        :param y_train: Training target.
+        :type y_train: Dataframe
+
+        :param materialize: Whether sliced folds are kept between evaluations. see :class:`Folds`.
+        :type materialize: bool
+
+        :return: None
+        """
+        self.x_t = x_train
+        self.y_t = y_train
+        self.folds.set_data(x_train, y_train, materialize=materialize)
+        self.fidelity_folds = {}
+
+    def without_data(self):
+        """
+        Returns a copy of the scorer without training data, to be sent to workers that receive data separately.
+
+        :return: A scorer with no training data.
+        :rtype: Scorer
+        """
+        scorer = copy.copy(self)
+        scorer.folds = copy.copy(self.folds)
+        scorer.set_data(None, None)
+        return scorer
+
+    def folds_for(self, fidelity):
+        """
+        Returns cross validation folds of a fraction of training data. A fraction is a seeded subsample of training data, stratified if folds are stratified, so every worker uses the same subsample. Its folds follow the epoch of the full data folds.
+
+        :param fidelity: fraction of training data.
+        :type fidelity: float
+
+        :return: folds of the subsample.
+        :rtype: Folds
+        """
+        if fidelity >= 1.0:
+            return self.folds
+        folds = self.fidelity_folds.get(fidelity)
+        if folds is None:
+            n = len(self.y_t)
+            size = min(max(int(round(fidelity * n)), 2 * self.k), n)
+            if size >= n:
+                return self.folds
+            from sklearn.model_selection import train_test_split
+            from sklearn.utils import _safe_indexing
+
+            indices, _ = train_test_split(np.arange(n), train_size=size, random_state=self.folds.seed % (2 ** 32),
+                                          stratify=self.y_t if self.stratified else None)
+            indices = np.sort(indices)
+            folds = Folds(_safe_indexing(self.x_t, indices), _safe_indexing(self.y_t, indices), k=self.k,
+                          stratified=self.stratified, random_state=self.folds.seed,
+                          materialize=self.folds.materialize)
+            folds = self.fidelity_folds.setdefault(fidelity, folds)
+        folds.set_epoch(self.folds.epoch)
+        return folds
+
+    def __call__(self, params):
+        """
+        calculates score of an individual. the score of an individual is its models mean score of cross validation.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :return: score of an individual
+        """
+        return self.race(params, None)["score"]
+
+    def race(self, params, threshold, fidelity=1.0):
+        """
+        Evaluates an individual, in a sandbox if evaluations have a timeout. see :meth:`Scorer.cross_validate`.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :param threshold: score the individual has to beat. If None, all folds are evaluated.
+        :type threshold: float
+
+        :param fidelity: fraction of training data the individual is cross validated on. Default is 1.0.
+        :type fidelity: float
+
+        :return: A record of the evaluation. If the evaluation timed out, or its sandbox process died, its score is the penalty, no fold is counted as evaluated and "timed_out" is True.
+        :rtype: dict
+        """
+        if self.timeout is None:
+            return self.cross_validate(params, threshold, fidelity)
+        sandbox = getattr(self.sandboxes, "sandbox", None)
+        if sandbox is None:
+            scorer = copy.copy(self) if self.shared is None else self.without_data()
+            scorer.timeout = None
+            sandbox = Sandbox(scorer, self.shared)
+            self.sandboxes.sandbox = sandbox
+            self.sandbox_list.append(sandbox)
+        start = time.time()
+        record = sandbox.run(params, threshold, fidelity, self.folds.epoch, self.timeout)
+        if record is None:
+            end = time.time()
+            record = {"params": params, "score": self.penalty, "folds": 0, "fold_scores": [],
+                      "fit_time": end - start, "score_time": 0.0, "fold_times": [], "model_size": np.nan,
+                      "start": start, "end": end,
+                      "worker": str(os.getpid()) + ":" + threading.current_thread().name, "fidelity": fidelity,
+                      "timed_out": True}
+        return record
+
+    def close(self):
+        """
+        Kills sandboxes started by this scorer.
+
+        :return: None
+        """
+        for sandbox in self.sandbox_list:
+            sandbox.close()
+        self.sandbox_list = []
+        self.sandboxes = threading.local()
+
+    def limit_threads(self):
+        """
+        Limits BLAS threads of the current process, and OpenMP threads of the calling thread, to model_threads, if it is set. OpenMP limits are per thread, so every thread that fits models calls it.
+
+        :return: the limiter, whose restore_original_limits method removes the limit, or None.
+        """
+        if self.model_threads is None:
+            return None
+        from threadpoolctl import threadpool_limits
+
+        return threadpool_limits(limits=self.model_threads)
+
+    def model_parameters(self, params):
+        """
+        Adds the number of model threads to attributes of an individual, unless the individual already sets it.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :return: parameters the model is created with.
+        :rtype: dict
+        """
+        if self.model_threads is None or self.thread_parameter is None or self.thread_parameter in params:
+            return params
+        return dict(params, **{self.thread_parameter: self.model_threads})
+
+    def fit_fold(self, model, scorer, fold, params):
+        """
+        Fits a model on a fold and scores it.
+
+        :param model: unfitted model, cloned before fitting.
+        :param scorer: scorer of the scoring criteria.
+        :param fold: A tuple of training features, training target, test features and test target.
+        :type fold: tuple
+
+        :param params: attributes of individual, reported if fitting fails.
+        :type params: dict
+
+        :return: A tuple of score, fit seconds, score seconds and size of the fitted model in bytes, nan unless measure_size is set or if fitting failed.
+        :rtype: tuple
+        """
+        from sklearn.base import clone
+        from sklearn.exceptions import FitFailedWarning
+
+        x_train, y_train, x_test, y_test = fold
+        fold_start = time.perf_counter()
+        fit_end = fold_start
+        size = np.nan
+        try:
+            fitted = clone(model).fit(x_train, y_train)
+            fit_end = time.perf_counter()
+            score = scorer(fitted, x_test, y_test)
+        except Exception as e:
+            # like cross_validate, a failed fit gets a nan score instead of stopping the optimization
+            warnings.warn("Fitting failed for " + str(params) + ": " + repr(e), FitFailedWarning)
+            score = np.nan
+            fitted = None
+        score_end = time.perf_counter()
+        # measured after scoring, so pickling is not counted in score seconds
+        if self.measure_size and fitted is not None:
+            size = float(len(pickle.dumps(fitted)))
+        return score, fit_end - fold_start, score_end - fit_end, size
+
+    def cross_validate(self, params, threshold, fidelity=1.0):
+        """
+        Cross validates an individual one fold at a time, or fold_jobs folds at a time on threads. If a threshold is given, stops as soon as its running mean score can not beat the threshold, so an individual that loses the race costs only a fraction of k fits.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :param threshold: score the individual has to beat, usually score of its parent. If None, all folds are evaluated.
+        :type threshold: float
+
+        :param fidelity: fraction of training data the individual is cross validated on. see :meth:`Scorer.folds_for`. Default is 1.0.
+        :type fidelity: float
+
+        :return: A record of the evaluation, a dictionary containing mean score of evaluated folds as "score", number of evaluated folds as "folds", and "fold_scores", "fit_time", "score_time", "fold_times", "model_size" (mean bytes of fitted models, nan unless measure_size is set), "start", "end", "worker" (process id and thread name), "fidelity" and "timed_out".
+        :rtype: dict
+        """
+        from sklearn.metrics import check_scoring
+
+        start = time.time()
+        model = self.model_class(**self.model_parameters(params))
+        scorer = check_scoring(model, scoring=self.s)
+        fold_scores = []
+        fold_times = []
+        sizes = []
+        fit_time = 0.0
+        score_time = 0.0
+        folds = iter(self.folds_for(fidelity).get())
+        pool = None
+        if self.fold_jobs > 1:
+            pool = ThreadPoolExecutor(max_workers=self.fold_jobs, initializer=self.limit_threads)
+        try:
+            # with fold jobs, folds are fitted in batches, and the race is checked after each batch
+            for batch in iter(lambda: list(itertools.islice(folds, self.fold_jobs)), []):
+                if pool is None:
+                    results = [self.fit_fold(model, scorer, batch[0], params)]
+                else:
+                    results = list(pool.map(lambda fold: self.fit_fold(model, scorer, fold, params), batch))
+                for score, fold_fit_time, fold_score_time, size in results:
+                    fold_scores.append(score)
+                    sizes.append(size)
+                    fit_time += fold_fit_time
+                    score_time += fold_score_time
+                    fold_times.append(fold_fit_time + fold_score_time)
+                if threshold is None:
+                    continue
+                mean = float(np.mean(fold_scores))
+                if self.direction == "max" and mean + self.racing_bound < threshold:
+                    break
+                if self.direction == "min" and mean - self.racing_bound > threshold:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return {"params": params, "score": float(np.mean(fold_scores)), "folds": len(fold_scores),
+                "fold_scores": [float(x) for x in fold_scores], "fit_time": fit_time, "score_time": score_time,
+                "fold_times": fold_times,
+                "model_size": float(np.nanmean(sizes)) if not np.isnan(sizes).all() else np.nan,
+                "start": start, "end": time.time(),
+                "worker": str(os.getpid()) + ":" + threading.current_thread().name, "fidelity": fidelity,
+                "timed_out": False}
+
+
+class Evaluator:
+    """
+    Scores a batch of individuals using one of the available backends.
+
+    :param scorer: scorer used for evaluating each individual.
+    :type scorer: Scorer
+
+    :param backend: Backend used for evaluating individuals. Accepted values are "serial", "thread", "process" and "distributed". Default is "serial".
+    :type backend: str
+
+    :param n_workers: Number of workers of thread or process backends. For distributed backend, number of workers started on the local host, in addition to workers started on other hosts. Ignored for serial backend. Default is 1.
+    :type n_workers: int
+
+    :param cache: Cache of scores. Individuals found in cache are not evaluated again. Default is None.
+    :type cache: FitnessCache
+
+    :param callbacks: A list of callbacks that are notified when evaluations start and end. A failing callback does not stop evaluations, its first error is kept as callback_error. Default is None.
+    :type callbacks: list
+
+    :param broker_address: "host:port" the broker of distributed backend listens on. see :class:`Broker`. Default is None.
+    :type broker_address: str
+
+    :param broker_authkey: Key workers of distributed backend authenticate with. Default is None.
+    :type broker_authkey: str
+
+    :ivar backends: accepted values for backend.
+    :ivar raced: number of individuals that lost their race before all folds were evaluated, since the last reset.
+    :ivar timeouts: number of evaluations that timed out, since the last reset.
+    :ivar callback_error: first error raised by a callback, or None.
+    """
+    backends = ["serial", "thread", "process", "distributed"]
+
+    def __init__(self, scorer, backend: str = "serial", n_workers: int = 1, cache=None, callbacks=None,
+                 broker_address: str = None, broker_authkey: str = None):
+        self.scorer = scorer
+        self.backend = backend
+        self.n_workers = n_workers
+        self.cache = cache
+        self.executor = None
+        self.shared = None
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        self.broker_address = broker_address
+        self.broker_authkey = broker_authkey
+        self.raced = 0
+        self.timeouts = 0
+        self.records = []
+        self.callback_error = None
+        # limit of BLAS and OpenMP threads of this process, for evaluations run in it
+        self.limiter = None
+        # cache key and submission time of running evaluations
+        self.pending = {}
+
+    def _get_executor(self):
+        """
+        Creates the pool of workers on first use and returns it.
+
+        :return: executor of thread or process backend.
+        """
+        if self.executor is None:
+            if self.backend == "thread":
+                self.executor = ThreadPoolExecutor(max_workers=self.n_workers, initializer=self.scorer.limit_threads)
+            elif self.backend == "process":
+                # share training data with workers through memory-mapped files when possible,
+                # otherwise each worker receives its own copy
+                initargs = (self.scorer,)
+                if SharedDataset.supports(self.scorer.x_t, self.scorer.y_t):
+                    self.shared = SharedDataset(self.scorer.x_t, self.scorer.y_t)
+                    initargs = (self.scorer.without_data(), self.shared)
+                self.executor = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                                    initargs=initargs)
+            elif self.backend == "distributed":
+                self.executor = Broker(self.scorer, address=self.broker_address or "127.0.0.1:0",
+                                       authkey=self.broker_authkey, n_workers=self.n_workers)
+        return self.executor
+
+    def _inline(self):
+        """
+        Checks whether individuals are evaluated in the calling thread.
+
+        :return: A bool determining whether evaluations run inline.
+        """
+        return self.backend == "serial" or (self.n_workers == 1 and self.backend != "distributed")
+
+    def capacity(self):
+        """
+        Returns number of evaluations that can run at the same time.
+
+        :return: number of workers, at least 1.
+        :rtype: int
+        """
+        if self.backend == "distributed":
+            return max(self.n_workers, self._get_executor().workers(), 1)
+        return max(self.n_workers, 1)
+
+    def evaluate(self, params_list, callback=None, thresholds=None, fidelity=1.0, records=False):
+        """
+        Scores a batch of individuals. Order of returned scores is same as order of given individuals, regardless of the backend. Individuals found in cache, or repeated in the batch, are evaluated only once, and a repeated individual is raced against the loosest threshold of its repeats.
+
+        :param params_list: A list of individuals attributes (hyperparameters).
+        :type params_list: list
+
+        :param callback: Function that is called with number of done evaluations and total number of evaluations, each time an evaluation is done.
+
+        :param thresholds: If given, a list of scores each individual has to beat. Individuals are then raced fold by fold against their threshold. see :meth:`Scorer.race`. Default is None.
+        :type thresholds: list
+
+        :param fidelity: fraction of training data individuals are cross validated on. Scores of fractions are not cached. Default is 1.0.
+        :type fidelity: float
+
+        :param records: Whether records of evaluations are returned instead of scores. Individuals evaluated only once share their record. see :meth:`Callback.on_eval_end`. Default is False.
+        :type records: bool
+
+        :return: A list of scores, or of records.
+        :rtype: list
+        """
+        total = len(params_list)
+        results = [None] * total
+        cache = self.cache if fidelity >= 1.0 else None
+        # indices of individuals of each distinct evaluation
+        pending = {}
+        for i, params in enumerate(params_list):
+            key = cache.key(params) if cache is not None else i
+            if key in pending:
+                pending[key].append(i)
+                continue
+            record = self._lookup(key, params) if cache is not None else None
+            if record is None:
+                pending[key] = [i]
+            else:
+                results[i] = record
+
+        keys = list(pending.keys())
+        cached = total - sum(len(indices) for indices in pending.values())
+        if cached and callback is not None:
+            callback(cached, total)
+
+        tasks = [(params_list[pending[key][0]], self._loosest(thresholds, pending[key]),
+                  key if cache is not None else None, fidelity) for key in keys]
+        if self._inline():
+            for done, (key, task) in enumerate(zip(keys, tasks)):
+                record = self._finish(self._start(*task))
+                for i in pending[key]:
+                    results[i] = record
+                if callback is not None:
+                    callback(cached + done + 1, total)
+        else:
+            futures = {self._start(*task): key for key, task in zip(keys, tasks)}
+            for done, future in enumerate(as_completed(futures)):
+                record = self._finish(future)
+                for i in pending[futures[future]]:
+                    results[i] = record
+                if callback is not None:
+                    callback(cached + done + 1, total)
+        if self.cache is not None:
+            self.cache.flush()
+        return results if records else [record["score"] for record in results]
+
+    def _loosest(self, thresholds, indices):
+        """
+        Returns the threshold an individual repeated in a batch is raced against, the loosest of its repeats, so its record is valid for each of them. An individual that loses the race against the loosest threshold would lose it against the others too.
+
+        :param thresholds: scores individuals of the batch have to beat, or None.
+        :type thresholds: list
+
+        :param indices: indices of repeats of the individual in the batch.
+        :type indices: list
+
+        :return: the loosest threshold, or None if the individual is not raced.
+        :rtype: float
+        """
+        if thresholds is None:
+            return None
+        values = [thresholds[i] for i in indices]
+        # a repeat without threshold, or with a nan one, is never raced out
+        if any(value is None or np.isnan(value) for value in values):
+            return None
+        return min(values) if self.scorer.direction == "max" else max(values)
+
+    def _lookup(self, key, params):
+        """
+        Looks up an individual in cache. A found individual is reported to callbacks as a cached evaluation.
+
+        :param key: hash of the individual.
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :return: record of the cached evaluation, or None if individual is not cached.
+        :rtype: dict
+        """
+        if self.cache is None:
+            return None
+        score = self.cache.get(key)
+        if score is None:
+            return None
+        now = time.time()
+        record = {"params": params, "score": score, "folds": self.scorer.k, "fold_scores": [], "fit_time": 0.0,
+                  "score_time": 0.0, "fold_times": [], "model_size": np.nan, "start": now, "end": now, "worker": None,
+                  "fidelity": 1.0, "timed_out": False, "submitted": now, "queue_wait": 0.0, "cached": True,
+                  "complete": True}
+        self.notify("on_eval_start", params)
+        self._record(record)
+        return record
+
+    def _start(self, params, threshold=None, key=None, fidelity=1.0):
+        """
+        Starts evaluation of an individual on the backend. Serial backend evaluates the individual before returning.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :param threshold: If given, score the individual is raced against. Default is None.
+        :type threshold: float
+
+        :param key: cache key the score is stored under when evaluation is done. Default is None.
+        :type key: str
+
+        :param fidelity: fraction of training data the individual is cross validated on. Default is 1.0.
+        :type fidelity: float
+
+        :return: A future of the evaluation record.
+        :rtype: Future
+        """
+        self.notify("on_eval_start", params)
+        submitted = time.time()
+        if self._inline():
+            future = Future()
+            try:
+                future.set_result(self.scorer.race(params, threshold, fidelity))
+            except Exception as e:
+                future.set_exception(e)
+        elif self.backend == "process":
+            # workers switch to the folds the driver is using before evaluating
+            future = self._get_executor().submit(_worker_race, params, threshold, self.scorer.folds.epoch,
+                                                 fidelity)
+        elif self.backend == "distributed":
+            future = self._get_executor().submit(params, threshold, self.scorer.folds.epoch, fidelity)
+        else:
+            future = self._get_executor().submit(self.scorer.race, params, threshold, fidelity)
+        self.pending[future] = (key, submitted)
+        return future
+
+    def _finish(self, future):
+        """
+        Collects the record of a done evaluation, stores its score in cache and reports it to callbacks.
+
+        :param future: A future returned by :meth:`Evaluator._start`.
+        :type future: Future
+
+        :return: record of the evaluation.
+        :rtype: dict
+        """
+        key, submitted = self.pending.pop(future)
+        record = future.result()
+        record["submitted"] = submitted
+        record["queue_wait"] = max(record["start"] - submitted, 0.0)
+        record["cached"] = False
+        record["complete"] = record["folds"] == self.scorer.k
+        if record["timed_out"]:
+            self.timeouts += 1
+        elif not record["complete"]:
+            self.raced += 1
+        elif key is not None:
+            # a raced out score is a partial mean, so it is not a valid score for other individuals
+            self.cache.put(key, record["score"])
+        self._record(record)
+        return record
+
+    def _record(self, record):
+        """
+        Keeps a record until it is collected by :meth:`Evaluator.drain_records`, and reports it to callbacks.
+
+        :param record: record of an evaluation.
+        :type record: dict
+
+        :return: None
+        """
+        self.records.append(record)
+        self.notify("on_eval_end", record)
+
+    def notify(self, name, *args):
+        """
+        Calls a method of every callback. A failing callback does not stop evaluations or the other callbacks, its error is kept as callback_error, so the algorithm raises it once it stopped.
+
+        :param name: name of the method, like "on_eval_end".
+        :type name: str
+
+        :param args: arguments of the method.
+
+        :return: None
+        """
+        for callback in self.callbacks:
+            try:
+                getattr(callback, name)(*args)
+            except Exception as e:
+                self.callback_error = self.callback_error or e
+
+    def drain_records(self):
+        """
+        Returns records of evaluations done since the last call, and forgets them.
+
+        :return: A list of evaluation records.
+        :rtype: list
+        """
+        records = self.records
+        self.records = []
+        return records
+
+    def submit(self, params, threshold=None):
+        """
+        Starts evaluation of a single individual without waiting for it. Results are collected with :meth:`Evaluator.wait`. Serial backend evaluates the individual before returning.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :param threshold: If given, score the individual is raced against. Default is None.
+        :type threshold: float
+
+        :return: A future of the evaluation.
+        :rtype: Future
+        """
+        key = self.cache.key(params) if self.cache is not None else None
+        record = self._lookup(key, params)
+        if record is not None:
+            future = Future()
+            future.set_result(record)
+            return future
+        return self._start(params, threshold, key)
+
+    def wait(self, futures):
+        """
+        Waits until at least one of the submitted evaluations is done, and stores the scores of done evaluations in cache.
+
+        :param futures: futures returned by :meth:`Evaluator.submit`.
+
+        :return: A dictionary of done futures and their scores.
+        :rtype: dict
+        """
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        scores = {}
+        for future in done:
+            # futures of cached individuals are done when submitted, and have nothing to collect
+            record = self._finish(future) if future in self.pending else future.result()
+            scores[future] = record["score"]
+        if self.cache is not None:
+            self.cache.flush()
+        return scores
+
+    def reset_counters(self):
+        """
+        Resets the raced out and timed out counters and returns their values.
+
+        :return: A tuple of number of individuals that lost their race and number of evaluations that timed out since the last reset.
+        :rtype: tuple
+        """
+        raced, timeouts = self.raced, self.timeouts
+        self.raced = 0
+        self.timeouts = 0
+        return raced, timeouts
+
+    def configure(self, n_workers, fold_jobs, model_threads):
+        """
+        Changes the number of workers, folds fitted at the same time and threads of each model. Workers and sandboxes are started again on next use, so they pick up the new limits. Should not be called while evaluations are running.
+
+        :param n_workers: Number of workers.
+        :type n_workers: int
+
+        :param fold_jobs: Number of folds of an evaluation fitted at the same time.
+        :type fold_jobs: int
+
+        :param model_threads: Number of threads of each model.
+        :type model_threads: int
+
+        :return: None
+        """
+        self._shutdown()
+        self.n_workers = n_workers
+        self.scorer.fold_jobs = fold_jobs
+        self.scorer.model_threads = model_threads
+        # threads and inline evaluations run in this process
+        if self.backend == "thread" or self._inline():
+            self.limiter = self.scorer.limit_threads()
+
+    def _shutdown(self):
+        """
+        Shuts down the pool of workers, if one was created, kills sandboxes, removes shared training data and removes the thread limit of this process.
+
+        :return: None
+        """
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        self.scorer.close()
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+        if self.limiter is not None:
+            self.limiter.restore_original_limits()
+            self.limiter = None
+
+    def close(self):
+        """
+        Shuts down the pool of workers, if one was created, kills sandboxes, removes shared training data and closes the cache.
+
+        :return: None
+        """
+        self._shutdown()
+        if self.cache is not None:
+            self.cache.close()
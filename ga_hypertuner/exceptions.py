@@ -31,7 +31,11 @@ class MParamsException(Exception):
     KEYS_NOT_EQUAL = "Parameters with no static value should have a specified boundary"
     BOUNDARY_VALUE = " : Boundaries should have two values, a start and an end"
     BOUNDARY_INVALID = " : Boundaries values are invalid"
-    PARAMETER_WRONG_FORMAT = " : Wrong format, format of parameter should be either [None,Type] or a static value"
+    PARAMETER_WRONG_FORMAT = " : Wrong format, format of parameter should be either [None,Type], [None,Type,Scale], " \
+                             "[None,Type,Scale,Step], [None,\"categorical\"] or a static value"
+    BOUNDARY_CHOICES = " : Choices of a categorical parameter should be a list of at least two different values"
+    BOUNDARY_LOG = " : Boundaries of a log-scale parameter should be greater than 0"
+    STEP_INVALID = " : Step of a quantized parameter should be a number greater than 0"
 
     """
     Exception raised for invalid Model parameters.
@@ -53,7 +57,9 @@ class MParamsException(Exception):
 
 class GaHypertunerParamException(Exception):
     PARAMETER_WRONG_TYPE = " : Wrong type, should be "
+    PARAMETER_INVALID_VALUE = " : Invalid value, accepted values are "
     VERBOSITY_WARNING = "Invalid verbosity level provided. Using default value of 1."
+    CHECKPOINT_DATA_WARNING = "Training data differs from the data of the checkpoint. Resumed run will not match the interrupted run."
 
     """
     Exception raised for invalid tuner parameters.
@@ -0,0 +1,143 @@
+import threading
+import numpy as np
+
+
+class Folds:
+    """
+    Cross validation folds shared by all evaluations of a run, so parents and children are compared on identical splits. Train and test sets of each fold are sliced once and kept as contiguous arrays, so evaluations do not pay for slicing the dataset.
+
+    Folds are numbered by an epoch. Splits of an epoch only depend on the seed and the epoch, so every process that holds a copy of the folds computes the same splits.
+
+    :param x_train: Training features.
+    :type x_train: Dataframe
+
+    :param y_train: Training target.
+    :type y_train: Dataframe
+
+    :param k: Number of splits for k-fold cross validation.
+    :type k: int
+
+    :param stratified: Whether to use stratified cross validation or not.
+    :type stratified: bool
+
+    :param random_state: Seed of the splits. If None, a seed is drawn once, so folds differ between runs but not between evaluations.
+    :type random_state: int
+
+    :param materialize: Whether sliced folds are kept between evaluations. If False, folds are sliced for each evaluation and released afterwards, which keeps memory at the size of the dataset. Default is True.
+    :type materialize: bool
+
+    :ivar epoch: number of the current splits. see :meth:`Folds.refresh`.
+    """
+
+    def __init__(self, x_train, y_train, k: int = 5, stratified: bool = False, random_state: int = None,
+                 materialize: bool = True):
+        self.x_t = x_train
+        self.y_t = y_train
+        self.k = k
+        self.stratified = stratified
+        self.materialize = materialize
+        if random_state is None:
+            random_state = int(np.random.randint(0, 2 ** 31 - 1))
+        self.seed = random_state
+        self.epoch = 0
+        self.splits = None
+        self.split_indices = None
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # sliced folds are rebuilt where they are used, instead of being sent to worker processes
+        state = self.__dict__.copy()
+        state["splits"] = None
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def indices(self):
+        """
+        Computes train and test indices of each fold of the current epoch.
+
+        :return: A list of (train indices, test indices) tuples.
+        :rtype: list
+        """
+        if self.split_indices is None:
+            from sklearn.model_selection import KFold, StratifiedKFold
+
+            random_state = (self.seed + self.epoch) % (2 ** 32)
+            if self.stratified:
+                cv = StratifiedKFold(n_splits=self.k, shuffle=True, random_state=random_state)
+            else:
+                cv = KFold(n_splits=self.k, shuffle=True, random_state=random_state)
+            self.split_indices = list(cv.split(self.x_t, self.y_t))
+        return self.split_indices
+
+    def set_epoch(self, epoch):
+        """
+        Switches folds to the splits of an epoch. Sliced folds are rebuilt on next use.
+
+        :param epoch: number of the splits.
+        :type epoch: int
+
+        :return: None
+        """
+        with self.lock:
+            if epoch != self.epoch:
+                self.epoch = epoch
+                self.splits = None
+                self.split_indices = None
+
+    def refresh(self):
+        """
+        Switches folds to new splits.
+
+        :return: None
+        """
+        self.set_epoch(self.epoch + 1)
+
+    def set_data(self, x_train, y_train, materialize: bool = True):
+        """
+        Replaces the data folds are sliced from, for example with a shared view of the same data.
+
+        :param x_train: Training features.
+        :type x_train: Dataframe
+
+        :param y_train: Training target.
+        :type y_train: Dataframe
+
+        :param materialize: Whether sliced folds are kept between evaluations.
+        :type materialize: bool
+
+        :return: None
+        """
+        with self.lock:
+            self.x_t = x_train
+            self.y_t = y_train
+            self.materialize = materialize
+            self.splits = None
+
+    def slices(self):
+        """
+        Slices folds of the current epoch one at a time.
+
+        :return: A generator of (x train, y train, x test, y test) tuples.
+        """
+        from sklearn.utils import _safe_indexing
+
+        for train, test in self.indices():
+            yield (_safe_indexing(self.x_t, train), _safe_indexing(self.y_t, train),
+                   _safe_indexing(self.x_t, test), _safe_indexing(self.y_t, test))
+
+    def get(self):
+        """
+        Returns sliced folds of the current epoch. Materialized folds are sliced on first use and kept, otherwise they are sliced lazily for each call.
+
+        :return: An iterable of (x train, y train, x test, y test) tuples.
+        """
+        if not self.materialize:
+            return self.slices()
+        with self.lock:
+            if self.splits is None:
+                self.splits = list(self.slices())
+            return self.splits
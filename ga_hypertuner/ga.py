@@ -1,6 +1,17 @@
-import random
+import os
+import time
 import numpy as np
-from sklearn.model_selection import KFold, cross_validate, StratifiedKFold
+from ga_hypertuner.evaluation import Scorer, Evaluator
+from ga_hypertuner.cache import FitnessCache, SqliteFitnessCache
+from ga_hypertuner.checkpoint import Checkpoint
+from ga_hypertuner.space import SearchSpace
+from ga_hypertuner.surrogate import Surrogate
+from ga_hypertuner.budget import CpuBudget
+from ga_hypertuner.metrics import MetricsReporter, PlotSink
+from ga_hypertuner.history import History
+from ga_hypertuner.adaptation import Adaptation
+from ga_hypertuner.pareto import Pareto
+from ga_hypertuner.stopping import StopValue, Stagnation, DiversityCollapse, Deadline, FitBudget
 from ga_hypertuner.reporting import Reporting
 from ga_hypertuner.visualization import Visualize
 import sys
@@ -16,10 +27,10 @@ class GA:
 
     :param model_class: Model class that its hyperparameters are being optimized. Any model class that scikit cross-validate module can accept.
 
-    :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list either like [None, Parameter Type] (for optimization of parameter) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
+    :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list like [None, Parameter Type] (for optimization of parameter), [None, Parameter Type, Scale] or [None, Parameter Type, Scale, Step] where Scale is "linear" or "log" (for parameters spread over orders of magnitude, like C or learning rate) and Step is the grid values are rounded to, [None, "categorical"] (for choosing one of the values given as boundaries, like solver or booster) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
     :type model_parameters: dict
 
-    :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end].
+    :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end], or the list of choices of a categorical parameter.
     :type boundaries: dict
 
     :param x_train: Training features for the given model. This data will be used to train the model without slicing or sampling.
@@ -46,19 +57,137 @@ class GA:
     :param verbosity: Determines the amount of information that is returned after each generation is generated. Accepted values are 0, 1, 2, or 3. Default is 1.
     :type verbosity: int
 
-    :param show_progress_plot: Whether the progress plot of the score for each generation should be shown at the end of each generation.
+    :param show_progress_plot: Whether the progress plot of the score for each generation should be shown at the end of each generation. The plot is redrawn in a single window, which is closed when the optimization ends. Drawing runs in the generation loop, so use plot_path to render it off the hot path.
     :type show_progress_plot: bool
 
     :param plot_step: number of generations to skip before displaying progress plot.
     :type plot_step: int
 
+    :param n_workers: Number of workers that evaluate individuals of a generation in parallel. Default is 1.
+    :type n_workers: int
+
+    :param backend: Backend used for evaluating individuals. Accepted values are "serial", "thread", "process" and "distributed". Default is "serial".
+    :type backend: str
+
+    :param broker_address: "host:port" the broker of distributed backend listens on, and workers connect to. Default is None, a free port of the local host.
+    :type broker_address: str
+
+    :param broker_authkey: Key workers of distributed backend authenticate with. Default is None, a random key only known to local workers.
+    :type broker_authkey: str
+
+    :param timeout: If given, number of seconds an evaluation may take. Evaluations run in a sandbox process, which is killed when an evaluation takes longer, and the individual gets timeout_penalty as score, so selection drops it. An individual whose sandbox process dies, for example killed for lack of memory, is treated the same way. Default is None.
+    :type timeout: int or float
+
+    :param timeout_penalty: Score of individuals whose evaluation timed out. Default is None, -inf if direction is "max" and inf if direction is "min".
+    :type timeout_penalty: int or float
+
+    :param plot_path: If given, path of an image file the progress plot is rendered to every plot_step generations, on a background thread and without a display, for example "progress.png". Default is None.
+    :type plot_path: str
+
+    :param cpu_budget: If given, number of cores split between workers, folds fitted at the same time and threads of each model, or -1 for all cores. n_workers is then chosen by the split, which is picked again from fit times measured in the first generation. see :class:`CpuBudget`. Default is None.
+    :type cpu_budget: int
+
+    :param history_path: If given, path of a memory-mapped file the history of every evaluation is appended to, so it can be loaded with :meth:`History.load` after the optimization. Rows live in the file, not in memory, so memory use stays bounded on long runs. Default is None, no history is kept.
+    :type history_path: str
+
+    :param warm_start: If given, individuals the initial population is seeded with, and the rest of the population is drawn randomly. Either a list of dictionaries of hyperparameters, or a path of a history file (see history_path) or checkpoint of a previous optimization, whose best individuals are taken. Hyperparameters missing from a seed are drawn randomly and values outside boundaries are clipped. Default is None.
+    :type warm_start: list or str
+
+    :param init: Method the initial population is drawn with. "random" draws each hyperparameter independently, "lhs" (Latin hypercube), "sobol" and "halton" spread the population evenly over the search space, so fewer initial evaluations are wasted on clustered individuals. see :meth:`SearchSpace.sample`. Default is "random".
+    :type init: str
+
+    :param opposition: Whether opposition-based initialization is used. The opposite of each initial individual, mirrored through the center of the search space, with a random other choice for categorical hyperparameters, is also evaluated, and the best pop_size of individuals and opposites form the initial population. Costs pop_size extra evaluations. Default is False.
+    :type opposition: bool
+
+    :param objectives: If given, a list of objectives minimized together with the score, making the optimization multi-objective. Accepted values are "fit_time" and "predict_time", mean seconds of fitting and of scoring one cross validation fold, and "model_size", mean bytes of the pickled fitted model. Parents and children are then merged and the best pop_size survive by non-dominated sorting and crowding distance, like NSGA-II, and the Pareto front of the population is returned instead of the best hyperparameters, see :class:`Pareto`. Strategies using the best individual use the individual with the best score. Only used in generational mode, without cache, racing or fidelities, since they change measured times or skip evaluations. Default is None.
+    :type objectives: list
+
+    :param strategy: Mutation strategy that creates trial individuals from donors, random individuals different from the parent. "rand/1" adds a scaled difference of two donors to a third, "rand/2" adds two scaled differences to a fifth donor, "best/1" adds a scaled difference of two donors to the best individual, "current-to-best/1" moves the parent toward the best individual and by a scaled difference of two donors, and "current-to-pbest/1" does the same toward a random individual of the best pbest_rate of the population. Strategies using the best individual converge in fewer evaluations but may get stuck in a local optimum. Default is "rand/1".
+    :type strategy: str
+
+    :param adaptation: If given, fscale and cp are adapted during the run instead of being fixed. Each child draws its own fscale and cp around centers that move toward values of children better than their parents, see :class:`Adaptation`. fscale and cp of ga_parameters are the initial centers. Accepted values are "jade" and "shade". Default is None.
+    :type adaptation: str
+
+    :param warm_start_rescore: Whether seeds are scored again, for example because training data changed. If False, seeds taken from a history or checkpoint keep their previous scores and only the random part of the population is evaluated. Seeds are always scored again when objectives are given, since their objectives are not known. Default is True.
+    :type warm_start_rescore: bool
+
+    :param random_state: Seed of the algorithm and cross validation folds. With a fixed seed, all backends return the same results. Default is None.
+    :type random_state: int
+
+    :param cache_size: Number of scores kept in the fitness cache, so individuals that are already scored are not cross validated again. 0 disables the cache. Default is 0.
+    :type cache_size: int
+
+    :param cache_decimals: If given, float hyperparameters are rounded to this number of decimals for looking up the cache. Default is None.
+    :type cache_decimals: int
+
+    :param cache_path: Path of a SQLite file that the cache is persisted to, so repeated runs skip individuals scored before. Default is None.
+    :type cache_path: str
+
+    :param checkpoint_path: Path of the checkpoint file the state of the optimization is periodically saved to. The fitness cache is not part of the checkpoint, so a resumed run may evaluate again individuals that were cached. If None, no checkpoint is saved. Default is None.
+    :type checkpoint_path: str
+
+    :param checkpoint_every: Number of generations between checkpoints. If neither checkpoint_every nor checkpoint_seconds is given, a checkpoint is saved every generation. Default is None.
+    :type checkpoint_every: int
+
+    :param checkpoint_seconds: Minimum number of seconds between checkpoints. Default is None.
+    :type checkpoint_seconds: int or float
+
+    :param racing_bound: If given, children are cross validated one fold at a time, and stop being evaluated once their running mean score, moved by this margin in their favor, is still worse than their parent score. Default is None.
+    :type racing_bound: int or float
+
+    :param cv_refresh: Number of generations between drawing new cross validation folds. When folds change, the population is scored again on the new folds, so parents and children are always compared on identical splits. If None, the same folds are used for the whole run. Default is None.
+    :type cv_refresh: int
+
+    :param surrogate: If given, a regression model of scores, trained on every evaluation so far, ranks several candidate children of each parent by expected improvement, and only the best candidate is cross validated. Accepted values are "random_forest" and "gaussian_process". Default is None.
+    :type surrogate: str
+
+    :param surrogate_candidates: Number of candidate children created for each parent when a surrogate is used. Default is 4.
+    :type surrogate_candidates: int
+
+    :param stop_patience: If given, the algorithm stops once the best score did not improve by more than stop_min_delta for this many generations. Default is None.
+    :type stop_patience: int
+
+    :param stop_min_delta: Improvements of the best score smaller than or equal to this are not counted by stop_patience. Default is 0.
+    :type stop_min_delta: int or float
+
+    :param stop_spread: If given, the algorithm stops once the standard deviation of every hyperparameter in the population, relative to the width of its boundaries, is below this value. Default is None.
+    :type stop_spread: float
+
+    :param max_seconds: If given, the algorithm stops once it has run for this many wall-clock seconds. Default is None.
+    :type max_seconds: int or float
+
+    :param max_fits: If given, the algorithm stops once this many models were fitted, counting one fit per cross validation fold. Default is None.
+    :type max_fits: int
+
+    :param fidelities: If given, an increasing list of fractions of training data, for example [0.1, 0.3, 1.0]. Children are first cross validated on a seeded, stratified if cross validation is, subsample of the smallest fraction, and only the best promotion_rate of them are promoted to the next fraction, until survivors are cross validated on full data and compared with their parents. Children that are not promoted keep their parents. Only used in generational mode. Default is None.
+    :type fidelities: list
+
+    :param promotion_rate: Fraction of children promoted from each fidelity to the next. Default is 0.5.
+    :type promotion_rate: float
+
+    :param callbacks: A list of callbacks notified when evaluations start and end and when generations end. A failing callback does not stop the optimization, its first error is raised once the run ended. see :class:`Callback`. Default is None.
+    :type callbacks: list
+
+    :param mode: Accepted values are "generational" and "steady_state". In generational mode, all children of a generation are scored as a batch before selection. In steady_state mode, a new child is dispatched as soon as a worker is free and replaces its parent as soon as it is scored, so workers do not wait for slow evaluations. Steady-state runs depend on the order evaluations finish in, so they are not reproducible with multiple workers. Default is "generational".
+    :type mode: str
+
     :GA Parameters:
         * *direction* (``int``): Determines whether the score of models should be maximized or minimized. Accepted values are ["max","min"].
         * *pop_size* (``int``): Size of population in each generation. Increasing this value will reduce the chance of local optima. Accepted values are integers greater than 5. Default is 20.
         * *gmax* (``int``): Maximum number of generations. After this many generations, the algorithm will stop and return the best params. Accepted values are integers greater than 1. Default is 50.
         * *fscale* (``int``): A scaling factor that controls the amount of effect that differences between parameters of population members have. larger values will result in larger convergence rate. When convergence rate is higher, it will take less time for algorithm to reach local optimum, but the local optimum have lesser chance of being global. Reducing it will opposite result Accepted values are floats between 0 and 1. Default is 0.5.
         * *cp* (``int``): The probability that a child will inherit a parameter from a parent instead of a trial vector. Accepted values are floats between 0 and 1. Default is 0.5.
+
+    :ivar modes: accepted values for mode.
+    :ivar strategies: accepted values for strategy, and number of donors each one uses.
+    :ivar pbest_rate: fraction of the population the "current-to-pbest/1" strategy moves parents toward.
+    :ivar history: :class:`History` of every evaluation of the optimization, or None if history_path is not given.
+    :ivar costs: A matrix of values of objectives of individuals in the population, one row per individual, with no columns unless objectives are given.
+    :ivar pareto_front: individuals of the population no other individual dominates, best score first. see :meth:`GA.front`.
     """
+    modes = ["generational", "steady_state"]
+    strategies = {"rand/1": 3, "best/1": 2, "current-to-best/1": 2, "current-to-pbest/1": 2, "rand/2": 5}
+    pbest_rate = 0.1
 
     def __init__(self, ga_parameters: dict, model_class
                  , model_parameters: dict
@@ -69,8 +198,52 @@ class GA:
                  , k: int = 5, stratified: bool = False
                  , verbosity: int = 1
                  , show_progress_plot: bool = False
-                 , plot_step: int = 1):
+                 , plot_step: int = 1
+                 , n_workers: int = 1, backend: str = "serial"
+                 , random_state: int = None
+                 , cache_size: int = 0, cache_decimals: int = None
+                 , cache_path: str = None
+                 , checkpoint_path: str = None, checkpoint_every: int = None
+                 , checkpoint_seconds: Union[int, float] = None
+                 , racing_bound: Union[int, float] = None
+                 , cv_refresh: int = None
+                 , mode: str = "generational"
+                 , callbacks: list = None
+                 , surrogate: str = None, surrogate_candidates: int = 4
+                 , stop_patience: int = None, stop_min_delta: Union[int, float] = 0.0
+                 , stop_spread: float = None, max_seconds: Union[int, float] = None
+                 , max_fits: int = None
+                 , fidelities: list = None, promotion_rate: float = 0.5
+                 , broker_address: str = None, broker_authkey: str = None
+                 , timeout: Union[int, float] = None, timeout_penalty: Union[int, float] = None
+                 , cpu_budget: int = None, plot_path: str = None
+                 , history_path: str = None
+                 , warm_start: Union[list, str] = None, warm_start_rescore: bool = True
+                 , strategy: str = "rand/1", adaptation: str = None
+                 , init: str = "random", opposition: bool = False
+                 , objectives: list = None):
 
+        # everything except training data, so the optimization can be rebuilt from a checkpoint
+        self.settings = {"ga_parameters": ga_parameters, "model_class": model_class,
+                         "model_parameters": model_parameters, "boundaries": boundaries, "scoring": scoring,
+                         "stop_criteria": stop_criteria, "stop_value": stop_value, "k": k,
+                         "stratified": stratified, "verbosity": verbosity,
+                         "show_progress_plot": show_progress_plot, "plot_step": plot_step,
+                         "n_workers": n_workers, "backend": backend, "random_state": random_state,
+                         "cache_size": cache_size, "cache_decimals": cache_decimals, "cache_path": cache_path,
+                         "checkpoint_path": checkpoint_path, "checkpoint_every": checkpoint_every,
+                         "checkpoint_seconds": checkpoint_seconds, "racing_bound": racing_bound,
+                         "cv_refresh": cv_refresh, "mode": mode,
+                         "surrogate": surrogate, "surrogate_candidates": surrogate_candidates,
+                         "stop_patience": stop_patience, "stop_min_delta": stop_min_delta,
+                         "stop_spread": stop_spread, "max_seconds": max_seconds, "max_fits": max_fits,
+                         "fidelities": fidelities, "promotion_rate": promotion_rate,
+                         "broker_address": broker_address, "broker_authkey": broker_authkey,
+                         "timeout": timeout, "timeout_penalty": timeout_penalty, "cpu_budget": cpu_budget,
+                         "plot_path": plot_path, "history_path": history_path, "warm_start": warm_start,
+                         "warm_start_rescore": warm_start_rescore, "strategy": strategy,
+                         "adaptation": adaptation, "init": init, "opposition": opposition,
+                         "objectives": objectives}
         self.generation = 0
         self.gp = ga_parameters
         self.model_class = model_class
@@ -92,6 +265,92 @@ class GA:
         self.min_scores = []
         self.mean_scores = []
         self.best_params = []
+        self.rng = np.random.default_rng(random_state)
+        self.space = SearchSpace(model_parameters, boundaries)
+        self.racing_bound = racing_bound
+        self.warm_start = warm_start
+        self.warm_start_rescore = warm_start_rescore
+        self.strategy = strategy
+        self.init = init
+        self.opposition = opposition
+        self.objectives = list(objectives) if objectives is not None else []
+        self.costs = np.empty((0, len(self.objectives)))
+        self.pareto_front = []
+        self.adaptation = None
+        if adaptation is not None:
+            self.adaptation = Adaptation(adaptation, ga_parameters["fscale"], ga_parameters["cp"])
+        self.scorer = Scorer(model_class, x_train, y_train, scoring, k=k, stratified=stratified,
+                             random_state=random_state, direction=ga_parameters["direction"],
+                             racing_bound=racing_bound if racing_bound is not None else 0.0, timeout=timeout,
+                             penalty=timeout_penalty)
+        self.scorer.measure_size = "model_size" in self.objectives
+        self.cv_refresh = cv_refresh
+        self.mode = mode
+        self.fidelities = None
+        if fidelities is not None:
+            # the last rung is always full data, since survivors are compared with parents scored on full data
+            self.fidelities = sorted(f for f in set(fidelities) if f < 1.0) + [1.0]
+        self.promotion_rate = promotion_rate
+        self.rungs = []
+        self.cache = None
+        if cache_size > 0 or cache_path is not None:
+            self.cache_context = FitnessCache.context_of(self.scorer)
+            if cache_path is not None:
+                self.cache = SqliteFitnessCache(cache_path, max_size=max(cache_size, 1), decimals=cache_decimals,
+                                                context=self.cache_context)
+            else:
+                self.cache = FitnessCache(max_size=cache_size, decimals=cache_decimals, context=self.cache_context)
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        if plot_path is not None:
+            self.callbacks.append(MetricsReporter([PlotSink(plot_path, scoring, plot_step=plot_step)],
+                                                  evaluations=False))
+        self.history = None
+        if history_path is not None:
+            self.history = History(self.space, k, direction=ga_parameters["direction"], path=history_path)
+            self.callbacks.append(self.history)
+        self.surrogate = None
+        self.surrogate_candidates = surrogate_candidates
+        evaluator_callbacks = list(self.callbacks)
+        if surrogate is not None:
+            self.surrogate = Surrogate(self.space, model=surrogate, direction=ga_parameters["direction"])
+            evaluator_callbacks.append(self.surrogate)
+        self.cpu_budget = None
+        if cpu_budget is not None:
+            self.cpu_budget = CpuBudget(cpu_budget, pop_size=ga_parameters["pop_size"], k=k, model_class=model_class,
+                                        backend=backend)
+            self.scorer.thread_parameter = self.cpu_budget.thread_parameter
+            evaluator_callbacks.append(self.cpu_budget)
+        self.evaluator = Evaluator(self.scorer, backend=backend, n_workers=n_workers, cache=self.cache,
+                                   callbacks=evaluator_callbacks, broker_address=broker_address,
+                                   broker_authkey=broker_authkey)
+        if self.cpu_budget is not None:
+            self.evaluator.configure(*self.cpu_budget.split)
+        self.generation_stats = []
+        self.generation_start = time.perf_counter()
+        self.eval_seconds = 0.0
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_seconds = checkpoint_seconds
+        if checkpoint_every is None and checkpoint_seconds is None:
+            self.checkpoint_every = 1
+        self.last_checkpoint = time.time()
+
+        # stop criteria are checked in order, and the first one that gives a reason stops the algorithm
+        self.stoppers = []
+        if stop_criteria and stop_value is not None:
+            self.stoppers.append(StopValue(stop_value))
+        if stop_patience is not None:
+            self.stoppers.append(Stagnation(stop_patience, stop_min_delta))
+        if stop_spread is not None:
+            self.stoppers.append(DiversityCollapse(stop_spread))
+        if max_seconds is not None:
+            self.stoppers.append(Deadline(max_seconds))
+        if max_fits is not None:
+            self.stoppers.append(FitBudget(max_fits))
+        self.stop_reason = None
+        self.fits = 0
+        self.start_time = time.time()
+        self.elapsed_before = 0.0
 
     def score(self, params):
 
@@ -103,158 +362,582 @@ class GA:
 
         :return: score of an individual
         """
-        model = self.model_class(**params)
-        if self.stratified:
-            cv = StratifiedKFold(n_splits=self.k, shuffle=True)
-        else:
-            cv = KFold(n_splits=self.k, shuffle=True)
-        score = cross_validate(model, self.x_t, self.y_t, cv=cv, scoring=self.s, return_train_score=False)["test_score"]
-        return score.mean()
+        return self.scorer(params)
 
-    def initiation(self):
+    def evaluate(self, params_list, thresholds=None, fidelity=1.0, records=False):
+        """
+        Scores a batch of individuals with the evaluator, reporting progress of the generation as evaluations are done.
 
+        :param params_list: A list of individuals attributes (hyperparameters).
+        :type params_list: list
+
+        :param thresholds: If given, a list of scores each individual is raced against. Default is None.
+        :type thresholds: list
+
+        :param fidelity: fraction of training data individuals are cross validated on. Default is 1.0.
+        :type fidelity: float
+
+        :param records: Whether records of evaluations are returned instead of scores. Default is False.
+        :type records: bool
+
+        :return: A list of scores, or of records, in the same order as params_list.
+        :rtype: list
         """
-        Initializes the population vectors with random hyperparameters, and their respective scores.
+        callback = Reporting.progress if self.verbosity >= 1 else None
+        start = time.perf_counter()
+        scores = self.evaluator.evaluate(params_list, callback=callback, thresholds=thresholds, fidelity=fidelity,
+                                         records=records)
+        self.eval_seconds += time.perf_counter() - start
+        return scores
+
+    def measure(self, params_list):
+        """
+        Scores a batch of individuals and measures their objectives.
+
+        :param params_list: A list of individuals attributes (hyperparameters).
+        :type params_list: list
+
+        :return: A NumpyArray of scores and a matrix of values of objectives, one row per individual.
+        :rtype: tuple
+        """
+        records = self.evaluate(params_list, records=True)
+        scores = np.array([record["score"] for record in records], dtype=float)
+        costs = np.array([Pareto.costs(record, self.objectives) for record in records], dtype=float)
+        return scores, costs.reshape(len(records), len(self.objectives))
+
+    def decode(self, population):
+        """
+        Converts population matrix to model parameters.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :return: A list of dictionaries of hyperparameters.
+        :rtype: list
+        """
+        return [self.space.decode(row) for row in population]
+
+    def vectors(self, population, scores):
+        """
+        Converts population to the list of dictionaries used for reporting.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
 
         :return: A list of population vectors, where each vector is a dictionary containing the hyperparameters as "params" and their respective scores as "score".
         :rtype: list
         """
+        return [{"params": params, "score": score} for params, score in zip(self.decode(population), scores)]
+
+    def refresh_folds(self, population):
+        """
+        Draws new cross validation folds and scores the population again on them.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :return: A NumpyArray of scores of individuals on the new folds.
+        :rtype: NumpyArray
+        """
+        self.scorer.folds.refresh()
+        if self.cache is not None:
+            # scores of previous folds are not comparable with the new ones
+            self.cache.context = self.cache_context + str(self.scorer.folds.epoch)
+        scores, self.costs = self.measure(self.decode(population))
+        return scores
+
+    def initiation(self):
+
+        """
+        Initializes the population vectors with random hyperparameters, and their respective scores.
+
+        :return: A matrix of population, one row per individual, and a NumpyArray of their scores.
+        :rtype: tuple
+        """
 
         self.generation = 1
-        vectors = []
-        for i in range(self.gp["pop_size"]):
-            params = {}
-            for j in range(self.dim):
-                p = self.mp[j]
-                pi = self.mpi[j]
-                if type(pi) == list:
-                    bound = self.b[p]
-                    if pi[1] == int:
-                        x = int(random.randint(bound[0], bound[1]))
-                    if pi[1] == float:
-                        x = random.uniform(bound[0], bound[1])
-                else:
-                    x = pi
-                params[p] = x
-            score = self.score(params)
-            vector = {"params": params, "score": score}
-            vectors.append(vector)
-        return vectors
-
-    def mutation(self, vectors):
-        """
-        Performs mutation on the input list of vectors and returns the updated list of vectors.
-
-        :param vectors: A list of dictionaries containing the hyperparameters and corresponding scores of each individual in the population (score of model).
-
-        :returns: A list of updated dictionaries containing the hyperparameters and corresponding scores of each individual in the population (score of model) after mutation.
-
-        """
-        # For each individual in the population as a parent:
-        for i in range(self.gp["pop_size"]):
-            parent = vectors[i]
-
-            # select three different individuals (different from parent)
-            range_values = [x for x in range(0, self.gp["pop_size"] - 1) if x != i]
-            chosen = list(random.sample(range_values, k=3))
-
-            # generate a trial individual by adding the difference between the hyperparameters of
-            # the two randomly selected individuals (chosen[1] and chosen[2]) multiplied by a scaling factor
-            # (gp["fscale"]) to the hyperparameters of the first randomly selected individual (chosen[0]).
-            # If the trial parameter is out of bounds, clip it to the nearest bound.
-            trial_params = {}
-            for j in range(self.dim):
-                p = self.mp[j]
-                pi = self.mpi[j]
-                if type(pi) == list:
-
-                    if pi[1] == int:
-                        x = int(vectors[chosen[0]]["params"][p] + self.gp["fscale"] * (
-                                vectors[chosen[1]]["params"][p] - vectors[chosen[2]]["params"][p]))
-
-                        if x > self.b[p][1]:
-                            x = self.b[p][1]
-                        if x < self.b[p][0]:
-                            x = self.b[p][0]
-
-                    elif pi[1] == float:
-                        x = float(vectors[chosen[0]]["params"][p] + self.gp["fscale"] * (
-                                vectors[chosen[1]]["params"][p] - vectors[chosen[2]]["params"][p]))
-
-                        if x > self.b[p][1]:
-                            x = self.b[p][1] - 1e-10
-                        if x < self.b[p][0]:
-                            x = self.b[p][0] + 1e-10
-                else:
-                    x = pi
-
-                trial_params[p] = x
-
-            # Create a child from trial and parent individuals.
-            vectors[i] = self.recombination(parent, trial_params)
-            if self.verbosity >= 1:
-                Reporting.progress(i + 1, self.gp["pop_size"])
-        return vectors
+        population = self.space.sample(self.rng, self.gp["pop_size"], self.init)
+        scores = np.full(self.gp["pop_size"], np.nan)
+        costs = np.full((self.gp["pop_size"], len(self.objectives)), np.nan)
+
+        # seeds replace the first random individuals, keeping random values of hyperparameters they do not have,
+        # or whose value is not in the search space, like an unknown choice
+        seeds = self.warm_start_seeds()
+        for i, (params, score) in enumerate(seeds):
+            for j, p in enumerate(self.space.optimized):
+                try:
+                    population[i, j] = self.space.encode_value(p, params[p])
+                except (KeyError, ValueError):
+                    pass
+            population[i] = self.space.clip(population[i])
+            # a previous score is only valid for exactly the individual it was scored for, and objectives
+            # of previous evaluations are not known
+            decoded = self.space.decode(population[i])
+            if not self.warm_start_rescore and not self.objectives and score is not None and \
+                    all(p in params and decoded[p] == params[p] for p in self.space.optimized):
+                scores[i] = score
+        if seeds and self.verbosity >= 1:
+            Reporting.warm_start(len(seeds), int(np.sum(~np.isnan(scores))))
+
+        # score the rest of the population as a batch
+        todo = np.flatnonzero(np.isnan(scores))
+        scores[todo], costs[todo] = self.measure(self.decode(population[todo]))
+        if self.opposition:
+            population, scores, costs = self.opposition_step(population, scores, costs)
+        self.costs = costs
+        return population, scores
 
-    def recombination(self, parent, trial_params):
+    def opposition_step(self, population, scores, costs):
         """
-        Recombine parent and trial individual to create child, then decides child or parent should be returned to population based on their score.
+        Evaluates opposites of individuals as a batch, and keeps the best pop_size of individuals and opposites. see :meth:`GA.survivors`.
 
-        :param parent: parent individual
-        :param trial_params: trial individual
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
 
-        :return: A list of updated dictionaries containing the hyperparameters and corresponding scores of each individual in the population (score of model) after recombination.:
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :param costs: A matrix of values of objectives of individuals.
+        :type costs: NumpyArray
+
+        :return: A matrix of population, one row per individual, a NumpyArray of their scores and a matrix of their values of objectives.
+        :rtype: tuple
         """
+        opposites = self.space.clip(self.space.opposite(population, self.rng))
+        opposite_scores, opposite_costs = self.measure(self.decode(opposites))
+        population = np.vstack([population, opposites])
+        scores = np.concatenate([scores, opposite_scores])
+        costs = np.vstack([costs, opposite_costs])
+        keep = self.survivors(scores, costs, self.gp["pop_size"])
+        return population[keep], scores[keep], costs[keep]
 
-        child_params = {}
-        for i in range(self.dim):
-            p = self.mp[i]
-            rp = random.uniform(0, 1)
-            if rp < self.gp["cp"]:
-                child_params[p] = trial_params[p]
-            else:
-                child_params[p] = parent["params"][p]
-        child_score = self.score(child_params)
-        child = {"params": child_params, "score": child_score}
+    def survivors(self, scores, costs, n):
+        """
+        Picks the best n individuals: those with the best scores, or, if objectives are given, those picked by non-dominated sorting and crowding distance. see :meth:`Pareto.select`.
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :param costs: A matrix of values of objectives of individuals.
+        :type costs: NumpyArray
+
+        :param n: number of survivors.
+        :type n: int
+
+        :return: A NumpyArray of indices of survivors.
+        :rtype: NumpyArray
+        """
+        if not self.objectives:
+            order = np.argsort(-scores if self.gp["direction"] == "max" else scores, kind="stable")
+            return order[:n]
+        return Pareto.select(self.minimized(scores, costs), n)
+
+    def minimized(self, scores, costs):
+        """
+        Builds the matrix of values multi-objective selection minimizes: the score, negated when it is maximized, followed by values of objectives.
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :param costs: A matrix of values of objectives of individuals.
+        :type costs: NumpyArray
+
+        :return: A matrix of values to minimize, one row per individual.
+        :rtype: NumpyArray
+        """
+        return np.column_stack([-scores if self.gp["direction"] == "max" else scores, costs])
+
+    def front(self, population, scores):
+        """
+        Collects the Pareto front of the population: individuals no other individual dominates on score and objectives, best score first. Individuals with the same hyperparameters appear once.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: A list of dictionaries containing the hyperparameters as "params", their score as "score" and the value of each objective under its name.
+        :rtype: list
+        """
+        values = self.minimized(scores, self.costs)
+        first = Pareto.non_dominated_sort(values)[0]
+        first = first[np.argsort(values[first, 0], kind="stable")]
+        front = []
+        seen = set()
+        for i in first:
+            params = self.space.decode(population[i])
+            if str(params) in seen:
+                continue
+            seen.add(str(params))
+            member = {"params": params, "score": float(scores[i])}
+            member.update({name: float(self.costs[i, j]) for j, name in enumerate(self.objectives)})
+            front.append(member)
+        return front
+
+    def warm_start_seeds(self):
+        """
+        Collects individuals the initial population is seeded with, from the warm_start setting. Individuals of a history or checkpoint are taken best first, and duplicates are dropped.
+
+        :return: A list of at most pop_size tuples of hyperparameters and score, which is None if not known.
+        :rtype: list
+        """
+        n = self.gp["pop_size"]
+        if self.warm_start is None:
+            return []
+        if type(self.warm_start) != str:
+            candidates = [(params, None) for params in self.warm_start]
+        elif os.path.exists(self.warm_start + ".meta"):
+            history = History.load(self.warm_start)
+            rows = history.top(n)
+            candidates = list(zip(history.params(rows), rows["score"].tolist()))
+        else:
+            state = Checkpoint.load(self.warm_start)
+            space = SearchSpace(state["settings"]["model_parameters"], state["settings"]["boundaries"])
+            order = np.argsort(state["scores"], kind="stable")
+            if state["settings"]["ga_parameters"]["direction"] == "max":
+                order = order[::-1]
+            candidates = [(space.decode(state["population"][i]), float(state["scores"][i])) for i in order]
+        seeds = []
+        seen = set()
+        for params, score in candidates:
+            key = tuple(params.get(p) for p in self.space.optimized)
+            if key not in seen:
+                seen.add(key)
+                seeds.append((params, score))
+        return seeds[:n]
+
+    def mutation(self, population, scores):
+        """
+        Performs mutation on the population and returns the updated population.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :returns: updated population matrix and scores after mutation.
+        :rtype: tuple
+        """
+        # Create children from trial and parent individuals, score them as a batch,
+        # then decide which of child or parent stays in population
+        fscale, cp = self.controls(self.gp["pop_size"])
+        children = self.offspring(population, scores, np.arange(self.gp["pop_size"]), fscale, cp)
+        thresholds = scores.tolist() if self.racing_bound is not None else None
+        if self.fidelities is not None:
+            children_scores = self.successive_halving(children, thresholds)
+        elif self.objectives:
+            children_scores, children_costs = self.measure(self.decode(children))
+            self.adapt(scores, children_scores, fscale, cp)
+            return self.pareto_selection(population, scores, children, children_scores, children_costs)
+        else:
+            children_scores = np.array(self.evaluate(self.decode(children), thresholds), dtype=float)
+        self.adapt(scores, children_scores, fscale, cp)
+        return self.selection(population, scores, children, children_scores)
+
+    def controls(self, n):
+        """
+        Scaling factors and crossover probabilities of children. They are fscale and cp of GA parameters, unless they are adapted.
+
+        :param n: number of children.
+        :type n: int
+
+        :return: A NumpyArray of scaling factors and a NumpyArray of crossover probabilities.
+        :rtype: tuple
+        """
+        if self.adaptation is None:
+            return np.full(n, float(self.gp["fscale"])), np.full(n, float(self.gp["cp"]))
+        return self.adaptation.sample(self.rng, n)
+
+    def adapt(self, scores, children_scores, fscale, cp):
+        """
+        Reports scaling factors and crossover probabilities of children strictly better than their parents to the adaptation. Centers are moved when the generation ends.
+
+        :param scores: A NumpyArray of scores of parents.
+        :type scores: NumpyArray
+
+        :param children_scores: A NumpyArray of scores of children.
+        :type children_scores: NumpyArray
+
+        :param fscale: scaling factors of children.
+        :type fscale: NumpyArray
+
+        :param cp: crossover probabilities of children.
+        :type cp: NumpyArray
+
+        :return: None
+        """
+        if self.adaptation is None:
+            return
+        better = self.improves(children_scores, scores) & (children_scores != scores) & np.isfinite(children_scores)
+        self.adaptation.success(fscale[better], cp[better], np.abs(children_scores - scores)[better])
+
+    def successive_halving(self, children, thresholds=None):
+        """
+        Scores children on increasing fractions of training data, promoting only the best of them from each fraction to the next. Children that are not promoted to full data get the worst possible score, so they never replace their parents.
+
+        :param children: A matrix of children, one row per child.
+        :type children: NumpyArray
+
+        :param thresholds: If given, a list of scores each child is raced against on full data. Default is None.
+        :type thresholds: list
+
+        :return: A NumpyArray of scores of children on full data.
+        :rtype: NumpyArray
+        """
+        worst = -np.inf if self.gp["direction"] == "max" else np.inf
+        survivors = np.arange(len(children))
+        for fidelity in self.fidelities[:-1]:
+            scores = np.array(self.evaluate(self.decode(children[survivors]), fidelity=fidelity), dtype=float)
+            scores = np.where(np.isnan(scores), worst, scores)
+            order = np.argsort(-scores if self.gp["direction"] == "max" else scores, kind="stable")
+            promoted = max(1, int(np.ceil(len(survivors) * self.promotion_rate)))
+            self.rungs.append({"fidelity": fidelity, "evaluated": len(survivors), "promoted": promoted})
+            survivors = survivors[order[:promoted]]
+        children_scores = np.full(len(children), worst)
+        survivor_thresholds = [thresholds[i] for i in survivors] if thresholds is not None else None
+        children_scores[survivors] = self.evaluate(self.decode(children[survivors]), survivor_thresholds)
+        self.rungs.append({"fidelity": 1.0, "evaluated": len(survivors), "promoted": len(survivors)})
+        return children_scores
+
+    def offspring(self, population, scores, parents, fscale, cp):
+        """
+        Creates a child for each given parent. If a surrogate is used, several candidate children are bred for each parent and the one with the highest expected improvement is kept. Candidates of a parent share its scaling factor and crossover probability.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :param parents: A NumpyArray of indices of parents in population.
+        :type parents: NumpyArray
+
+        :param fscale: A NumpyArray of scaling factors, one per parent.
+        :type fscale: NumpyArray
+
+        :param cp: A NumpyArray of crossover probabilities, one per parent.
+        :type cp: NumpyArray
 
+        :return: A matrix of children, one row per parent.
+        :rtype: NumpyArray
+        """
+        if self.surrogate is None or self.surrogate_candidates <= 1 or not self.surrogate.ready():
+            return self.breed(population, scores, parents, fscale, cp)
+        candidates = self.breed(population, scores, np.repeat(parents, self.surrogate_candidates),
+                                np.repeat(fscale, self.surrogate_candidates), np.repeat(cp, self.surrogate_candidates))
+        candidates = candidates.reshape(len(parents), self.surrogate_candidates, self.space.dim)
+        best = scores.max() if self.gp["direction"] == "max" else scores.min()
+        return self.surrogate.screen(candidates, best, int(self.rng.integers(2 ** 31 - 1)))
+
+    def breed(self, population, scores, parents, fscale, cp):
+        """
+        Creates a child for each given parent, from a trial individual of the mutation strategy and the parent.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :param parents: A NumpyArray of indices of parents in population.
+        :type parents: NumpyArray
+
+        :param fscale: A NumpyArray of scaling factors, one per parent.
+        :type fscale: NumpyArray
+
+        :param cp: A NumpyArray of crossover probabilities, one per parent.
+        :type cp: NumpyArray
+
+        :return: A matrix of children, one row per parent.
+        :rtype: NumpyArray
+        """
+        n = self.gp["pop_size"]
+
+        # for each parent, select different donors (different from parent) by ranking random keys of the other
+        # individuals, and shifting indices from the parent on by one, so any other individual can be a donor
+        keys = self.rng.random((len(parents), n - 1))
+        chosen = np.argsort(keys, axis=1)[:, :GA.strategies[self.strategy]]
+        chosen += chosen >= parents[:, None]
+        donors = population[chosen]
+
+        # generate trial individuals by adding differences between hyperparameters of pairs of individuals,
+        # multiplied by the scaling factor, to a base individual of the strategy.
+        # If the trial parameter is out of bounds, clip it to the nearest bound.
+        current = population[parents]
+        best = population[np.argmax(scores) if self.gp["direction"] == "max" else np.argmin(scores)]
+        if self.strategy == "rand/1":
+            base, pairs = donors[:, 0], [(donors[:, 1], donors[:, 2])]
+        elif self.strategy == "rand/2":
+            base, pairs = donors[:, 0], [(donors[:, 1], donors[:, 2]), (donors[:, 3], donors[:, 4])]
+        elif self.strategy == "best/1":
+            base, pairs = best, [(donors[:, 0], donors[:, 1])]
+        else:
+            if self.strategy == "current-to-pbest/1":
+                order = np.argsort(-scores if self.gp["direction"] == "max" else scores, kind="stable")
+                top = order[:max(int(round(GA.pbest_rate * n)), 1)]
+                best = population[top[self.rng.integers(len(top), size=len(parents))]]
+            base, pairs = current, [(best, current), (donors[:, 0], donors[:, 1])]
+        trials = base + sum(fscale[:, None] * (a - b) for a, b in pairs)
+        if self.space.cat_mask.any():
+            trials[:, self.space.cat_mask] = self.categorical_trials(base, pairs, fscale)
+        trials = self.space.clip(trials)
+        return self.recombination(current, trials, cp)
+
+    def categorical_trials(self, base, pairs, fscale):
+        """
+        Creates categorical hyperparameters of trial individuals. Differences of choices have no meaning, so a trial keeps the choice of its base individual, and where individuals of a pair disagree, it takes a random choice with probability fscale.
+
+        :param base: A matrix of base individuals of the strategy, or a single base individual.
+        :type base: NumpyArray
+
+        :param pairs: A list of pairs of matrices of individuals whose differences are added to the base.
+        :type pairs: list
+
+        :param fscale: A NumpyArray of scaling factors, one per trial individual.
+        :type fscale: NumpyArray
+
+        :return: A matrix of indices of choices, one row per trial individual and one column per categorical hyperparameter.
+        :rtype: NumpyArray
+        """
+        cat = self.space.cat_mask
+        shape = (len(fscale), self.space.dim)
+        keep = np.broadcast_to(base, shape)[:, cat]
+        differ = np.any([np.broadcast_to(a, shape)[:, cat] != np.broadcast_to(b, shape)[:, cat] for a, b in pairs],
+                        axis=0)
+        switch = differ & (self.rng.random(keep.shape) < np.minimum(fscale, 1.0)[:, None])
+        random_choices = np.floor(self.rng.random(keep.shape) * (self.space.upper[cat] + 1))
+        return np.where(switch, random_choices, keep)
+
+    def recombination(self, population, trials, cp):
+        """
+        Recombine parents and trial individuals to create children.
+
+        :param population: A matrix of parent individuals.
+        :type population: NumpyArray
+
+        :param trials: A matrix of trial individuals.
+        :type trials: NumpyArray
+
+        :param cp: A NumpyArray of crossover probabilities, one per parent.
+        :type cp: NumpyArray
+
+        :return: A matrix of children.
+        :rtype: NumpyArray
+        """
+        mask = self.rng.random(population.shape) < cp[:, None]
+        return np.where(mask, trials, population)
+
+    def selection(self, population, scores, children, children_scores):
+        """
+        Decides child or parent should be returned to population based on their score.
+
+        :param population: A matrix of parent individuals.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of parents.
+        :type scores: NumpyArray
+
+        :param children: A matrix of children.
+        :type children: NumpyArray
+
+        :param children_scores: A NumpyArray of scores of children.
+        :type children_scores: NumpyArray
+
+        :return: population matrix and scores of individuals that stay in population.
+        :rtype: tuple
+        """
+        better = self.improves(children_scores, scores)
+        population = np.where(better[:, None], children, population)
+        scores = np.where(better, children_scores, scores)
+        return population, scores
+
+    def pareto_selection(self, population, scores, children, children_scores, children_costs):
+        """
+        Merges parents and children, and keeps pop_size of them by non-dominated sorting and crowding distance, so a child survives if it is a better trade-off between score and objectives than other individuals, not only better than its parent.
+
+        :param population: A matrix of parent individuals.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of parents.
+        :type scores: NumpyArray
+
+        :param children: A matrix of children.
+        :type children: NumpyArray
+
+        :param children_scores: A NumpyArray of scores of children.
+        :type children_scores: NumpyArray
+
+        :param children_costs: A matrix of values of objectives of children.
+        :type children_costs: NumpyArray
+
+        :return: population matrix and scores of individuals that stay in population.
+        :rtype: tuple
+        """
+        population = np.vstack([population, children])
+        scores = np.concatenate([scores, children_scores])
+        costs = np.vstack([self.costs, children_costs])
+        keep = self.survivors(scores, costs, self.gp["pop_size"])
+        self.costs = costs[keep]
+        return population[keep], scores[keep]
+
+    def improves(self, child_score, parent_score):
+        """
+        Checks whether a child is at least as good as its parent. Works element-wise on NumpyArrays of scores.
+
+        :param child_score: score of child.
+        :param parent_score: score of parent.
+
+        :return: A bool determining whether child replaces parent.
+        """
         if self.gp["direction"] == "min":
-            if child["score"] <= parent["score"]:
-                return child
-            else:
-                return parent
-        if self.gp["direction"] == "max":
-            if child["score"] >= parent["score"]:
-                return child
-            else:
-                return parent
+            return child_score <= parent_score
+        return child_score >= parent_score
 
-    def stop(self, scores):
+    def stop(self, population, scores):
         """
-        Checks if max score is reached the specified stop_value
+        Checks stop criteria, and keeps the reason of the first one that is met in stop_reason.
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
 
         :param scores: A NumpyArray of scores obtained for the individuals in the current generation.
         :type scores: NumpyArray
 
         :return: A bool determining whether of algorithm should stop or not
         """
-        if self.gp["direction"] == "max":
-            if max(scores) > self.stop_value:
-                return True
-        if self.gp["direction"] == "min":
-            if max(scores) < self.stop_value:
+        for stopper in self.stoppers:
+            reason = stopper.check(self, population, scores)
+            if reason is not None:
+                self.stop_reason = reason
                 return True
-
         return False
 
-    def reporting(self, scores, vectors):
+    def elapsed(self):
+        """
+        Returns wall-clock seconds the optimization has been running, including time before it was resumed from a checkpoint.
+
+        :return: seconds of the run.
+        :rtype: float
+        """
+        return self.elapsed_before + time.time() - self.start_time
+
+    def reporting(self, scores, population, stats=None):
         """
         Reports information about the optimization progress based on the specified verbosity level and options.
 
         :param scores: A NumpyArray of scores obtained for the individuals in the current generation.
         :type scores: NumpyArray
 
-        :param vectors: A list of dictionaries containing the hyperparameters and corresponding scores of each individual in the population.
-        :type vectors: list
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param stats: aggregates of the generation. see :meth:`GA.generation_summary`. Default is None.
+        :type stats: dict
 
         :return: None
 
@@ -263,48 +946,383 @@ class GA:
         # Print verbose information based on verbosity level
         if self.verbosity >= 1:
             Reporting.verbose1(scores, self.s, self.best_params)
+            if self.cache is not None:
+                Reporting.cache(*self.cache.reset_counters())
+            raced, _ = self.evaluator.reset_counters()
+            if self.racing_bound is not None:
+                Reporting.racing(raced, self.gp["pop_size"])
+            if stats is not None and stats["timed_out"]:
+                Reporting.timeouts(stats["timed_out"], self.settings["timeout"])
+            if stats is not None and stats["rungs"]:
+                Reporting.fidelity(stats["rungs"])
+            if self.objectives:
+                Reporting.pareto(self.pareto_front, self.s, self.objectives)
         if self.verbosity >= 2:
+            if stats is not None:
+                Reporting.timing(stats)
+            vectors = self.vectors(population, scores)
             Reporting.verbose2(vectors)
-        if self.verbosity >= 3:
-            Reporting.verbose3(vectors, self.s)
+            if self.verbosity >= 3:
+                Reporting.verbose3(vectors, self.s)
 
         # Show progress plot if enabled
         if self.generation % self.plot_step == 0 and self.show_progress_plot:
             Visualize.progress_band(self.max_scores, self.min_scores, self.mean_scores, self.s)
 
-    def main(self):
+    def checkpoint_state(self, population, scores):
+        """
+        Collects everything that is needed to continue the optimization from the current generation.
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: state of the optimization.
+        :rtype: dict
+        """
+        return {"settings": self.settings, "generation": self.generation, "population": population,
+                "scores": scores, "max_scores": self.max_scores, "min_scores": self.min_scores,
+                "mean_scores": self.mean_scores, "best_params": self.best_params,
+                "generation_stats": self.generation_stats, "fits": self.fits, "elapsed": self.elapsed(),
+                "surrogate": self.surrogate.state() if self.surrogate is not None else None,
+                "random_state": self.rng.bit_generator.state, "folds_seed": self.scorer.folds.seed,
+                "folds_epoch": self.scorer.folds.epoch,
+                "cpu_split": self.cpu_budget.split if self.cpu_budget is not None else None,
+                "history": self.history.state() if self.history is not None else None,
+                "adaptation": self.adaptation.state() if self.adaptation is not None else None,
+                "costs": self.costs, "pareto_front": self.pareto_front,
+                "data_fingerprint": [FitnessCache.fingerprint(self.x_t), FitnessCache.fingerprint(self.y_t)]}
+
+    def restore(self, state):
+        """
+        Sets the state of the optimization from a checkpoint.
+
+        :param state: state of the optimization. see :meth:`GA.checkpoint_state`.
+        :type state: dict
+
+        :return: population matrix and scores of the checkpointed generation.
+        :rtype: tuple
+        """
+        self.generation = state["generation"]
+        self.max_scores = state["max_scores"]
+        self.min_scores = state["min_scores"]
+        self.mean_scores = state["mean_scores"]
+        self.best_params = state["best_params"]
+        self.generation_stats = state["generation_stats"]
+        self.fits = state["fits"]
+        self.elapsed_before = state["elapsed"]
+        self.start_time = time.time()
+        if self.surrogate is not None and state["surrogate"] is not None:
+            self.surrogate.restore(state["surrogate"])
+        self.rng.bit_generator.state = state["random_state"]
+        self.scorer.folds.seed = state["folds_seed"]
+        self.scorer.folds.set_epoch(state["folds_epoch"])
+        if self.cache is not None and self.scorer.folds.epoch > 0:
+            self.cache.context = self.cache_context + str(self.scorer.folds.epoch)
+        if self.cpu_budget is not None and state["cpu_split"] is not None:
+            self.cpu_budget.split = state["cpu_split"]
+            self.cpu_budget.allocated = True
+            self.evaluator.configure(*self.cpu_budget.split)
+        if self.history is not None and state["history"] is not None:
+            self.history.restore(state["history"])
+        if self.adaptation is not None and state["adaptation"] is not None:
+            self.adaptation.restore(state["adaptation"])
+        self.costs = state["costs"]
+        self.pareto_front = state["pareto_front"]
+        return state["population"], state["scores"]
+
+    def allocate_cpus(self):
+        """
+        Picks the split of the CPU budget from fit times measured so far, and reconfigures the evaluator if the split changed.
+
+        :return: None
+        """
+        if self.cpu_budget is None or self.cpu_budget.allocated:
+            return
+        split = self.cpu_budget.split
+        if self.cpu_budget.allocate() != split:
+            self.evaluator.configure(*self.cpu_budget.split)
+        if self.verbosity >= 1:
+            Reporting.cpu_split(self.cpu_budget.n_cpus, self.cpu_budget.split)
+
+    def checkpoint(self, population, scores):
+        """
+        Saves a checkpoint if checkpointing is enabled and enough generations or seconds have passed since the last one.
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: None
+        """
+        if self.checkpoint_path is None:
+            return
+        due = self.checkpoint_every is not None and self.generation % self.checkpoint_every == 0
+        if self.checkpoint_seconds is not None and time.time() - self.last_checkpoint >= self.checkpoint_seconds:
+            due = True
+        if due:
+            if self.history is not None:
+                self.history.flush()
+            Checkpoint.save(self.checkpoint_state(population, scores), self.checkpoint_path)
+            self.last_checkpoint = time.time()
+
+    def main(self, state=None):
         """
         The main function is the core of the differential evolution algorithm. It initializes the population and performs mutations in each generation, and returns the best parameter set found during the search.
 
-        :return: a dict containing best hyperparameters.
+        :param state: state of a previous optimization to continue from, instead of initializing a new population. see :meth:`GA.checkpoint_state`. Default is None.
+        :type state: dict
+
+        :return: a dict containing best hyperparameters, or, if objectives are given, the Pareto front. see :meth:`GA.front`.
 
         """
-        # initiate the first population
-        vectors = self.initiation()
+        failed = True
+        try:
+            best_params = self._run(state)
+            if self.stop_reason is None:
+                self.stop_reason = "maximum number of generations reached"
+            if self.verbosity >= 1:
+                Reporting.stopped(self.stop_reason)
+            failed = False
+            if self.objectives:
+                return self.pareto_front
+            return best_params
+        finally:
+            self.evaluator.close()
+            if self.show_progress_plot:
+                Visualize.close_progress_band()
+            self.run_end_callbacks(raise_error=not failed)
+
+    def run_end_callbacks(self, raise_error=True):
+        """
+        Notifies callbacks that the run ended. Every callback is notified even if an earlier one fails, so the history is still flushed when a metrics sink failed.
+
+        :param raise_error: Whether the first error of a callback, during the run or when it ended, is raised after all callbacks were notified. False while the run itself is failing, so its exception is not replaced. Default is True.
+        :type raise_error: bool
+
+        :return: None
+        """
+        error = self.evaluator.callback_error
+        for callback in self.callbacks:
+            try:
+                callback.on_run_end()
+            except Exception as e:
+                error = error or e
+        if error is not None and raise_error:
+            raise error
+
+    def _run(self, state=None):
+        """
+        Runs generations of the algorithm until max generation number or stop value is reached.
+
+        :param state: state of a previous optimization to continue from. Default is None.
+        :type state: dict
+
+        :return: a dict containing best hyperparameters.
+        """
+        if state is None:
+            # initiate the first population
+            population, scores = self.initiation()
+            stats = self.generation_summary()
+            stats.update(self.score_summary(population, scores))
+            # the initial population is not reported
+            stats["report_time"] = 0.0
+            self.generation_end_callbacks(stats)
+            self.allocate_cpus()
+            self.checkpoint(population, scores)
+        else:
+            population, scores = self.restore(state)
+        if self.mode == "steady_state":
+            return self._run_steady_state(population, scores)
+
         # while max generation number is not reached
         while self.generation < self.gp["gmax"]:
 
             print("\nGeneration " + str(self.generation))
-            scores = np.zeros(self.gp["pop_size"])
             self.generation += 1
 
+            # score the population on new folds if it is time to change them
+            if self.cv_refresh is not None and (self.generation - 1) % self.cv_refresh == 0:
+                scores = self.refresh_folds(population)
+
             # mutate the individual
-            vectors = self.mutation(vectors)
-            for j in range(len(vectors)):
-                scores[j] = vectors[j]['score']
-
-            # determine best params
-            if self.gp["direction"] == "max":
-                self.best_params = vectors[list(scores).index(max(scores))]["params"]
-            if self.gp["direction"] == "min":
-                self.best_params = vectors[list(scores).index(min(scores))]["params"]
-
-            # calculate max,mean and min of scores
-            self.max_scores.append(max(scores))
-            self.min_scores.append(min(scores))
-            self.mean_scores.append(scores.mean())
-            self.reporting(scores, vectors)
-            if self.stop_criteria:
-                if self.stop(scores):
-                    break
+            population, scores = self.mutation(population, scores)
+            if self.end_generation(population, scores):
+                break
+        return self.best_params
+
+    def _run_steady_state(self, population, scores):
+        """
+        Runs the asynchronous steady-state variant of the algorithm. A child is created and dispatched as soon as a worker is free, and replaces its parent as soon as its evaluation is done, so workers never wait for the slowest evaluation of a generation. Every pop_size done evaluations count as a generation for reporting, checkpoints and stop criteria.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: a dict containing best hyperparameters.
+        """
+        n = self.gp["pop_size"]
+        budget = (self.gp["gmax"] - self.generation) * n
+        submitted = 0
+        done = 0
+        next_parent = 0
+        # folds change before the same generations as in generational mode
+        refresh = self.cv_refresh is not None and self.generation % self.cv_refresh == 0
+        # futures of running evaluations, and their parent index, child, scaling factor and crossover probability
+        running = {}
+        print("\nGeneration " + str(self.generation))
+        while running or submitted < budget:
+            # keep every worker busy, with at most one running child per parent
+            while not refresh and submitted < budget and len(running) < min(self.evaluator.capacity(), n):
+                busy = {i for i, _, _, _ in running.values()}
+                while next_parent in busy:
+                    next_parent = (next_parent + 1) % n
+                i = next_parent
+                next_parent = (next_parent + 1) % n
+                fscale, cp = self.controls(1)
+                child = self.offspring(population, scores, np.array([i]), fscale, cp)[0]
+                threshold = scores[i] if self.racing_bound is not None else None
+                running[self.evaluator.submit(self.space.decode(child), threshold)] = (i, child, fscale, cp)
+                submitted += 1
+
+            # running children were scored on old folds, so folds change once all of them are done
+            if not running:
+                scores = self.refresh_folds(population)
+                refresh = False
+                continue
+
+            start = time.perf_counter()
+            finished = self.evaluator.wait(list(running.keys()))
+            self.eval_seconds += time.perf_counter() - start
+            for future, score in finished.items():
+                i, child, fscale, cp = running.pop(future)
+                self.adapt(scores[i:i + 1], np.array([score], dtype=float), fscale, cp)
+                if self.improves(score, scores[i]):
+                    population[i] = child
+                    scores[i] = score
+                done += 1
+                if self.verbosity >= 1:
+                    Reporting.progress(done % n if done % n else n, n)
+                if done % n == 0:
+                    self.generation += 1
+                    if self.end_generation(population, scores):
+                        return self.best_params
+                    if self.generation < self.gp["gmax"]:
+                        print("\nGeneration " + str(self.generation))
+                        refresh = self.cv_refresh is not None and self.generation % self.cv_refresh == 0
         return self.best_params
+
+    def end_generation(self, population, scores):
+        """
+        Updates best params and score history at the end of a generation, reports progress, saves a checkpoint if due and checks stop criteria.
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: A bool determining whether of algorithm should stop or not
+        """
+        # determine best params
+        if self.gp["direction"] == "max":
+            self.best_params = self.space.decode(population[np.argmax(scores)])
+        if self.gp["direction"] == "min":
+            self.best_params = self.space.decode(population[np.argmin(scores)])
+
+        # calculate max,mean and min of scores
+        self.max_scores.append(scores.max())
+        self.min_scores.append(scores.min())
+        self.mean_scores.append(scores.mean())
+        stats = self.generation_summary()
+        stats.update(self.score_summary(population, scores))
+        if self.objectives:
+            self.pareto_front = stats["pareto_front"]
+        if self.adaptation is not None:
+            self.adaptation.update()
+        report_start = time.perf_counter()
+        self.reporting(scores, population, stats)
+        stats["report_time"] = time.perf_counter() - report_start
+        self.checkpoint(population, scores)
+        self.generation_end_callbacks(stats)
+        return self.stop(population, scores)
+
+    def generation_summary(self):
+        """
+        Aggregates records of evaluations done since the last generation ended, and starts timing the next generation.
+
+        :return: A dictionary of aggregates: number of "evaluations", "cached" and "raced" individuals, number of model "fits" (one per cross validation fold), total and mean "fit_time" and "score_time", "mean_queue_wait", "max_queue_wait", "workers" that did evaluations, number of "timeouts" and the "timed_out" hyperparameters, mean "fscale" and "cp" children were bred with, seconds spent waiting for evaluations as "eval_wall", seconds spent fitting and querying the surrogate as "surrogate_time", "wall" time of the generation, "ga_overhead", the part of wall time spent outside evaluation, and "rungs", the number of children evaluated and promoted at each fidelity.
+        :rtype: dict
+        """
+        records = self.evaluator.drain_records()
+        evaluated = [r for r in records if not r["cached"]]
+        now = time.perf_counter()
+        wall = now - self.generation_start
+        fit_time = float(sum(r["fit_time"] for r in evaluated))
+        score_time = float(sum(r["score_time"] for r in evaluated))
+        queue_waits = [r["queue_wait"] for r in evaluated]
+        fits = sum(r["folds"] for r in evaluated)
+        self.fits += fits
+        stats = {"generation": self.generation, "evaluations": len(evaluated), "cached": len(records) - len(evaluated),
+                 "raced": sum(1 for r in evaluated if not r["complete"] and not r["timed_out"]), "fits": fits,
+                 "fit_time": fit_time, "mean_fit_time": fit_time / len(evaluated) if evaluated else 0.0,
+                 "score_time": score_time, "mean_score_time": score_time / len(evaluated) if evaluated else 0.0,
+                 "mean_queue_wait": float(np.mean(queue_waits)) if queue_waits else 0.0,
+                 "max_queue_wait": float(max(queue_waits)) if queue_waits else 0.0,
+                 "workers": len({r["worker"] for r in evaluated}),
+                 "timeouts": sum(1 for r in evaluated if r["timed_out"]),
+                 "timed_out": [r["params"] for r in evaluated if r["timed_out"]],
+                 "fscale": self.adaptation.means()[0] if self.adaptation is not None else self.gp["fscale"],
+                 "cp": self.adaptation.means()[1] if self.adaptation is not None else self.gp["cp"],
+                 "eval_wall": self.eval_seconds, "wall": wall,
+                 "surrogate_time": self.surrogate.fit_time if self.surrogate is not None else 0.0,
+                 "ga_overhead": max(wall - self.eval_seconds, 0.0), "rungs": self.rungs}
+        self.rungs = []
+        if self.surrogate is not None:
+            self.surrogate.fit_time = 0.0
+        self.generation_start = now
+        self.eval_seconds = 0.0
+        self.generation_stats.append(stats)
+        return stats
+
+    def score_summary(self, population, scores):
+        """
+        Aggregates scores of a generation, for callbacks and metrics sinks.
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: A dictionary of "max_score", "min_score", "mean_score" and "best_params", the hyperparameters of the best individual, and if objectives are given "pareto_front". see :meth:`GA.front`.
+        :rtype: dict
+        """
+        best = np.argmax(scores) if self.gp["direction"] == "max" else np.argmin(scores)
+        summary = {"max_score": float(scores.max()), "min_score": float(scores.min()),
+                   "mean_score": float(scores.mean()), "best_params": self.space.decode(population[best])}
+        if self.objectives:
+            summary["pareto_front"] = self.front(population, scores)
+        return summary
+
+    def generation_end_callbacks(self, stats):
+        """
+        Notifies callbacks that a generation ended.
+
+        :param stats: aggregates of the generation. see :meth:`GA.generation_summary`.
+        :type stats: dict
+
+        :return: None
+        """
+        for callback in self.callbacks:
+            try:
+                callback.on_generation_end(self.generation, stats)
+            except Exception as e:
+                # like failing metrics sinks, a failing callback does not stop the optimization
+                self.evaluator.callback_error = self.evaluator.callback_error or e
@@ -0,0 +1,278 @@
+import json
+import os
+import sqlite3
+import numpy as np
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.checkpoint import Checkpoint
+from ga_hypertuner.exceptions import GaHypertunerParamException
+
+
+class History(Callback):
+    """
+    Append-only history of every evaluation of an optimization. Each evaluation is a row of a NumPy structured array holding the generation, the optimized hyperparameters as a numeric vector, the score, the score of each fold (nan for folds that were not evaluated), timings, size of fitted models, fidelity and whether the evaluation was cached, complete or timed out.
+
+    Rows are stored in chunks of fixed size, so an append never copies earlier rows. Chunks are held in memory, or, if a path is given, are slices of a memory-mapped file, so resident memory of a long run stays bounded and the history can be loaded after the run with :meth:`History.load`.
+
+    :param space: search space of the optimization, used to encode and decode hyperparameters.
+    :type space: SearchSpace
+
+    :param k: Number of cross validation folds.
+    :type k: int
+
+    :param direction: Whether scores are maximized or minimized. Accepted values are "max" and "min". Default is "max".
+    :type direction: str
+
+    :param path: If given, path of the memory-mapped file rows are stored in. A file with the same path and ".meta" added holds what is needed to load it. Default is None, rows are kept in memory.
+    :type path: str
+
+    :param chunk_size: Number of rows of each chunk. Default is 4096.
+    :type chunk_size: int
+
+    :ivar generation: generation evaluations are attributed to, numbered like :attr:`GA.generation`, so evaluations of the initial population are generation 1.
+    """
+    # columns of the history, in addition to fold scores and hyperparameters
+    columns = ["generation", "score", "folds", "fit_time", "score_time", "model_size", "queue_wait", "start", "end",
+               "fidelity", "cached", "complete", "timed_out"]
+
+    def __init__(self, space, k: int, direction: str = "max", path: str = None, chunk_size: int = 4096):
+        self.space = space
+        self.k = k
+        self.direction = direction
+        self.path = path
+        self.chunk_size = chunk_size
+        self.dtype = np.dtype([("generation", "i4"), ("score", "f8"), ("folds", "i2"), ("fit_time", "f8"),
+                               ("score_time", "f8"), ("model_size", "f8"), ("queue_wait", "f8"), ("start", "f8"),
+                               ("end", "f8"), ("fidelity", "f4"), ("cached", "?"), ("complete", "?"), ("timed_out", "?"),
+                               ("fold_scores", "f8", (k,)), ("params", "f8", (space.dim,))])
+        self.chunks = []
+        self.count = 0
+        self.generation = 1
+        # first row of each generation, rows of a generation are contiguous since generations only increase
+        self.generation_starts = {}
+        # a new history replaces the file on its first append, a restored one continues it
+        self.fresh = True
+
+    def _new_chunk(self):
+        """
+        Allocates the next chunk, growing the file if the history is memory-mapped.
+
+        :return: A structured array of chunk_size rows.
+        :rtype: NumpyArray
+        """
+        if self.path is None:
+            return np.zeros(self.chunk_size, dtype=self.dtype)
+        chunk_bytes = self.chunk_size * self.dtype.itemsize
+        with open(self.path, "wb" if self.fresh else "r+b") as f:
+            if os.fstat(f.fileno()).st_size < (len(self.chunks) + 1) * chunk_bytes:
+                f.truncate((len(self.chunks) + 1) * chunk_bytes)
+        self.fresh = False
+        return np.memmap(self.path, dtype=self.dtype, mode="r+", offset=len(self.chunks) * chunk_bytes,
+                         shape=(self.chunk_size,))
+
+    def append(self, record):
+        """
+        Appends an evaluation to the history.
+
+        :param record: record of the evaluation. see :meth:`Callback.on_eval_end`.
+        :type record: dict
+
+        :return: None
+        """
+        index, i = divmod(self.count, self.chunk_size)
+        if index == len(self.chunks):
+            self.chunks.append(self._new_chunk())
+        row = self.chunks[index][i]
+        row["generation"] = self.generation
+        for column in History.columns[1:]:
+            row[column] = record[column]
+        fold_scores = np.full(self.k, np.nan)
+        fold_scores[:len(record["fold_scores"])] = record["fold_scores"]
+        row["fold_scores"] = fold_scores
+        row["params"] = self.space.encode(record["params"])
+        self.generation_starts.setdefault(self.generation, self.count)
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def table(self, start: int = 0, stop: int = None):
+        """
+        Returns a copy of a range of rows.
+
+        :param start: first row. Default is 0.
+        :type start: int
+
+        :param stop: row after the last one. Default is None, the end of the history.
+        :type stop: int
+
+        :return: A structured array of rows.
+        :rtype: NumpyArray
+        """
+        stop = self.count if stop is None else min(stop, self.count)
+        parts = []
+        for index in range(start // self.chunk_size, (stop - 1) // self.chunk_size + 1 if stop > start else 0):
+            offset = index * self.chunk_size
+            parts.append(self.chunks[index][max(start - offset, 0):min(stop - offset, self.chunk_size)])
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=self.dtype)
+
+    def generation_rows(self, generation: int):
+        """
+        Returns rows of a generation. The initial population is generation 1.
+
+        :param generation: number of the generation.
+        :type generation: int
+
+        :return: A structured array of rows.
+        :rtype: NumpyArray
+        """
+        if generation not in self.generation_starts:
+            return np.zeros(0, dtype=self.dtype)
+        later = [s for g, s in self.generation_starts.items() if g > generation]
+        return self.table(self.generation_starts[generation], min(later) if later else None)
+
+    def top(self, n: int = 10):
+        """
+        Returns the best evaluations. Only complete, full fidelity evaluations that were not cached are ranked, so each evaluation appears once and partial scores are not compared with full ones. Chunks are ranked one at a time, so memory use does not grow with the history.
+
+        :param n: number of evaluations. Default is 10.
+        :type n: int
+
+        :return: A structured array of rows, best first.
+        :rtype: NumpyArray
+        """
+        best = np.zeros(0, dtype=self.dtype)
+        for index in range(len(self.chunks)):
+            chunk = self.table(index * self.chunk_size, (index + 1) * self.chunk_size)
+            chunk = chunk[chunk["complete"] & ~chunk["cached"] & (chunk["fidelity"] >= 1.0)]
+            best = np.concatenate([best, chunk])
+            keys = -best["score"] if self.direction == "max" else best["score"]
+            best = best[np.argsort(keys, kind="stable")[:n]]
+        return best
+
+    def params(self, rows):
+        """
+        Decodes hyperparameters of rows to model parameters.
+
+        :param rows: A structured array of rows.
+        :type rows: NumpyArray
+
+        :return: A list of dictionaries of hyperparameters, including static hyperparameters.
+        :rtype: list
+        """
+        return [self.space.decode(row["params"]) for row in rows]
+
+    def to_sqlite(self, path: str, table: str = "evaluations"):
+        """
+        Exports the history to a SQLite table, with a column for each column of the history and each hyperparameter, and fold scores as a JSON list. An existing table of the same name is replaced.
+
+        :param path: Path of the SQLite database.
+        :type path: str
+
+        :param table: Name of the table, a Python identifier. Default is "evaluations".
+        :type table: str
+
+        :return: None
+        """
+        # the name is part of the statements, so it is restricted to names that can not break out of the quotes
+        if type(table) != str or not table.isidentifier():
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "table",
+                                             "identifiers, like evaluations")
+        names = History.columns + ["fold_scores"] + self.space.names
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute('DROP TABLE IF EXISTS "' + table + '"')
+                connection.execute('CREATE TABLE "' + table + '" (' + ", ".join('"' + n + '"' for n in names) + ")")
+                insert = 'INSERT INTO "' + table + '" VALUES (' + ", ".join("?" * len(names)) + ")"
+                for index in range(len(self.chunks)):
+                    rows = self.table(index * self.chunk_size, (index + 1) * self.chunk_size)
+                    connection.executemany(insert, (
+                        [row[c].item() for c in History.columns] +
+                        [json.dumps([None if np.isnan(s) else float(s) for s in row["fold_scores"]])] +
+                        [v if isinstance(v, (int, float, str)) or v is None else str(v)
+                         for v in self.space.decode(row["params"]).values()]
+                        for row in rows))
+        finally:
+            connection.close()
+
+    def flush(self):
+        """
+        Writes memory-mapped rows and the metadata of the history to disk. Does nothing for a history kept in memory.
+
+        :return: None
+        """
+        if self.path is None:
+            return
+        for chunk in self.chunks:
+            chunk.flush()
+        Checkpoint.save({"space": self.space, "k": self.k, "direction": self.direction,
+                         "chunk_size": self.chunk_size, "count": self.count}, self.path + ".meta")
+
+    def state(self):
+        """
+        Collects what is needed to continue the history from a checkpoint. A memory-mapped history only needs its number of rows, a history kept in memory needs its rows.
+
+        :return: state of the history.
+        :rtype: dict
+        """
+        return {"count": self.count, "rows": self.table() if self.path is None else None}
+
+    def restore(self, state):
+        """
+        Continues the history from a checkpoint. Rows of a memory-mapped history appended after the checkpoint are dropped, since the evaluations they record are done again. Evaluations are attributed to the generation after the last recorded one.
+
+        :param state: state of the history. see :meth:`History.state`.
+        :type state: dict
+
+        :return: None
+        """
+        self.chunks = []
+        self.count = 0
+        self.generation_starts = {}
+        if self.path is None:
+            rows = state["rows"]
+            for start in range(0, len(rows), self.chunk_size):
+                chunk = np.zeros(self.chunk_size, dtype=self.dtype)
+                part = rows[start:start + self.chunk_size]
+                chunk[:len(part)] = part
+                self.chunks.append(chunk)
+        else:
+            n_chunks = -(-state["count"] // self.chunk_size)
+            self.fresh = not os.path.exists(self.path)
+            if not self.fresh:
+                with open(self.path, "r+b") as f:
+                    f.truncate(n_chunks * self.chunk_size * self.dtype.itemsize)
+            for _ in range(n_chunks):
+                self.chunks.append(self._new_chunk())
+        self.count = state["count"]
+        generations = self.table()["generation"]
+        for g in np.unique(generations):
+            self.generation_starts[int(g)] = int(np.searchsorted(generations, g))
+        self.generation = int(generations[-1]) + 1 if self.count else 1
+
+    @staticmethod
+    def load(path: str):
+        """
+        Loads a memory-mapped history written by an optimization, for analysis or to start another optimization from it.
+
+        :param path: Path of the history file.
+        :type path: str
+
+        :return: the history.
+        :rtype: History
+        """
+        meta = Checkpoint.load(path + ".meta")
+        history = History(meta["space"], meta["k"], direction=meta["direction"], path=path,
+                          chunk_size=meta["chunk_size"])
+        history.restore({"count": meta["count"], "rows": None})
+        return history
+
+    def on_eval_end(self, record):
+        self.append(record)
+
+    def on_generation_end(self, generation, stats):
+        self.generation = generation + 1
+        self.flush()
+
+    def on_run_end(self):
+        self.flush()
@@ -0,0 +1,277 @@
+import multiprocessing
+import os
+import sys
+import traceback
+import numpy as np
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.ga import GA
+from ga_hypertuner.reporting import Reporting
+
+
+def _run_island(index, settings, x_train, y_train, inboxes, outboxes, migration_interval, migration_size, results,
+                silent, forward):
+    """
+    Runs an island in its own process, and puts its result or the traceback of its failure in results queue. Neighbors are always told that the island is done, so they never wait for migrants it will not send.
+
+    :return: None
+    """
+    try:
+        if silent:
+            sys.stdout = open(os.devnull, "w")
+        # callbacks of the driver do not run in island processes, events are sent back to them instead
+        settings = dict(settings, callbacks=[_Forward(index, results)] if forward else None)
+        island = Island(index, inboxes, outboxes, migration_interval, migration_size, x_train=x_train,
+                        y_train=y_train, **settings)
+        best_params = island.main()
+        # best params are the best individual of the last generation
+        best_score = island.max_scores[-1] if island.gp["direction"] == "max" else island.min_scores[-1]
+        results.put(("result", index, {"best_params": best_params, "best_score": best_score,
+                                       "generation": island.generation, "stop_reason": island.stop_reason,
+                                       "max_scores": island.max_scores, "min_scores": island.min_scores,
+                                       "mean_scores": island.mean_scores, "fits": island.fits}))
+    except BaseException:
+        results.put(("error", index, traceback.format_exc()))
+    finally:
+        for outbox in outboxes.values():
+            outbox.put(None)
+
+
+class _Forward(Callback):
+    """
+    Callback of an island process, that sends events of the island to the driver through the results queue, where they are passed to callbacks of the driver. Records and aggregates are tagged with the index of the island as "island". The end of the run is not forwarded, the driver notifies its callbacks once all islands stopped.
+
+    :param index: number of the island.
+    :type index: int
+
+    :param queue: results queue of the driver.
+    """
+
+    def __init__(self, index, queue):
+        self.index = index
+        self.queue = queue
+
+    def on_eval_start(self, params):
+        self.queue.put(("event", self.index, ("on_eval_start", (params,))))
+
+    def on_eval_end(self, record):
+        self.queue.put(("event", self.index, ("on_eval_end", (dict(record, island=self.index),))))
+
+    def on_generation_end(self, generation, stats):
+        self.queue.put(("event", self.index, ("on_generation_end", (generation, dict(stats, island=self.index)))))
+
+
+class Island(GA):
+    """
+    A population of the island model. An island runs the differential evolution algorithm like :class:`GA`, and every migration_interval generations sends copies of its best individuals to its neighbors, and replaces its worst individuals with better individuals received from them.
+
+    All islands use the same cross validation folds, so scores of migrants are comparable with scores of the individuals they replace, but each island draws its own random numbers.
+
+    :param index: number of the island.
+    :type index: int
+
+    :param inboxes: A dictionary of queues migrants are received from, by index of the sending island.
+    :type inboxes: dict
+
+    :param outboxes: A dictionary of queues migrants are sent to, by index of the receiving island.
+    :type outboxes: dict
+
+    :param migration_interval: Number of generations between migrations.
+    :type migration_interval: int
+
+    :param migration_size: Number of best individuals sent to each neighbor.
+    :type migration_size: int
+
+    Other parameters are the parameters of :class:`GA`.
+    """
+
+    def __init__(self, index, inboxes, outboxes, migration_interval, migration_size, **kwargs):
+        super().__init__(**kwargs)
+        self.index = index
+        self.inboxes = inboxes
+        self.outboxes = outboxes
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        # neighbors that are still running and sending migrants
+        self.senders = sorted(inboxes.keys())
+        self.rng = np.random.default_rng([self.settings["random_state"], index])
+
+    def end_generation(self, population, scores):
+        stop = super().end_generation(population, scores)
+        if not stop and self.generation % self.migration_interval == 0 and self.generation < self.gp["gmax"]:
+            self.migrate(population, scores)
+        return stop
+
+    def migrate(self, population, scores):
+        """
+        Sends best individuals to neighbors, waits for migrants of neighbors that are still running, and replaces worst individuals with migrants that are better than them. Population and scores are changed in place.
+
+        :param population: A matrix of individuals, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: None
+        """
+        # indices of individuals from best to worst
+        order = np.argsort(-scores if self.gp["direction"] == "max" else scores, kind="stable")
+        best = order[:self.migration_size]
+        for outbox in self.outboxes.values():
+            outbox.put((population[best].copy(), scores[best].copy()))
+
+        rows = []
+        migrant_scores = []
+        for sender in list(self.senders):
+            migrants = self.inboxes[sender].get()
+            if migrants is None:
+                self.senders.remove(sender)
+                continue
+            rows.append(migrants[0])
+            migrant_scores.append(migrants[1])
+        if not rows:
+            return
+        rows = np.vstack(rows)
+        migrant_scores = np.concatenate(migrant_scores)
+        migrant_order = np.argsort(-migrant_scores if self.gp["direction"] == "max" else migrant_scores,
+                                   kind="stable")
+        # best migrants replace worst individuals, as long as they are better
+        for migrant, i in zip(migrant_order, order[::-1]):
+            if not self.improves(migrant_scores[migrant], scores[i]):
+                break
+            population[i] = rows[migrant]
+            scores[i] = migrant_scores[migrant]
+
+
+class Archipelago:
+    """
+    Island model of the algorithm. Several populations evolve independently in separate processes, and periodically exchange their best individuals, which keeps diversity on multimodal search spaces and uses many cores with little synchronization. The result is the best individual found by any island.
+
+    Islands only wait for each other when they migrate. Progress of the first island is printed, other islands run silently. Callbacks stay in the driver process: events of islands are sent back to it and passed to callbacks as they arrive, with the index of the island as "island" in records and aggregates, and on_run_end is called once after all islands stopped.
+
+    :param settings: parameters of :class:`GA`, except training data.
+    :type settings: dict
+
+    :param x_train: Training features.
+    :type x_train: Dataframe
+
+    :param y_train: Training target.
+    :type y_train: Dataframe
+
+    :param n_islands: Number of islands.
+    :type n_islands: int
+
+    :param topology: Which islands exchange individuals. Accepted values are "ring", where each island sends migrants to the next one, and "full", where each island sends migrants to all others. Default is "ring".
+    :type topology: str
+
+    :param migration_interval: Number of generations between migrations. Default is 5.
+    :type migration_interval: int
+
+    :param migration_size: Number of best individuals each island sends to each neighbor. Default is 1.
+    :type migration_size: int
+
+    :param island_parameters: If given, a list with a dictionary for each island, whose values replace GA parameters of that island, for example {"fscale": 0.8, "cp": 0.2}. Default is None.
+    :type island_parameters: list
+
+    :ivar topologies: accepted values for topology.
+    :ivar results: A list with the result of each island, a dictionary containing "best_params", "best_score", "generation", "stop_reason", "max_scores", "min_scores", "mean_scores" and "fits".
+    """
+    topologies = ["ring", "full"]
+
+    def __init__(self, settings, x_train, y_train, n_islands: int, topology: str = "ring",
+                 migration_interval: int = 5, migration_size: int = 1, island_parameters: list = None):
+        self.settings = dict(settings)
+        self.callbacks = self.settings.pop("callbacks", None) or []
+        self.x_t = x_train
+        self.y_t = y_train
+        self.n_islands = n_islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.island_parameters = island_parameters if island_parameters is not None else [{}] * n_islands
+        if self.settings["random_state"] is None:
+            # islands share one seed, so they use the same cross validation folds
+            self.settings["random_state"] = int(np.random.randint(0, 2 ** 31 - 1))
+        if self.settings["cpu_budget"] is not None:
+            # islands run at the same time, so they share the budget
+            n_cpus = self.settings["cpu_budget"] if self.settings["cpu_budget"] != -1 else os.cpu_count() or 1
+            self.settings["cpu_budget"] = max(n_cpus // n_islands, 1)
+        self.results = []
+
+    def edges(self):
+        """
+        Lists pairs of islands that exchange individuals.
+
+        :return: A list of (sender, receiver) tuples.
+        :rtype: list
+        """
+        if self.topology == "full":
+            return [(i, j) for i in range(self.n_islands) for j in range(self.n_islands) if i != j]
+        return [(i, (i + 1) % self.n_islands) for i in range(self.n_islands)]
+
+    def main(self):
+        """
+        Runs all islands until they stop, and returns the best hyperparameters found by any of them.
+
+        :return: a dict containing best hyperparameters.
+        """
+        with multiprocessing.Manager() as manager:
+            queues = {edge: manager.Queue() for edge in self.edges()}
+            results = manager.Queue()
+            processes = []
+            for i in range(self.n_islands):
+                settings = dict(self.settings, ga_parameters=dict(self.settings["ga_parameters"],
+                                                                   **self.island_parameters[i]))
+                if settings["plot_path"] is not None:
+                    root, extension = os.path.splitext(settings["plot_path"])
+                    settings["plot_path"] = root + "_island" + str(i) + extension
+                if settings["history_path"] is not None:
+                    root, extension = os.path.splitext(settings["history_path"])
+                    settings["history_path"] = root + "_island" + str(i) + extension
+                inboxes = {src: q for (src, dst), q in queues.items() if dst == i}
+                outboxes = {dst: q for (src, dst), q in queues.items() if src == i}
+                process = multiprocessing.Process(target=_run_island, args=(
+                    i, settings, self.x_t, self.y_t, inboxes, outboxes, self.migration_interval, self.migration_size,
+                    results, i > 0, bool(self.callbacks)))
+                process.start()
+                processes.append(process)
+
+            self.results = [None] * self.n_islands
+            errors = []
+            callback_error = None
+            done = 0
+            while done < self.n_islands:
+                kind, index, payload = results.get()
+                if kind == "event":
+                    # a failing callback does not stop islands, its error is raised once they stopped
+                    name, args = payload
+                    for callback in self.callbacks:
+                        try:
+                            getattr(callback, name)(*args)
+                        except Exception as e:
+                            callback_error = callback_error or e
+                    continue
+                done += 1
+                if kind == "error":
+                    errors.append("Island " + str(index) + " failed:\n" + payload)
+                else:
+                    self.results[index] = payload
+            for process in processes:
+                process.join()
+        for callback in self.callbacks:
+            try:
+                callback.on_run_end()
+            except Exception as e:
+                callback_error = callback_error or e
+        if errors:
+            raise RuntimeError("\n".join(errors))
+        if callback_error is not None:
+            raise callback_error
+
+        finished = [r for r in self.results if r is not None]
+        if self.settings["ga_parameters"]["direction"] == "max":
+            best = max(finished, key=lambda r: r["best_score"])
+        else:
+            best = min(finished, key=lambda r: r["best_score"])
+        if self.settings["verbosity"] >= 1:
+            Reporting.islands(self.results, best)
+        return best["best_params"]
@@ -0,0 +1,282 @@
+import collections
+import csv
+import json
+import queue
+import threading
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.visualization import Visualize
+
+
+def _plain(value):
+    """
+    Converts values json can not encode, like numpy scalars and arrays.
+
+    :return: a value json can encode.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class MetricsSink:
+    """
+    Base class of destinations of metrics. Rows are written by the background thread of a :class:`MetricsReporter`, one at a time, so sinks do not need to be thread safe.
+    """
+
+    def write(self, kind, row):
+        """
+        Writes a row.
+
+        :param kind: kind of the row, "generation" or "evaluation".
+        :type kind: str
+
+        :param row: metrics of a generation, see :meth:`GA.generation_summary`, or record of an evaluation, see :meth:`Callback.on_eval_end`.
+        :type row: dict
+
+        :return: None
+        """
+
+    def flush(self):
+        """
+        Called when no more rows are waiting, so buffered rows reach their destination soon.
+
+        :return: None
+        """
+
+    def close(self):
+        """
+        Called once after the last row.
+
+        :return: None
+        """
+
+
+class JsonlSink(MetricsSink):
+    """
+    Appends rows to a file as JSON lines. Each line has the kind of the row as "kind".
+
+    :param path: Path of the file.
+    :type path: str
+
+    :param kinds: kinds of rows that are written. Default is None, all kinds.
+    :type kinds: list
+    """
+
+    def __init__(self, path, kinds: list = None):
+        self.path = path
+        self.kinds = kinds
+        self.file = open(path, "a")
+
+    def write(self, kind, row):
+        if self.kinds is None or kind in self.kinds:
+            self.file.write(json.dumps(dict(row, kind=kind), default=_plain) + "\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvSink(MetricsSink):
+    """
+    Writes rows of one kind to a CSV file. Columns are the keys of the first row, lists and dictionaries are written as JSON.
+
+    :param path: Path of the file.
+    :type path: str
+
+    :param kind: kind of rows that are written, "generation" or "evaluation". Default is "generation".
+    :type kind: str
+    """
+
+    def __init__(self, path, kind: str = "generation"):
+        self.path = path
+        self.kind = kind
+        self.file = open(path, "w", newline="")
+        self.writer = None
+
+    def write(self, kind, row):
+        if kind != self.kind:
+            return
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, fieldnames=list(row.keys()), extrasaction="ignore")
+            self.writer.writeheader()
+        self.writer.writerow({key: json.dumps(value, default=_plain) if isinstance(value, (list, dict)) else value
+                              for key, value in row.items()})
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class RingBufferSink(MetricsSink):
+    """
+    Keeps the last rows of each kind in memory, for dashboards and notebooks that poll metrics of a running optimization.
+
+    :param size: Number of rows kept of each kind. Default is 1000.
+    :type size: int
+    """
+
+    def __init__(self, size: int = 1000):
+        self.size = size
+        self.buffers = collections.defaultdict(lambda: collections.deque(maxlen=size))
+        self.lock = threading.Lock()
+
+    def write(self, kind, row):
+        with self.lock:
+            self.buffers[kind].append(row)
+
+    def rows(self, kind="generation"):
+        """
+        Returns kept rows of a kind, oldest first. Safe to call while the optimization is running.
+
+        :param kind: kind of rows. Default is "generation".
+        :type kind: str
+
+        :return: A list of rows.
+        :rtype: list
+        """
+        with self.lock:
+            return list(self.buffers[kind])
+
+
+class PlotSink(MetricsSink):
+    """
+    Renders the progress band of the optimization to an image file, see :meth:`Visualize.save_progress_band`. The file is replaced every plot_step generations and when the reporter is closed, so it always shows a complete plot.
+
+    :param path: Path of the image. Its extension selects the format, for example ".png" or ".svg".
+    :type path: str
+
+    :param score_name: Name of the score.
+    :type score_name: str
+
+    :param plot_step: Number of generations between renders. Default is 1.
+    :type plot_step: int
+    """
+
+    def __init__(self, path, score_name, plot_step: int = 1):
+        self.path = path
+        self.score_name = score_name
+        self.plot_step = plot_step
+        self.maxs = []
+        self.mins = []
+        self.means = []
+        self.rendered = 0
+
+    def write(self, kind, row):
+        if kind != "generation":
+            return
+        self.maxs.append(row["max_score"])
+        self.mins.append(row["min_score"])
+        self.means.append(row["mean_score"])
+        if row["generation"] % self.plot_step == 0:
+            self.render()
+
+    def render(self):
+        """
+        Renders the scores received so far, unless they were already rendered.
+
+        :return: None
+        """
+        if not self.maxs or self.rendered == len(self.maxs):
+            return
+        Visualize.save_progress_band(self.maxs, self.mins, self.means, self.score_name, self.path)
+        self.rendered = len(self.maxs)
+
+    def close(self):
+        self.render()
+
+
+class MetricsReporter(Callback):
+    """
+    Callback that streams metrics of generations and evaluations to sinks on a background thread, so writing files and rendering plots never delays the algorithm. Rows are copied into a bounded queue, and when sinks fall so far behind that the queue is full, new rows are dropped and counted instead of blocking.
+
+    The reporter is closed when the optimization ends, which writes the remaining rows and closes the sinks.
+
+    :param sinks: A list of :class:`MetricsSink` instances.
+    :type sinks: list
+
+    :param evaluations: Whether records of evaluations are streamed, in addition to metrics of generations. Default is True.
+    :type evaluations: bool
+
+    :param queue_size: Maximum number of rows waiting to be written. Default is 10000.
+    :type queue_size: int
+
+    :ivar dropped: number of rows dropped because the queue was full.
+    """
+
+    def __init__(self, sinks: list, evaluations: bool = True, queue_size: int = 10000):
+        self.sinks = list(sinks)
+        self.evaluations = evaluations
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.error = None
+        self.thread = threading.Thread(target=self._drain, name="ga_hypertuner-metrics", daemon=True)
+        self.thread.start()
+
+    def _drain(self):
+        """
+        Writes rows to sinks until the reporter is closed. A failing sink is reported when the reporter is closed, and does not stop the optimization.
+
+        :return: None
+        """
+        while True:
+            item = self.queue.get()
+            if item is not None:
+                try:
+                    for sink in self.sinks:
+                        sink.write(*item)
+                except Exception as e:
+                    self.error = self.error or e
+            if item is None or self.queue.empty():
+                for sink in self.sinks:
+                    try:
+                        sink.flush()
+                    except Exception as e:
+                        self.error = self.error or e
+            if item is None:
+                return
+
+    def put(self, kind, row):
+        """
+        Queues a row for sinks without waiting.
+
+        :param kind: kind of the row.
+        :type kind: str
+
+        :param row: the row.
+        :type row: dict
+
+        :return: None
+        """
+        try:
+            self.queue.put_nowait((kind, dict(row)))
+        except queue.Full:
+            self.dropped += 1
+
+    def on_eval_end(self, record):
+        if self.evaluations:
+            self.put("evaluation", record)
+
+    def on_generation_end(self, generation, stats):
+        self.put("generation", stats)
+
+    def on_run_end(self):
+        self.close()
+
+    def close(self):
+        """
+        Writes remaining rows and closes sinks. Closing a closed reporter does nothing.
+
+        :return: None
+        """
+        if not self.thread.is_alive():
+            return
+        self.queue.put(None)
+        self.thread.join()
+        for sink in self.sinks:
+            sink.close()
+        if self.error is not None:
+            raise RuntimeError("Writing metrics failed: " + repr(self.error)) from self.error
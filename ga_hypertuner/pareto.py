@@ -0,0 +1,126 @@
+import numpy as np
+
+
+class Pareto:
+    """
+    A class containing methods for multi-objective selection. Individuals are compared on a matrix of values that are all minimized, one row per individual and one column per objective. An individual dominates another if it is at least as good on every objective and better on at least one, and the Pareto front is the set of individuals no other individual dominates.
+
+    Selection follows NSGA-II: individuals are sorted into successive fronts, and the best fronts that fit are kept whole. Individuals of the front that does not fit are kept by crowding distance, so the kept part of the front stays spread out instead of clustering around one trade-off.
+
+    :ivar objectives: accepted objectives measured for each evaluation, in addition to the score. "fit_time" and "predict_time" are mean seconds of fitting and of scoring (predicting) one cross validation fold, "model_size" is the mean size of fitted models in bytes.
+    """
+    objectives = ["fit_time", "predict_time", "model_size"]
+
+    @staticmethod
+    def costs(record, objectives):
+        """
+        Extracts objectives of an evaluation from its record.
+
+        :param record: record of the evaluation. see :meth:`Callback.on_eval_end`.
+        :type record: dict
+
+        :param objectives: names of the objectives, values of :attr:`Pareto.objectives`.
+        :type objectives: list
+
+        :return: A list of values of objectives, in the order of objectives.
+        :rtype: list
+        """
+        folds = max(record["folds"], 1)
+        values = {"fit_time": record["fit_time"] / folds, "predict_time": record["score_time"] / folds,
+                  "model_size": record["model_size"]}
+        return [float(values[name]) for name in objectives]
+
+    @staticmethod
+    def finite(values):
+        """
+        Replaces nan and infinite values, like scores of failed or timed out evaluations, with a value worse than every finite value of their objective, so they are dominated instead of breaking comparisons.
+
+        :param values: A matrix of values to minimize, one row per individual.
+        :type values: NumpyArray
+
+        :return: A matrix of finite values.
+        :rtype: NumpyArray
+        """
+        values = np.array(values, dtype=float)
+        for j in range(values.shape[1]):
+            column = values[:, j]
+            bad = ~np.isfinite(column)
+            if bad.any():
+                worst = column[~bad].max() if (~bad).any() else 0.0
+                spread = column[~bad].max() - column[~bad].min() if (~bad).any() else 0.0
+                column[bad] = worst + max(spread, 1.0)
+        return values
+
+    @staticmethod
+    def non_dominated_sort(values):
+        """
+        Sorts individuals into fronts. The first front is the Pareto front, and each later front is the Pareto front of the individuals not in earlier fronts.
+
+        :param values: A matrix of values to minimize, one row per individual.
+        :type values: NumpyArray
+
+        :return: A list of NumpyArrays of indices of individuals, one per front, best front first.
+        :rtype: list
+        """
+        values = Pareto.finite(values)
+        # dominates[i, j] is True when individual i dominates individual j
+        dominates = (values[:, None, :] <= values[None, :, :]).all(axis=2) & \
+                    (values[:, None, :] < values[None, :, :]).any(axis=2)
+        dominated_by = dominates.sum(axis=0)
+        remaining = np.ones(len(values), dtype=bool)
+        fronts = []
+        while remaining.any():
+            front = np.flatnonzero(remaining & (dominated_by == 0))
+            fronts.append(front)
+            remaining[front] = False
+            dominated_by = dominated_by - dominates[front].sum(axis=0)
+        return fronts
+
+    @staticmethod
+    def crowding_distance(values):
+        """
+        Computes how isolated each individual of a front is: the sum over objectives of the distance between its two neighbors, relative to the range of the objective. Individuals at either end of an objective get an infinite distance, so the extremes of the front are always kept.
+
+        :param values: A matrix of values to minimize of individuals of a front, one row per individual.
+        :type values: NumpyArray
+
+        :return: A NumpyArray of crowding distances.
+        :rtype: NumpyArray
+        """
+        values = Pareto.finite(values)
+        n, m = values.shape
+        distance = np.zeros(n)
+        if n <= 2:
+            return np.full(n, np.inf)
+        for j in range(m):
+            order = np.argsort(values[:, j], kind="stable")
+            column = values[order, j]
+            distance[order[0]] = distance[order[-1]] = np.inf
+            spread = column[-1] - column[0]
+            if spread > 0:
+                distance[order[1:-1]] += (column[2:] - column[:-2]) / spread
+        return distance
+
+    @staticmethod
+    def select(values, n):
+        """
+        Picks the individuals that survive: whole fronts, best first, while they fit, then the least crowded individuals of the next front. Ties keep the order of individuals, so selection is deterministic.
+
+        :param values: A matrix of values to minimize, one row per individual.
+        :type values: NumpyArray
+
+        :param n: number of survivors.
+        :type n: int
+
+        :return: A NumpyArray of indices of survivors, best front first.
+        :rtype: NumpyArray
+        """
+        keep = []
+        for front in Pareto.non_dominated_sort(values):
+            if len(keep) + len(front) <= n:
+                keep.extend(front)
+                continue
+            distance = Pareto.crowding_distance(np.asarray(values)[front])
+            keep.extend(front[np.argsort(-distance, kind="stable")[:n - len(keep)]])
+            break
+        return np.array(keep, dtype=int)
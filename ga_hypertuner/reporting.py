@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 import sys
 
 
@@ -41,15 +40,164 @@ class Reporting:
               "Mean " + score_name + " : " + str(scores.mean()))
         print("\n" + str(best_params))
 
+    @staticmethod
+    def cache(hits, misses):
+        """
+        Prints number of fitness cache hits and misses of the current generation.
+        :param hits: number of individuals whose score was found in cache.
+        :type hits: int
+
+        :param misses: number of individuals that were not found in cache.
+        :type misses: int
+
+        :return: None
+        """
+        print("Cache hits : " + str(hits), "Cache misses : " + str(misses))
+
+    @staticmethod
+    def racing(raced, pop_size):
+        """
+        Prints number of children that lost their race against their parent before all folds were evaluated.
+        :param raced: number of children that were raced out in the current generation.
+        :type raced: int
+
+        :param pop_size: total population size
+        :type pop_size: int
+
+        :return: None
+        """
+        print("Raced out children : " + str(raced) + "/" + str(pop_size))
+
+    @staticmethod
+    def fidelity(rungs):
+        """
+        Prints the number of children evaluated and promoted at each fidelity in the current generation.
+        :param rungs: A list of dictionaries containing "fidelity", "evaluated" and "promoted".
+        :type rungs: list
+
+        :return: None
+        """
+        print("Fidelity ladder : " + ", ".join("%g%% %d -> %d" % (100 * rung["fidelity"], rung["evaluated"],
+                                                                  rung["promoted"]) for rung in rungs))
+
+    @staticmethod
+    def islands(results, best):
+        """
+        Prints the best score and stop reason of each island, and the best hyperparameters found by any island.
+        :param results: A list of results of islands. see :class:`Archipelago`.
+        :type results: list
+
+        :param best: result of the island that found the best hyperparameters.
+        :type best: dict
+
+        :return: None
+        """
+        for i, result in enumerate(results):
+            print("Island " + str(i) + " : best score " + str(result["best_score"]) + ", " + result["stop_reason"])
+        print("Best params : " + str(best["best_params"]))
+
+    @staticmethod
+    def timeouts(timed_out, timeout):
+        """
+        Prints number of evaluations of the current generation that timed out, and their hyperparameters.
+        :param timed_out: A list of hyperparameters of individuals whose evaluation timed out.
+        :type timed_out: list
+
+        :param timeout: Number of seconds an evaluation may take.
+        :type timeout: int or float
+
+        :return: None
+        """
+        print("Timed out evaluations (" + str(timeout) + "s) : " + str(len(timed_out)))
+        for params in timed_out:
+            print("  " + str(params))
+
+    @staticmethod
+    def cpu_split(n_cpus, split):
+        """
+        Prints how the CPU budget is split between workers, folds and model threads.
+        :param n_cpus: Number of cores of the budget.
+        :type n_cpus: int
+
+        :param split: A tuple of workers, folds fitted at the same time and threads of each model.
+        :type split: tuple
+
+        :return: None
+        """
+        print("\nCPU budget : " + str(n_cpus) + " cores", "Workers : " + str(split[0]),
+              "Fold jobs : " + str(split[1]), "Model threads : " + str(split[2]))
+
+    @staticmethod
+    def warm_start(seeded, reused):
+        """
+        Prints how many individuals of the initial population were seeded by warm start.
+        :param seeded: Number of seeded individuals.
+        :type seeded: int
+
+        :param reused: Number of seeded individuals that kept their previous score.
+        :type reused: int
+
+        :return: None
+        """
+        print("\nWarm start : " + str(seeded) + " seeded individuals", "Reused scores : " + str(reused))
+
+    @staticmethod
+    def pareto(front, score_name, objectives):
+        """
+        Prints the Pareto front of the current generation, with the score and objectives of each of its individuals.
+        :param front: A list of individuals of the front. see :meth:`GA.front`.
+        :type front: list
+
+        :param score_name: The scoring criteria that the algorithm tries to optimize.
+        :type score_name: str
+
+        :param objectives: names of objectives minimized together with the score.
+        :type objectives: list
+
+        :return: None
+        """
+        print("Pareto front : " + str(len(front)) + " individuals")
+        for member in front:
+            print("  " + score_name + " : " + str(member["score"]),
+                  *[name + " : " + "%.4g" % member[name] for name in objectives], str(member["params"]))
+
+    @staticmethod
+    def stopped(reason):
+        """
+        Prints the reason the algorithm stopped.
+        :param reason: reason the algorithm stopped.
+        :type reason: str
+
+        :return: None
+        """
+        print("\nStopped : " + reason)
+
+    @staticmethod
+    def timing(stats):
+        """
+        Prints where time of the current generation was spent.
+        :param stats: aggregates of the generation. see :meth:`GA.generation_summary`.
+        :type stats: dict
+
+        :return: None
+        """
+        print("Evaluations : " + str(stats["evaluations"]), "Cached : " + str(stats["cached"]),
+              "Fit time : " + "%.3fs" % stats["fit_time"], "Score time : " + "%.3fs" % stats["score_time"],
+              "Mean queue wait : " + "%.3fs" % stats["mean_queue_wait"],
+              "Surrogate time : " + "%.3fs" % stats["surrogate_time"],
+              "Generation time : " + "%.3fs" % stats["wall"], "GA overhead : " + "%.3fs" % stats["ga_overhead"])
+
     @staticmethod
     def verbose2(vectors):
         """
-        This method takes in a list of individuals as input and prints a summary of the hyperparameters values of whole generation.
+        This method takes in a list of individuals as input and prints a summary of the hyperparameters values of whole generation. pandas is imported on first use, so runs with lower verbosity never pay for it.
 
         :param vectors: A list of dictionaries containing the hyperparameters and corresponding scores of each individual in the population (score of model).
         :type vectors: list
         :return: None
         """
+        import pandas as pd
+
         vectors_no_score = [d["params"] for d in vectors]
         vectors = pd.DataFrame(vectors_no_score)
         print("-" * 50)
@@ -68,6 +216,8 @@ class Reporting:
 
         :return: None
         """
+        import pandas as pd
+
         vectors_no_score = [d["params"] for d in vectors]
         vectors_score = [d["score"] for d in vectors]
         score = pd.DataFrame(vectors_score)
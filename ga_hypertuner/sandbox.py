@@ -0,0 +1,126 @@
+import multiprocessing
+import traceback
+
+
+def _sandbox_main(conn, scorer, shared=None):
+    """
+    Loop of a sandbox process. Limits threads of the process to the model threads of the scorer, maps shared training data if it is given, and evaluates individuals received from the pipe until it is closed.
+
+    :param conn: end of the pipe owned by the sandbox.
+    :param scorer: scorer that evaluates individuals, without timeout.
+    :type scorer: Scorer
+
+    :param shared: shared training data, if the scorer was sent without data. Default is None.
+    :type shared: SharedDataset
+
+    :return: None
+    """
+    scorer.limit_threads()
+    if shared is not None:
+        x_train, y_train = shared.attach()
+        scorer.set_data(x_train, y_train, materialize=False)
+    conn.send("ready")
+    while True:
+        try:
+            params, threshold, fidelity, epoch = conn.recv()
+        except EOFError:
+            return
+        try:
+            scorer.folds.set_epoch(epoch)
+            conn.send(("ok", scorer.race(params, threshold, fidelity)))
+        except Exception as e:
+            try:
+                conn.send(("error", e))
+            except Exception:
+                # exception can not be pickled, send its traceback instead
+                conn.send(("error", RuntimeError(traceback.format_exc())))
+
+
+class Sandbox:
+    """
+    A process that evaluates individuals one at a time, so an evaluation that runs too long, or a crash of the model, can not affect anything else. The process is started on first use, receives the scorer once, and is only restarted after it was killed or died.
+
+    Sandboxes are started with the spawn method, so they are safe to start from threads, and are daemonic, so they never outlive the process that started them.
+
+    :param scorer: scorer that evaluates individuals. Its timeout is disabled inside the sandbox.
+    :type scorer: Scorer
+
+    :param shared: If given, shared training data the sandbox maps instead of receiving a copy, and the scorer is sent without data. see :meth:`Scorer.without_data`. Default is None.
+    :type shared: SharedDataset
+    """
+
+    def __init__(self, scorer, shared=None):
+        self.scorer = scorer
+        self.shared = shared
+        self.process = None
+        self.conn = None
+
+    def start(self):
+        """
+        Starts the process and waits until it is ready, so start up time is not counted in evaluation time.
+
+        :return: None
+        """
+        context = multiprocessing.get_context("spawn")
+        conn, child = context.Pipe()
+        process = context.Process(target=_sandbox_main, args=(child, self.scorer, self.shared), daemon=True,
+                                  name="ga_hypertuner-sandbox")
+        try:
+            process.start()
+        finally:
+            child.close()
+        # a process that failed to start is never killed by close
+        self.process = process
+        self.conn = conn
+        self.conn.recv()
+
+    def run(self, params, threshold, fidelity, epoch, timeout):
+        """
+        Evaluates an individual, and kills the process if the evaluation does not finish in time. A process that dies during the evaluation, for example killed for lack of memory or crashed in native code, is treated like a timeout.
+
+        :param params: attributes of individual. (hyperparameters)
+        :type params: dict
+
+        :param threshold: score the individual is raced against, or None.
+        :type threshold: float
+
+        :param fidelity: fraction of training data the individual is cross validated on.
+        :type fidelity: float
+
+        :param epoch: epoch of cross validation folds.
+        :type epoch: int
+
+        :param timeout: Number of seconds the evaluation may take.
+        :type timeout: int or float
+
+        :return: record of the evaluation, or None if it timed out or the process died. see :meth:`Scorer.race`.
+        :rtype: dict
+        """
+        if self.process is None or not self.process.is_alive():
+            self.start()
+        try:
+            self.conn.send((params, threshold, fidelity, epoch))
+            if not self.conn.poll(timeout):
+                self.close()
+                return None
+            status, result = self.conn.recv()
+        except (EOFError, OSError):
+            # the process died, a new one is started for the next evaluation
+            self.close()
+            return None
+        if status == "error":
+            raise result
+        return result
+
+    def close(self):
+        """
+        Kills the process, if it is running.
+
+        :return: None
+        """
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            self.conn.close()
+            self.process = None
+            self.conn = None
@@ -0,0 +1,199 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+
+
+class SharedArray:
+    """
+    Handle of an array that is stored once in a memory-mapped file. Only the handle is sent to worker processes, and each worker maps the same file read-only, so the operating system keeps a single copy of the data in memory no matter how many workers are running.
+
+    A dataframe is stored as one file per type of its columns, in column-major order, and is rebuilt around columns of the mapped files, so dataframes mixing integer, float and boolean columns are shared as well. An index that is not a range is stored in its own file when it has a numeric type, and is sent with the handle otherwise.
+
+    :param path: Path of the .npy file holding the array, or None for a dataframe.
+    :type path: str
+
+    :param kind: Type of the original data. One of "array", "dataframe", "series" or "index".
+    :type kind: str
+
+    :param columns: Column labels of a dataframe, or name of a series or index. Default is None.
+
+    :param index: Index of a dataframe or series, either the index itself or a handle of kind "index". Default is None.
+
+    :param groups: For a dataframe, a list of tuples of a handle of kind "array" holding columns of one type, and the positions of these columns in the dataframe. Default is None.
+    :type groups: list
+    """
+
+    def __init__(self, path: str, kind: str, columns=None, index=None, groups: list = None):
+        self.path = path
+        self.kind = kind
+        self.columns = columns
+        self.index = index
+        self.groups = groups
+
+    @staticmethod
+    def mappable(dtype):
+        """
+        Checks whether values of a type can be stored in a memory-mapped file. Object, categorical and other pandas extension types can not.
+
+        :param dtype: type of an array or column.
+
+        :return: A bool determining whether the type can be mapped.
+        """
+        return isinstance(dtype, np.dtype) and dtype.kind not in "OV"
+
+    @staticmethod
+    def supports(data):
+        """
+        Checks whether data can be stored as a shared array without changing its values or types. see :meth:`SharedArray.mappable`.
+
+        :param data: Training features or target.
+
+        :return: A bool determining whether data can be shared.
+        """
+        if hasattr(data, "dtypes") and hasattr(data, "columns"):
+            return all(SharedArray.mappable(dtype) for dtype in data.dtypes)
+        if hasattr(data, "dtype"):
+            return SharedArray.mappable(data.dtype)
+        return SharedArray.mappable(np.asarray(data).dtype)
+
+    @staticmethod
+    def create(data, directory, name):
+        """
+        Writes data to memory-mapped files and returns its handle.
+
+        :param data: Training features or target.
+
+        :param directory: Directory the files are written to.
+        :type directory: str
+
+        :param name: name of the file, without extension. Files of columns and index add a suffix to it.
+        :type name: str
+
+        :return: handle of the shared array.
+        :rtype: SharedArray
+        """
+        if hasattr(data, "columns"):
+            groups = []
+            dtypes = list(data.dtypes)
+            for i, dtype in enumerate(dict.fromkeys(dtypes)):
+                positions = [j for j, column_dtype in enumerate(dtypes) if column_dtype == dtype]
+                path = os.path.join(directory, name + "_" + str(i) + ".npy")
+                np.save(path, np.asfortranarray(data.iloc[:, positions].to_numpy(dtype=dtype)))
+                groups.append((SharedArray(path, "array"), positions))
+            return SharedArray(None, "dataframe", data.columns, SharedArray.index_of(data, directory, name),
+                               groups)
+        if hasattr(data, "name") and hasattr(data, "index"):
+            path = os.path.join(directory, name + ".npy")
+            np.save(path, data.to_numpy())
+            return SharedArray(path, "series", data.name, SharedArray.index_of(data, directory, name))
+        path = os.path.join(directory, name + ".npy")
+        np.save(path, np.ascontiguousarray(np.asarray(data)))
+        return SharedArray(path, "array")
+
+    @staticmethod
+    def index_of(data, directory, name):
+        """
+        Stores the index of a dataframe or series. A range index is only a start, stop and step, and an index of a numeric type is written to a memory-mapped file. Other indexes, like labels of strings, are kept as they are and sent with the handle.
+
+        :param data: A dataframe or series.
+
+        :param directory: Directory the file is written to.
+        :type directory: str
+
+        :param name: name of the file of the data, without extension.
+        :type name: str
+
+        :return: the index, or a handle of kind "index".
+        """
+        import pandas as pd
+
+        index = data.index
+        if isinstance(index, (pd.RangeIndex, pd.MultiIndex)) or not SharedArray.mappable(index.dtype):
+            return index
+        path = os.path.join(directory, name + "_index.npy")
+        np.save(path, index.to_numpy())
+        return SharedArray(path, "index", index.name)
+
+    def attach(self):
+        """
+        Maps the shared array read-only, and rebuilds a dataframe, series or index around it if the original data was one.
+
+        :return: A read-only view of the data.
+        """
+        if self.kind == "dataframe":
+            import pandas as pd
+
+            columns = {}
+            for group, positions in self.groups:
+                # plain views of the mapped memory, like columns of any other dataframe
+                array = np.asarray(group.attach())
+                for j, position in enumerate(positions):
+                    columns[position] = array[:, j]
+            frame = pd.DataFrame({i: columns[i] for i in range(len(columns))}, copy=False)
+            # labels are set afterwards, so duplicated and non string labels are kept
+            frame.columns = self.columns
+            frame.index = self.attach_index()
+            return frame
+        array = np.load(self.path, mmap_mode="r")
+        if self.kind == "series":
+            import pandas as pd
+            return pd.Series(np.asarray(array), index=self.attach_index(), name=self.columns, copy=False)
+        if self.kind == "index":
+            import pandas as pd
+            return pd.Index(np.asarray(array), name=self.columns, copy=False)
+        return array
+
+    def attach_index(self):
+        """
+        Returns the index of a shared dataframe or series.
+
+        :return: the index.
+        """
+        return self.index.attach() if isinstance(self.index, SharedArray) else self.index
+
+
+class SharedDataset:
+    """
+    Training data converted once to memory-mapped arrays, so worker processes receive a small handle instead of a pickled copy of the data for every worker.
+
+    :param x_train: Training features.
+    :type x_train: Dataframe
+
+    :param y_train: Training target.
+    :type y_train: Dataframe
+
+    :ivar x_t: handle of shared training features.
+    :ivar y_t: handle of shared training target.
+    """
+
+    def __init__(self, x_train, y_train):
+        self.directory = tempfile.mkdtemp(prefix="ga_hypertuner-")
+        self.x_t = SharedArray.create(x_train, self.directory, "x_train")
+        self.y_t = SharedArray.create(y_train, self.directory, "y_train")
+
+    @staticmethod
+    def supports(x_train, y_train):
+        """
+        Checks whether training data can be shared. see :meth:`SharedArray.supports`.
+
+        :return: A bool determining whether training data can be shared.
+        """
+        return SharedArray.supports(x_train) and SharedArray.supports(y_train)
+
+    def attach(self):
+        """
+        Maps shared training data read-only inside a worker.
+
+        :return: training features and training target.
+        :rtype: tuple
+        """
+        return self.x_t.attach(), self.y_t.attach()
+
+    def close(self):
+        """
+        Removes the memory-mapped files. Workers that still map them keep their view until they exit.
+
+        :return: None
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,252 @@
+import math
+import warnings
+import numpy as np
+
+
+class SearchSpace:
+    """
+    Search space of hyperparameters compiled into arrays, so population can be held as a matrix with one row per individual and one column per optimized hyperparameter. Static hyperparameters are not part of the matrix and are only added back when a row is decoded to model parameters.
+
+    Each optimized hyperparameter is encoded so that mutation and crossover work on it directly. Linear hyperparameters are held as they are. Log-scale hyperparameters are held as their logarithm, so a difference of two individuals is a ratio, and values spread over orders of magnitude are explored evenly. Quantized hyperparameters are rounded to their grid when decoded. Categorical hyperparameters are held as the index of their choice.
+
+    :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list like [None, Parameter Type] (for optimization of parameter), [None, Parameter Type, Scale] or [None, Parameter Type, Scale, Step] where Scale is "linear" or "log" and Step is the grid quantized values are rounded to, [None, "categorical"] (for choosing one of the values given as boundaries), or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
+    :type model_parameters: dict
+
+    :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end], or the list of choices of a categorical hyperparameter.
+    :type boundaries: dict
+
+    :ivar names: names of all hyperparameters, in the order they were given.
+    :ivar optimized: names of optimized hyperparameters, in the order of matrix columns.
+    :ivar static: a dictionary of static hyperparameters and their values.
+    :ivar lower: lower boundaries of optimized hyperparameters, in their encoding.
+    :ivar upper: upper boundaries of optimized hyperparameters, in their encoding.
+    :ivar int_mask: whether each optimized hyperparameter is held as an integer, which linear integers without step and categorical hyperparameters are.
+    :ivar cat_mask: whether each optimized hyperparameter is categorical.
+    :ivar choices: a dictionary of choices of categorical hyperparameters.
+    :ivar log_names: names of log-scale hyperparameters.
+    :ivar steps: a dictionary of steps of quantized hyperparameters.
+    :ivar samplers: accepted values for method of :meth:`SearchSpace.sample`.
+    """
+    samplers = ["random", "lhs", "sobol", "halton"]
+
+    def __init__(self, model_parameters: dict, boundaries: dict):
+        self.names = list(model_parameters.keys())
+        self.optimized = []
+        self.static = {}
+        for p, pi in model_parameters.items():
+            if type(pi) == list and pi[0] is None:
+                self.optimized.append(p)
+            elif type(pi) == list:
+                self.static[p] = pi[0]
+            else:
+                self.static[p] = pi
+        self.dim = len(self.optimized)
+        self.choices = {p: list(boundaries[p]) for p in self.optimized if model_parameters[p][1] == "categorical"}
+        self.log_names = {p for p in self.optimized if "log" in model_parameters[p][2:]}
+        self.steps = {p: o for p in self.optimized for o in model_parameters[p][2:] if type(o) in (int, float)}
+        self.int_names = {p for p in self.optimized if model_parameters[p][1] == int}
+        self.bounds = {p: tuple(boundaries[p]) for p in self.optimized if p not in self.choices}
+        lower = []
+        upper = []
+        for p in self.optimized:
+            if p in self.choices:
+                lower.append(0)
+                upper.append(len(self.choices[p]) - 1)
+                continue
+            start, end = self.bounds[p]
+            if p in self.steps:
+                # every grid value gets an equal share of the range
+                end = self.grid_top(p)
+                if p not in self.log_names:
+                    start, end = start - self.steps[p] / 2, end + self.steps[p] / 2
+            if p in self.log_names:
+                start, end = np.log(start), np.log(end)
+            lower.append(start)
+            upper.append(end)
+        self.lower = np.array(lower, dtype=float)
+        self.upper = np.array(upper, dtype=float)
+        self.int_mask = np.array([p in self.choices or (p in self.int_names and p not in self.log_names and
+                                                        p not in self.steps) for p in self.optimized], dtype=bool)
+        self.cat_mask = np.array([p in self.choices for p in self.optimized], dtype=bool)
+
+    def grid_top(self, p):
+        """
+        Largest grid value of a quantized hyperparameter that is not above its end.
+
+        :param p: name of the hyperparameter.
+        :type p: str
+
+        :return: the largest grid value.
+        :rtype: float
+        """
+        start, end = self.bounds[p]
+        return start + self.steps[p] * np.floor((end - start) / self.steps[p] + 1e-9)
+
+    def sample(self, rng, n, method: str = "random"):
+        """
+        Draws individuals from the search space. "random" draws each hyperparameter independently and uniformly, which leaves gaps and clusters in small populations. "lhs" (Latin hypercube) splits the range of each hyperparameter into n equal strata and puts one individual in each, and "sobol" and "halton" are scrambled low-discrepancy sequences, which cover the whole space evenly.
+
+        :param rng: random number generator of the algorithm.
+        :type rng: numpy.random.Generator
+
+        :param n: number of individuals.
+        :type n: int
+
+        :param method: Accepted values are "random", "lhs", "sobol" and "halton". Default is "random".
+        :type method: str
+
+        :return: A matrix of shape (n, dim).
+        :rtype: NumpyArray
+        """
+        if method != "random":
+            return self.scale(self.unit_sample(rng, n, method))
+        population = rng.uniform(self.lower, self.upper, size=(n, self.dim))
+        # integers are drawn uniformly from start to end, both included
+        ints = rng.integers(self.lower[self.int_mask].astype(int), self.upper[self.int_mask].astype(int) + 1,
+                            size=(n, int(self.int_mask.sum())))
+        population[:, self.int_mask] = ints
+        return population
+
+    def unit_sample(self, rng, n, method):
+        """
+        Draws points of a space-filling design in the unit cube.
+
+        :param rng: random number generator of the algorithm, which seeds the scrambling of the design.
+        :type rng: numpy.random.Generator
+
+        :param n: number of points.
+        :type n: int
+
+        :param method: Accepted values are "lhs", "sobol" and "halton".
+        :type method: str
+
+        :return: A matrix of shape (n, dim), with values in [0, 1).
+        :rtype: NumpyArray
+        """
+        if self.dim == 0:
+            return np.zeros((n, 0))
+        from scipy.stats import qmc
+        if method == "lhs":
+            sampler = qmc.LatinHypercube(self.dim, seed=rng)
+        elif method == "sobol":
+            sampler = qmc.Sobol(self.dim, seed=rng)
+        else:
+            sampler = qmc.Halton(self.dim, seed=rng)
+        with warnings.catch_warnings():
+            # Sobol points are best balanced for powers of two, but any prefix still covers the space evenly
+            warnings.simplefilter("ignore", UserWarning)
+            return sampler.random(n)
+
+    def scale(self, unit):
+        """
+        Maps points of the unit cube to the search space. Each integer from start to end, both included, gets an equal share of the unit interval.
+
+        :param unit: A matrix of points in [0, 1).
+        :type unit: NumpyArray
+
+        :return: A matrix of individuals.
+        :rtype: NumpyArray
+        """
+        span = self.upper - self.lower
+        population = self.lower + unit * span
+        ints = np.minimum(np.floor(self.lower + unit * (span + 1)), self.upper)
+        population[:, self.int_mask] = ints[:, self.int_mask]
+        return population
+
+    def opposite(self, population, rng):
+        """
+        Mirrors individuals through the center of the search space, so an individual close to one bound gets an opposite close to the other bound. Log-scale hyperparameters are mirrored in log space. Choices of categorical hyperparameters have no order, so the opposite of a choice is a random other choice.
+
+        :param population: A matrix of individuals.
+        :type population: NumpyArray
+
+        :param rng: random number generator of the algorithm.
+        :type rng: numpy.random.Generator
+
+        :return: A matrix of opposite individuals.
+        :rtype: NumpyArray
+        """
+        opposites = self.lower + self.upper - population
+        if self.cat_mask.any():
+            n_choices = (self.upper[self.cat_mask] + 1).astype(int)
+            shift = rng.integers(1, n_choices, size=(len(population), len(n_choices)))
+            opposites[:, self.cat_mask] = (population[:, self.cat_mask].astype(int) + shift) % n_choices
+        return opposites
+
+    def clip(self, population):
+        """
+        Truncates integer hyperparameters toward zero and clips out of bound hyperparameters to the nearest bound. Floats are clipped just inside the bounds.
+
+        :param population: A matrix of individuals.
+        :type population: NumpyArray
+
+        :return: A matrix of individuals inside the search space.
+        :rtype: NumpyArray
+        """
+        population = np.where(self.int_mask, np.trunc(population), population)
+        lower = np.where(self.int_mask, self.lower, self.lower + 1e-10)
+        upper = np.where(self.int_mask, self.upper, self.upper - 1e-10)
+        population = np.where(population > self.upper, upper, population)
+        population = np.where(population < self.lower, lower, population)
+        return population
+
+    def decode(self, row):
+        """
+        Converts an individual to model parameters, including static hyperparameters.
+
+        :param row: A row of population matrix.
+        :type row: NumpyArray
+
+        :return: a dictionary of hyperparameters that can be passed to the model class.
+        :rtype: dict
+        """
+        values = dict(zip(self.optimized, row.tolist()))
+        params = {}
+        for p in self.names:
+            if p in self.static:
+                params[p] = self.static[p]
+                continue
+            value = values[p]
+            if p in self.choices:
+                params[p] = self.choices[p][int(value)]
+                continue
+            if p in self.log_names:
+                value = float(np.exp(value))
+            if p in self.steps:
+                start = self.bounds[p][0]
+                value = round(start + self.steps[p] * round((value - start) / self.steps[p]), 12)
+                value = min(max(value, start), self.grid_top(p))
+            elif p in self.log_names:
+                value = min(max(value, self.bounds[p][0]), self.bounds[p][1])
+            params[p] = int(round(value)) if p in self.int_names else value
+        return params
+
+    def encode_value(self, p, value):
+        """
+        Converts a value of an optimized hyperparameter to its encoding.
+
+        :param p: name of the hyperparameter.
+        :type p: str
+
+        :param value: value of the hyperparameter.
+
+        :return: encoded value.
+        :rtype: float
+        """
+        if p in self.choices:
+            return float(self.choices[p].index(value))
+        if p in self.log_names:
+            return math.log(value)
+        return float(value)
+
+    def encode(self, params):
+        """
+        Converts model parameters to a row of population matrix.
+
+        :param params: a dictionary of hyperparameters.
+        :type params: dict
+
+        :return: A row of population matrix.
+        :rtype: NumpyArray
+        """
+        return np.array([self.encode_value(p, params[p]) for p in self.optimized], dtype=float)
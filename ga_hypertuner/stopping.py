@@ -0,0 +1,122 @@
+import numpy as np
+
+
+class StopCriterion:
+    """
+    Base class of stop criteria. A criterion is checked at the end of each generation, and returns the reason the algorithm should stop, or None to let it continue. Criteria are composed as a list, and the first one that returns a reason stops the algorithm.
+    """
+
+    def check(self, ga, population, scores):
+        """
+        Checks whether the algorithm should stop.
+
+        :param ga: the running algorithm.
+        :type ga: GA
+
+        :param population: A matrix of individuals in the current generation, one row per individual.
+        :type population: NumpyArray
+
+        :param scores: A NumpyArray of scores of individuals.
+        :type scores: NumpyArray
+
+        :return: the reason the algorithm should stop, or None.
+        :rtype: str
+        """
+        return None
+
+
+class StopValue(StopCriterion):
+    """
+    Stops once the best score reaches a value.
+
+    :param value: The score that, when reached, the algorithm will stop.
+    :type value: int or float
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def check(self, ga, population, scores):
+        if ga.gp["direction"] == "max" and scores.max() > self.value:
+            return "best score " + str(scores.max()) + " reached stop value " + str(self.value)
+        if ga.gp["direction"] == "min" and scores.min() < self.value:
+            return "best score " + str(scores.min()) + " reached stop value " + str(self.value)
+        return None
+
+
+class Stagnation(StopCriterion):
+    """
+    Stops once the best score did not improve by more than a threshold for a number of generations.
+
+    :param generations: Number of generations without improvement.
+    :type generations: int
+
+    :param min_delta: Improvements smaller than or equal to this are not counted. Default is 0.
+    :type min_delta: int or float
+    """
+
+    def __init__(self, generations: int, min_delta=0.0):
+        self.generations = generations
+        self.min_delta = min_delta
+
+    def check(self, ga, population, scores):
+        history = ga.max_scores if ga.gp["direction"] == "max" else [-s for s in ga.min_scores]
+        if len(history) <= self.generations:
+            return None
+        if history[-1] - history[-1 - self.generations] <= self.min_delta:
+            return "best score did not improve by more than " + str(self.min_delta) + " for " + \
+                str(self.generations) + " generations"
+        return None
+
+
+class DiversityCollapse(StopCriterion):
+    """
+    Stops once the population has converged in parameter space. The spread of each hyperparameter is its standard deviation in the population, relative to the width of its boundaries, and the population has converged once the spread of every hyperparameter is below a tolerance.
+
+    :param tolerance: relative spread below which a hyperparameter has converged.
+    :type tolerance: float
+    """
+
+    def __init__(self, tolerance: float):
+        self.tolerance = tolerance
+
+    def check(self, ga, population, scores):
+        width = np.maximum(ga.space.upper - ga.space.lower, 1e-12)
+        spread = (population.std(axis=0) / width).max() if ga.space.dim else 0.0
+        if spread < self.tolerance:
+            return "population spread " + "%.3g" % spread + " is below " + str(self.tolerance)
+        return None
+
+
+class Deadline(StopCriterion):
+    """
+    Stops once the algorithm has been running for a number of seconds, including time before it was resumed from a checkpoint. The deadline is checked between generations, so the last generation may end after it.
+
+    :param seconds: Maximum wall-clock seconds of the run.
+    :type seconds: int or float
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def check(self, ga, population, scores):
+        if ga.elapsed() >= self.seconds:
+            return "wall-clock deadline of " + str(self.seconds) + " seconds reached"
+        return None
+
+
+class FitBudget(StopCriterion):
+    """
+    Stops once a number of models have been fitted. Each cross validation fold of an evaluation is a fit, and individuals found in cache cost no fits. The budget is checked between generations, so the last generation may exceed it.
+
+    :param max_fits: Maximum number of model fits of the run.
+    :type max_fits: int
+    """
+
+    def __init__(self, max_fits: int):
+        self.max_fits = max_fits
+
+    def check(self, ga, population, scores):
+        if ga.fits >= self.max_fits:
+            return "budget of " + str(self.max_fits) + " model fits reached"
+        return None
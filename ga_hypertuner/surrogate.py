@@ -0,0 +1,186 @@
+import time
+import numpy as np
+from ga_hypertuner.callbacks import Callback
+
+
+class Surrogate(Callback):
+    """
+    A cheap regression model of scores, trained on every individual evaluated so far, that ranks candidate children before they are evaluated. Only the most promising candidate of each parent is sent to cross validation, so less expensive fits are spent on obviously poor individuals.
+
+    The surrogate is a callback of the evaluator: it collects hyperparameters and scores of completed evaluations, and is refitted lazily, the next time candidates are ranked. Evaluations stopped early by racing, evaluations on a fraction of training data and scores found in cache are not used, as they are partial scores or duplicates.
+
+    :param space: search space of the optimization.
+    :type space: SearchSpace
+
+    :param model: Type of regression model. Accepted values are "random_forest" and "gaussian_process".
+    :type model: str
+
+    :param direction: Accepted values are "max" and "min". Determines whether higher scores are better or lower scores.
+    :type direction: str
+
+    :ivar models: accepted values for model.
+    :ivar rows: hyperparameters of evaluated individuals, one row per individual.
+    :ivar scores: scores of evaluated individuals.
+    :ivar fit_time: seconds spent fitting the model and ranking candidates since it was last reset.
+    """
+    models = ["random_forest", "gaussian_process"]
+
+    def __init__(self, space, model: str = "random_forest", direction: str = "max"):
+        self.space = space
+        self.model = model
+        self.direction = direction
+        self.rows = []
+        self.scores = []
+        self.regressor = None
+        self.fitted = 0
+        self.fit_time = 0.0
+
+    def on_eval_end(self, record):
+        """
+        Collects hyperparameters and score of a completed evaluation.
+
+        :param record: record of the evaluation. see :meth:`Callback.on_eval_end`.
+        :type record: dict
+
+        :return: None
+        """
+        full = record["complete"] and record["fidelity"] >= 1.0
+        if full and not record["cached"] and np.isfinite(record["score"]):
+            self.rows.append(self.space.encode(record["params"]))
+            self.scores.append(record["score"])
+
+    def features(self, rows):
+        """
+        Scales hyperparameters to the unit cube, so all hyperparameters weigh the same in the model.
+
+        :param rows: A matrix of individuals.
+        :type rows: NumpyArray
+
+        :return: A matrix of scaled individuals.
+        :rtype: NumpyArray
+        """
+        return (np.asarray(rows, dtype=float) - self.space.lower) / np.maximum(self.space.upper - self.space.lower,
+                                                                               1e-12)
+
+    def fit(self, random_state):
+        """
+        Fits the model to all collected evaluations, if some were collected since the last fit.
+
+        :param random_state: Seed of the model.
+        :type random_state: int
+
+        :return: None
+        """
+        if self.fitted == len(self.scores):
+            return
+        x = self.features(np.vstack(self.rows))
+        y = np.array(self.scores, dtype=float)
+        # evaluations are collected in the order they finish, which depends on workers, so they are sorted
+        # to make the model only depend on which individuals were evaluated
+        order = np.lexsort(np.column_stack([x, y]).T)
+        x, y = x[order], y[order]
+        if self.model == "gaussian_process":
+            from sklearn.gaussian_process import GaussianProcessRegressor
+            from sklearn.gaussian_process.kernels import Matern, WhiteKernel
+            self.regressor = GaussianProcessRegressor(kernel=Matern(nu=2.5) + WhiteKernel(), normalize_y=True,
+                                                      random_state=random_state)
+        else:
+            from sklearn.ensemble import RandomForestRegressor
+            self.regressor = RandomForestRegressor(n_estimators=50, min_samples_leaf=2, random_state=random_state)
+        self.regressor.fit(x, y)
+        self.fitted = len(self.scores)
+
+    def predict(self, rows):
+        """
+        Predicts scores of individuals and the uncertainty of predictions.
+
+        :param rows: A matrix of individuals.
+        :type rows: NumpyArray
+
+        :return: A NumpyArray of predicted scores and a NumpyArray of their standard deviations.
+        :rtype: tuple
+        """
+        x = self.features(rows)
+        if self.model == "gaussian_process":
+            return self.regressor.predict(x, return_std=True)
+        # spread of the trees is the uncertainty of a forest
+        predictions = np.stack([tree.predict(x) for tree in self.regressor.estimators_])
+        return predictions.mean(axis=0), predictions.std(axis=0)
+
+    def expected_improvement(self, rows, best):
+        """
+        Computes how much each individual is expected to improve on the best score, counting both predicted score and uncertainty.
+
+        :param rows: A matrix of individuals.
+        :type rows: NumpyArray
+
+        :param best: best score found so far.
+        :type best: float
+
+        :return: A NumpyArray of expected improvements.
+        :rtype: NumpyArray
+        """
+        mean, std = self.predict(rows)
+        improvement = mean - best if self.direction == "max" else best - mean
+        from scipy.stats import norm
+
+        std = np.maximum(std, 1e-12)
+        z = improvement / std
+        return improvement * norm.cdf(z) + std * norm.pdf(z)
+
+    def screen(self, candidates, best, random_state):
+        """
+        Picks the most promising candidate of each group.
+
+        :param candidates: A matrix of candidates of shape (groups, candidates per group, dim).
+        :type candidates: NumpyArray
+
+        :param best: best score found so far.
+        :type best: float
+
+        :param random_state: Seed of the model.
+        :type random_state: int
+
+        :return: A matrix with the best candidate of each group, one row per group.
+        :rtype: NumpyArray
+        """
+        start = time.perf_counter()
+        self.fit(random_state)
+        groups, per_group, dim = candidates.shape
+        ei = self.expected_improvement(candidates.reshape(groups * per_group, dim), best).reshape(groups, per_group)
+        chosen = candidates[np.arange(groups), np.argmax(ei, axis=1)]
+        self.fit_time += time.perf_counter() - start
+        return chosen
+
+    def ready(self):
+        """
+        Checks whether enough evaluations were collected to fit the model.
+
+        :return: A bool determining whether candidates can be ranked.
+        """
+        return len(self.scores) >= 2
+
+    def state(self):
+        """
+        Returns collected evaluations, for checkpoints. The model itself is refitted after a restore.
+
+        :return: A matrix of evaluated individuals and a list of their scores.
+        :rtype: tuple
+        """
+        rows = np.vstack(self.rows) if self.rows else np.empty((0, self.space.dim))
+        return rows, list(self.scores)
+
+    def restore(self, state):
+        """
+        Restores collected evaluations saved by :meth:`Surrogate.state`.
+
+        :param state: A matrix of evaluated individuals and a list of their scores.
+        :type state: tuple
+
+        :return: None
+        """
+        rows, scores = state
+        self.rows = list(rows)
+        self.scores = list(scores)
+        self.regressor = None
+        self.fitted = 0
@@ -1,6 +1,16 @@
+import os
 import numpy as np
 from ga_hypertuner.exceptions import GaParamsException, MParamsException, GaHypertunerParamException
 from ga_hypertuner.ga import GA
+from ga_hypertuner.islands import Archipelago
+from ga_hypertuner.evaluation import Evaluator
+from ga_hypertuner.cache import FitnessCache
+from ga_hypertuner.checkpoint import Checkpoint
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.surrogate import Surrogate
+from ga_hypertuner.adaptation import Adaptation
+from ga_hypertuner.space import SearchSpace
+from ga_hypertuner.pareto import Pareto
 from typing import Union
 
 
@@ -23,7 +33,35 @@ class Tuner:
              , k: int = 5
              , verbosity: int = 1
              , show_progress_plot: bool = False
-             , plot_step: int = 1):
+             , plot_step: int = 1
+             , n_workers: int = 1
+             , backend: str = "serial"
+             , random_state: int = None
+             , cache_size: int = 0
+             , cache_decimals: int = None
+             , cache_path: str = None
+             , checkpoint_path: str = None
+             , checkpoint_every: int = None
+             , checkpoint_seconds: Union[int, float] = None
+             , racing_bound: Union[int, float] = None
+             , cv_refresh: int = None
+             , mode: str = "generational"
+             , callbacks: list = None
+             , surrogate: str = None, surrogate_candidates: int = 4
+             , stop_patience: int = None, stop_min_delta: Union[int, float] = 0.0
+             , stop_spread: float = None, max_seconds: Union[int, float] = None
+             , max_fits: int = None
+             , fidelities: list = None, promotion_rate: float = 0.5
+             , n_islands: int = 1, topology: str = "ring", migration_interval: int = 5
+             , migration_size: int = 1, island_parameters: list = None
+             , broker_address: str = None, broker_authkey: str = None
+             , timeout: Union[int, float] = None, timeout_penalty: Union[int, float] = None
+             , cpu_budget: int = None, plot_path: str = None
+             , history_path: str = None
+             , warm_start: Union[list, str] = None, warm_start_rescore: bool = True
+             , strategy: str = "rand/1", adaptation: str = None
+             , init: str = "random", opposition: bool = False
+             , objectives: list = None):
 
         """
         Main method to call to start tuning algorithm.
@@ -33,10 +71,10 @@ class Tuner:
 
         :param model: Model class that its hyperparameters are being optimized. Any model class that scikit cross-validate module can accept.
 
-        :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list either like [None, Parameter Type] (for optimization of parameter) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
+        :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list like [None, Parameter Type] (for optimization of parameter), [None, Parameter Type, Scale] or [None, Parameter Type, Scale, Step] where Scale is "linear" or "log" (for parameters spread over orders of magnitude, like C or learning rate) and Step is the grid values are rounded to, [None, "categorical"] (for choosing one of the values given as boundaries, like solver or booster) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
         :type model_parameters: dict
 
-        :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end].
+        :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end], or the list of choices of a categorical parameter.
         :type boundaries: dict
 
         :param x_train: Training features for the given model. This data will be used to train the model without slicing or sampling.
@@ -60,18 +98,143 @@ class Tuner:
         :param verbosity: Determines the amount of information that is returned after each generation is generated. Accepted values are 0, 1, 2, or 3. Default is 1.
         :type verbosity: int
 
-        :param show_progress_plot: Whether the progress plot of the score for each generation should be shown at the end of each generation.
+        :param show_progress_plot: Whether the progress plot of the score for each generation should be shown at the end of each generation. The plot is redrawn in a single window, which is closed when the optimization ends. Drawing runs in the generation loop, so use plot_path to render it off the hot path.
         :type show_progress_plot: bool
 
         :param plot_step: number of generations to skip before displaying progress plot.
         :type plot_step: int
+
+        :param n_workers: Number of workers that evaluate individuals of a generation in parallel. For distributed backend, number of workers started on the local host, which can be 0 if all workers run on other hosts. Default is 1.
+        :type n_workers: int
+
+        :param backend: Backend used for evaluating individuals. Accepted values are "serial", "thread", "process" and "distributed". With "distributed", individuals are evaluated by workers that connect to a broker started by the algorithm, from this host or others. Workers are started with ``ga_hypertuner-worker host:port --authkey key``, they send heartbeats, tasks of lost workers are evaluated again by others, and scores are streamed back as soon as they are done. If no worker is alive for 60 seconds while individuals wait, the optimization fails. Workers never write the cache, only this process does. Default is "serial".
+        :type backend: str
+
+        :param broker_address: "host:port" the broker of distributed backend listens on, and workers connect to. Use an address reachable from other hosts to accept their workers. Default is None, a free port of the local host.
+        :type broker_address: str
+
+        :param broker_authkey: Key workers of distributed backend authenticate with. Default is None, a random key only known to local workers.
+        :type broker_authkey: str
+
+        :param timeout: If given, number of seconds an evaluation may take. Evaluations run in a sandbox process, which is killed when an evaluation takes longer, and the individual gets timeout_penalty as score, so selection drops it. An individual whose sandbox process dies, for example killed for lack of memory, is treated the same way. Timed out evaluations are counted and logged with their hyperparameters. Default is None.
+        :type timeout: int or float
+
+        :param timeout_penalty: Score of individuals whose evaluation timed out. Default is None, -inf if direction is "max" and inf if direction is "min".
+        :type timeout_penalty: int or float
+
+        :param plot_path: If given, path of an image file the progress plot is rendered to every plot_step generations, on a background thread and without a display, for example "progress.png". With islands, each island renders its own file, with "_island" and its index added to the name. Default is None.
+        :type plot_path: str
+
+        :param history_path: If given, path of a memory-mapped file the history of every evaluation (hyperparameters, score, fold scores, timings and generation) is appended to. Load it with :meth:`History.load` to query the best evaluations or a generation, or to export it to SQLite. With islands, each island writes its own file, with "_island" and its index added to the name. Default is None.
+        :type history_path: str
+
+        :param warm_start: If given, individuals the initial population is seeded with, so a retune after a data refresh starts from the best individuals of a previous run instead of from scratch. Either a list of dictionaries of hyperparameters, or a path of a history file (see history_path) or checkpoint of a previous run, whose best pop_size individuals are taken. The rest of the population is drawn randomly, hyperparameters missing from a seed are drawn randomly and values outside boundaries are clipped. Default is None.
+        :type warm_start: list or str
+
+        :param init: Method the initial population is drawn with. "random" draws each hyperparameter independently, which leaves gaps and clusters in small populations. "lhs" (Latin hypercube), "sobol" and "halton" spread the initial population evenly over the search space. Warm start seeds replace the first individuals of the design. Default is "random".
+        :type init: str
+
+        :param opposition: Whether opposition-based initialization is used. The opposite of each initial individual, mirrored through the center of the search space, with a random other choice for categorical hyperparameters, is also evaluated in one batch, and the best pop_size of individuals and opposites form the initial population. Costs pop_size extra evaluations. Default is False.
+        :type opposition: bool
+
+        :param strategy: Mutation strategy that creates trial individuals. Accepted values are "rand/1", "rand/2", "best/1", "current-to-best/1" and "current-to-pbest/1". Strategies moving toward the best individuals reach good scores in fewer evaluations, "rand/1" and "rand/2" explore more. "rand/2" needs a pop_size of at least 6. Default is "rand/1".
+        :type strategy: str
+
+        :param adaptation: If given, fscale and cp are adapted during the run from the values that produced children better than their parents, in the style of JADE or SHADE, and fscale and cp of ga_parameters are only their initial values. Best combined with "current-to-pbest/1". Accepted values are "jade" and "shade". Default is None.
+        :type adaptation: str
+
+        :param warm_start_rescore: Whether seeds are scored again on the given training data, in one batch with the random part of the population. If False, seeds taken from a history or checkpoint keep their previous scores. Seeds are always scored again when objectives are given, since their objectives are not known. Default is True.
+        :type warm_start_rescore: bool
+
+        :param objectives: If given, a list of costs minimized together with the score, so the optimization searches for trade-offs between score and serving cost instead of the single best score. Accepted values are "fit_time" and "predict_time", mean seconds of fitting and of scoring one cross validation fold, and "model_size", mean bytes of the pickled fitted model. Each generation, parents and children are merged and pop_size of them survive by non-dominated sorting and crowding distance (NSGA-II), and the Pareto front, a list of dictionaries with "params", "score" and each objective, is returned instead of the best hyperparameters. Times are measured on the evaluating worker, so they are only comparable when workers do not compete for cores. Not supported with cache, racing_bound, fidelities, steady_state mode or islands, which skip or cut evaluations. Default is None.
+        :type objectives: list
+
+        :param cpu_budget: If given, number of cores split between workers, folds fitted at the same time and threads of each model (BLAS and OpenMP threads, and the n_jobs or nthread parameter of the model unless model_parameters sets it), or -1 for all cores. n_workers is then chosen by the split, which is picked again from fit times measured in the first generation. With islands, the budget is shared equally by islands. Not supported by distributed backend. Default is None.
+        :type cpu_budget: int
+
+        :param random_state: Seed of the algorithm and cross validation folds. With a fixed seed, all backends return the same results. Default is None.
+        :type random_state: int
+
+        :param cache_size: Number of scores kept in the fitness cache, so individuals that are already scored are not cross validated again. 0 disables the cache. Default is 0.
+        :type cache_size: int
+
+        :param cache_decimals: If given, float hyperparameters are rounded to this number of decimals for looking up the cache. Default is None.
+        :type cache_decimals: int
+
+        :param cache_path: Path of a SQLite file that the cache is persisted to, so repeated runs skip individuals scored before. Default is None.
+        :type cache_path: str
+
+        :param checkpoint_path: Path of the checkpoint file the state of the optimization is periodically saved to. An interrupted run can be continued with :meth:`Tuner.resume`. The fitness cache is not part of the checkpoint. Default is None.
+        :type checkpoint_path: str
+
+        :param checkpoint_every: Number of generations between checkpoints. If neither checkpoint_every nor checkpoint_seconds is given, a checkpoint is saved every generation. Default is None.
+        :type checkpoint_every: int
+
+        :param checkpoint_seconds: Minimum number of seconds between checkpoints. Default is None.
+        :type checkpoint_seconds: int or float
+
+        :param racing_bound: If given, children are cross validated one fold at a time, and stop being evaluated once their running mean score, moved by this margin in their favor, is still worse than their parent score. Larger values abort fewer children. Default is None.
+        :type racing_bound: int or float
+
+        :param cv_refresh: Number of generations between drawing new cross validation folds. When folds change, the population is scored again on the new folds, so parents and children are always compared on identical splits. If None, the same folds are used for the whole run. Default is None.
+        :type cv_refresh: int
+
+        :param mode: Accepted values are "generational" and "steady_state". In generational mode, all children of a generation are scored as a batch before selection. In steady_state mode, a new child is dispatched as soon as a worker is free and replaces its parent as soon as it is scored, so workers do not wait for slow evaluations. Progress, checkpoints and stop criteria are then applied every pop_size finished evaluations. Steady-state runs are not reproducible with multiple workers. Default is "generational".
+        :type mode: str
+
+        :param callbacks: A list of callbacks notified when evaluations start and end and when generations end, with timing records of each evaluation and aggregates of each generation. With islands, callbacks run in the calling process and receive events of every island, tagged with its index. A failing callback does not stop the optimization, its first error is raised once the run ended. see :class:`ga_hypertuner.callbacks.Callback`. Default is None.
+        :type callbacks: list
+
+        :param surrogate: If given, a regression model of scores, trained on every evaluation so far, ranks several candidate children of each parent by expected improvement, and only the best candidate is cross validated. This spends less cross validation fits on poor children. Accepted values are "random_forest" and "gaussian_process". Default is None.
+        :type surrogate: str
+
+        :param surrogate_candidates: Number of candidate children created for each parent when a surrogate is used. Accepted values are integers greater than 0. Default is 4.
+        :type surrogate_candidates: int
+
+        :param stop_patience: If given, the algorithm stops once the best score did not improve by more than stop_min_delta for this many generations. Default is None.
+        :type stop_patience: int
+
+        :param stop_min_delta: Improvements of the best score smaller than or equal to this are not counted by stop_patience. Default is 0.
+        :type stop_min_delta: int or float
+
+        :param stop_spread: If given, the algorithm stops once the population has converged, that is once the standard deviation of every hyperparameter in the population, relative to the width of its boundaries, is below this value. Default is None.
+        :type stop_spread: float
+
+        :param max_seconds: If given, the algorithm stops once it has run for this many wall-clock seconds, counting time before it was resumed. It is checked between generations. Default is None.
+        :type max_seconds: int or float
+
+        :param max_fits: If given, the algorithm stops once this many models were fitted, counting one fit per cross validation fold. It is checked between generations. Default is None.
+        :type max_fits: int
+
+        All stop criteria are checked at the end of each generation, and the reason the algorithm stopped is reported.
+
+        :param fidelities: If given, children are first scored on small subsamples of training data, and only survivors are promoted to larger ones, in a successive halving ladder. This is an increasing list of fractions of training data, for example [0.1, 0.3, 1.0], and full data is always the last fraction. Subsamples are seeded, and stratified if cross validation is. Children that are not promoted to full data keep their parents. Only accepted in generational mode. Default is None.
+        :type fidelities: list
+
+        :param promotion_rate: Fraction of children promoted from each fidelity to the next. Accepted values are floats between 0 and 1. Default is 0.5.
+        :type promotion_rate: float
+
+        :param n_islands: Number of populations of the island model. If greater than 1, each island is a population of pop_size individuals that evolves in its own process, and islands periodically exchange their best individuals. The best hyperparameters found by any island are returned. Checkpoints are not supported in island model. Default is 1.
+        :type n_islands: int
+
+        :param topology: Which islands exchange individuals. Accepted values are "ring", where each island sends migrants to the next one, and "full", where each island sends migrants to all others. Default is "ring".
+        :type topology: str
+
+        :param migration_interval: Number of generations between migrations. Default is 5.
+        :type migration_interval: int
+
+        :param migration_size: Number of best individuals each island sends to each neighbor. They replace worst individuals of the neighbor that are worse than them. Default is 1.
+        :type migration_size: int
+
+        :param island_parameters: If given, a list with a dictionary for each island, whose values replace GA parameters of that island, so islands can search with different fscale and cp. For example [{"fscale": 0.3}, {"fscale": 0.9, "cp": 0.2}]. Default is None.
+        :type island_parameters: list
         :GA Parameters:
             * *direction* (``int``): Determines whether the score of models should be maximized or minimized. Accepted values are ["max","min"].
             * *pop_size* (``int``): Size of population in each generation. Increasing this value will reduce the chance of local optima. Accepted values are integers greater than 5. Default is 20.
             * *gmax* (``int``): Maximum number of generations. After this many generations, the algorithm will stop and return the best params. Accepted values are integers greater than 1. Default is 50.
             * *fscale* (``int``): A scaling factor that controls the amount of effect that differences between parameters of population members have. larger values will result in larger convergence rate. When convergence rate is higher, it will take less time for algorithm to reach local optimum, but the local optimum have lesser chance of being global. Reducing it will opposite result Accepted values are floats between 0 and 1. Default is 0.5.
             * *cp* (``int``): The probability that a child will inherit a parameter from a parent instead of a trial vector. Accepted values are floats between 0 and 1. Default is 0.5.
-        :return: a dictionary containing the best hyperparameters.
+        :return: a dictionary containing the best hyperparameters, or, if objectives are given, a list of individuals of the Pareto front, best score first.
         """
 
         # making verbosity mutable, so it can be changed in scope of static methods
@@ -82,6 +245,27 @@ class Tuner:
         Tuner._check_ga_params(ga_parameters)
         Tuner._check_m_parameters(model_parameters, boundaries)
         Tuner._check_ga_hypertuner_parameters(stop_value, v_list, stratified, show_progress_plot, plot_step)
+        Tuner._check_evaluation_parameters(n_workers, backend, random_state)
+        Tuner._check_broker_parameters(broker_address, broker_authkey)
+        Tuner._check_timeout_parameters(timeout, timeout_penalty)
+        Tuner._check_cpu_budget(cpu_budget, backend)
+        Tuner._check_plot_path(plot_path)
+        Tuner._check_history_path(history_path)
+        Tuner._check_warm_start(warm_start, warm_start_rescore)
+        Tuner._check_strategy_parameters(strategy, adaptation, ga_parameters)
+        Tuner._check_init_parameters(init, opposition)
+        Tuner._check_objectives(objectives, mode, cache_size, cache_path, racing_bound, fidelities, n_islands)
+        Tuner._check_cache_parameters(cache_size, cache_decimals, cache_path)
+        Tuner._check_checkpoint_parameters(checkpoint_path, checkpoint_every, checkpoint_seconds)
+        Tuner._check_racing_parameters(racing_bound)
+        Tuner._check_cv_parameters(cv_refresh)
+        Tuner._check_mode_parameters(mode)
+        Tuner._check_callbacks(callbacks)
+        Tuner._check_surrogate_parameters(surrogate, surrogate_candidates)
+        Tuner._check_stop_parameters(stop_patience, stop_min_delta, stop_spread, max_seconds, max_fits)
+        Tuner._check_fidelity_parameters(fidelities, promotion_rate, mode)
+        Tuner._check_island_parameters(n_islands, topology, migration_interval, migration_size, island_parameters,
+                                       ga_parameters, checkpoint_path)
 
         # set values for verbosity and
         verbosity = v_list[0]
@@ -89,15 +273,71 @@ class Tuner:
             stop_criteria = True
 
         # start algorithm
-        ga = GA(ga_parameters, model, model_parameters
-                , boundaries, x_train, y_train
-                , scoring, stop_criteria=stop_criteria
-                , stop_value=stop_value, stratified=stratified
-                , k=k, verbosity=verbosity, show_progress_plot=show_progress_plot
-                , plot_step=plot_step)
-
+        settings = {"ga_parameters": ga_parameters, "model_class": model, "model_parameters": model_parameters,
+                    "boundaries": boundaries, "scoring": scoring, "stop_criteria": stop_criteria,
+                    "stop_value": stop_value, "stratified": stratified, "k": k, "verbosity": verbosity,
+                    "show_progress_plot": show_progress_plot, "plot_step": plot_step, "n_workers": n_workers,
+                    "backend": backend, "random_state": random_state, "cache_size": cache_size,
+                    "cache_decimals": cache_decimals, "cache_path": cache_path, "checkpoint_path": checkpoint_path,
+                    "checkpoint_every": checkpoint_every, "checkpoint_seconds": checkpoint_seconds,
+                    "racing_bound": racing_bound, "cv_refresh": cv_refresh, "mode": mode, "callbacks": callbacks,
+                    "surrogate": surrogate, "surrogate_candidates": surrogate_candidates,
+                    "stop_patience": stop_patience, "stop_min_delta": stop_min_delta, "stop_spread": stop_spread,
+                    "max_seconds": max_seconds, "max_fits": max_fits, "fidelities": fidelities,
+                    "promotion_rate": promotion_rate, "broker_address": broker_address,
+                    "broker_authkey": broker_authkey, "timeout": timeout, "timeout_penalty": timeout_penalty,
+                    "cpu_budget": cpu_budget, "plot_path": plot_path, "history_path": history_path,
+                    "warm_start": warm_start, "warm_start_rescore": warm_start_rescore, "strategy": strategy,
+                    "adaptation": adaptation, "init": init, "opposition": opposition, "objectives": objectives}
+        if n_islands > 1:
+            return Archipelago(settings, x_train, y_train, n_islands, topology=topology,
+                               migration_interval=migration_interval, migration_size=migration_size,
+                               island_parameters=island_parameters).main()
+
+        ga = GA(x_train=x_train, y_train=y_train, **settings)
         return ga.main()
 
+    @staticmethod
+    def resume(path, x_train, y_train, n_workers: int = None, backend: str = None, callbacks: list = None):
+        """
+        Continues an optimization from a checkpoint saved by :meth:`Tuner.tune`. Given the same training data, the run continues exactly as if it had never been interrupted, with the same scores and populations. The fitness cache is not saved in checkpoints, so a resumed run starts with an empty in-memory cache and may cross validate again individuals an uninterrupted run would have taken from the cache; use cache_path to keep cached scores across runs.
+
+        :param path: Path of the checkpoint file.
+        :type path: str
+
+        :param x_train: Training features the interrupted optimization was using.
+        :type x_train: Dataframe
+
+        :param y_train: Training target the interrupted optimization was using.
+        :type y_train: Dataframe
+
+        :param n_workers: If given, replaces the number of workers of the interrupted optimization. Default is None.
+        :type n_workers: int
+
+        :param backend: If given, replaces the evaluation backend of the interrupted optimization. Default is None.
+        :type backend: str
+
+        :param callbacks: A list of callbacks. Callbacks are not saved in checkpoints, so they are given again on resume. Default is None.
+        :type callbacks: list
+
+        :return: a dictionary containing the best hyperparameters, or, if objectives were given, a list of individuals of the Pareto front.
+        """
+        state = Checkpoint.load(path)
+        settings = dict(state["settings"])
+        if n_workers is not None:
+            settings["n_workers"] = n_workers
+        if backend is not None:
+            settings["backend"] = backend
+        Tuner._check_evaluation_parameters(settings["n_workers"], settings["backend"], settings["random_state"])
+        Tuner._check_cpu_budget(settings["cpu_budget"], settings["backend"])
+        Tuner._check_callbacks(callbacks)
+
+        if state["data_fingerprint"] != [FitnessCache.fingerprint(x_train), FitnessCache.fingerprint(y_train)]:
+            GaHypertunerParamException.warning(GaHypertunerParamException.CHECKPOINT_DATA_WARNING)
+
+        ga = GA(x_train=x_train, y_train=y_train, callbacks=callbacks, **settings)
+        return ga.main(state)
+
     @staticmethod
     def _check_ga_params(ga_parameters):
 
@@ -139,15 +379,22 @@ class Tuner:
 
         """
         Checks model parameters.
-        :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list either like [None, Parameter Type] (for optimization of parameter) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
+        :param model_parameters: hyperparameters that are being optimized. This is a dictionary with parameters of the machine learning model as keys and a list like [None, Parameter Type] (for optimization of parameter), [None, Parameter Type, Scale] or [None, Parameter Type, Scale, Step] (for log-scale or quantized optimization), [None, "categorical"] (for choosing one of the values given as boundaries) or [Static Value, Parameter] (for passing the parameter as a static value that will not be changed).
         :type model_parameters: dict
 
-        :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end].
+        :param boundaries: Boundary search for hyperparameters. This is a dictionary with parameters of the machine learning model as keys and a list like [start,end], or a list of choices of a categorical parameter.
         :type boundaries: dict
         :return: None
         """
 
+        categorical = [k for k, v in model_parameters.items() if type(v) == list and len(v) > 1 and v[0] is None
+                       and v[1] == "categorical"]
         for k in list(boundaries.keys()):
+            if k in categorical:
+                choices = boundaries[k]
+                if type(choices) != list or len([c for i, c in enumerate(choices) if c not in choices[:i]]) < 2:
+                    raise MParamsException(MParamsException.BOUNDARY_CHOICES, k)
+                continue
             if len(boundaries[k]) != 2:
                 raise MParamsException(MParamsException.BOUNDARY_VALUE, k)
             if boundaries[k][0] >= boundaries[k][1]:
@@ -155,13 +402,21 @@ class Tuner:
 
         for k in list(model_parameters.keys()):
             if type(model_parameters[k]) == list:
-                if type(model_parameters[k][1]) != type and model_parameters[k][0] is None:
+                if type(model_parameters[k][1]) != type and model_parameters[k][0] is None and k not in categorical:
                     raise MParamsException(MParamsException.PARAMETER_WRONG_FORMAT, k)
                 if model_parameters[k][0] is not None and type(model_parameters[k][0]) != model_parameters[k][1]:
                     raise MParamsException(MParamsException.PARAMETER_WRONG_FORMAT, k)
                 if model_parameters[k][0] is None:
                     if k not in list(boundaries.keys()):
                         raise MParamsException(MParamsException.KEYS_NOT_EQUAL)
+                    # a scale and then a step may follow the type of a numeric parameter
+                    options = model_parameters[k][2:]
+                    if options and (k in categorical or len(options) > 2 or options[0] not in ["linear", "log"]):
+                        raise MParamsException(MParamsException.PARAMETER_WRONG_FORMAT, k)
+                    if len(options) == 2 and (type(options[1]) not in [int, float] or options[1] <= 0):
+                        raise MParamsException(MParamsException.STEP_INVALID, k)
+                    if options[:1] == ["log"] and boundaries[k][0] <= 0:
+                        raise MParamsException(MParamsException.BOUNDARY_LOG, k)
 
     @staticmethod
     def _check_ga_hypertuner_parameters(stop_value, verbosity, stratified, show_progress_plot, plot_step):
@@ -200,3 +455,503 @@ class Tuner:
         if verbosity[0] not in [0, 1, 2, 3]:
             verbosity[0] = 1
             GaHypertunerParamException.warning(GaHypertunerParamException.VERBOSITY_WARNING)
+
+    @staticmethod
+    def _check_evaluation_parameters(n_workers, backend, random_state):
+        """
+        Check parameters of population evaluation.
+        :param n_workers: Number of workers that evaluate individuals of a generation in parallel.
+        :type n_workers: int
+
+        :param backend: Backend used for evaluating individuals. Accepted values are "serial", "thread", "process" and "distributed".
+        :type backend: str
+
+        :param random_state: Seed of the algorithm and cross validation folds.
+        :type random_state: int
+
+        :return: None
+        """
+        if type(n_workers) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "n_workers", "int")
+        if n_workers < 1 and not (backend == "distributed" and n_workers == 0):
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "n_workers",
+                                             "integers greater than 0, or 0 for distributed backend")
+        if backend not in Evaluator.backends:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "backend",
+                                             str(Evaluator.backends))
+        if random_state is not None and type(random_state) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "random_state", "int")
+
+    @staticmethod
+    def _check_cache_parameters(cache_size, cache_decimals, cache_path):
+        """
+        Check parameters of fitness cache.
+        :param cache_size: Number of scores kept in the fitness cache. 0 disables the cache.
+        :type cache_size: int
+
+        :param cache_decimals: Number of decimals float hyperparameters are rounded to for looking up the cache.
+        :type cache_decimals: int
+
+        :param cache_path: Path of a SQLite file that the cache is persisted to.
+        :type cache_path: str
+
+        :return: None
+        """
+        if type(cache_size) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "cache_size", "int")
+        if cache_size < 0:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "cache_size",
+                                             "integers greater than or equal to 0")
+        if cache_decimals is not None and type(cache_decimals) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "cache_decimals", "int")
+        if cache_path is not None and type(cache_path) != str:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "cache_path", "str")
+
+    @staticmethod
+    def _check_checkpoint_parameters(checkpoint_path, checkpoint_every, checkpoint_seconds):
+        """
+        Check parameters of checkpointing.
+        :param checkpoint_path: Path of the checkpoint file.
+        :type checkpoint_path: str
+
+        :param checkpoint_every: Number of generations between checkpoints.
+        :type checkpoint_every: int
+
+        :param checkpoint_seconds: Minimum number of seconds between checkpoints.
+        :type checkpoint_seconds: int or float
+
+        :return: None
+        """
+        if checkpoint_path is not None and type(checkpoint_path) != str:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "checkpoint_path", "str")
+        if checkpoint_every is not None:
+            if type(checkpoint_every) != int:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "checkpoint_every",
+                                                 "int")
+            if checkpoint_every < 1:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE,
+                                                 "checkpoint_every", "integers greater than 0")
+        if checkpoint_seconds is not None:
+            if type(checkpoint_seconds) != int and type(checkpoint_seconds) != float:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "checkpoint_seconds",
+                                                 "number")
+            if checkpoint_seconds <= 0:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE,
+                                                 "checkpoint_seconds", "numbers greater than 0")
+
+    @staticmethod
+    def _check_racing_parameters(racing_bound):
+        """
+        Check parameters of fold level racing.
+        :param racing_bound: Margin used for racing children against their parents.
+        :type racing_bound: int or float
+
+        :return: None
+        """
+        if racing_bound is not None:
+            if type(racing_bound) != int and type(racing_bound) != float:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "racing_bound",
+                                                 "number")
+            if racing_bound < 0:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "racing_bound",
+                                                 "numbers greater than or equal to 0")
+
+    @staticmethod
+    def _check_cv_parameters(cv_refresh):
+        """
+        Check parameters of cross validation folds.
+        :param cv_refresh: Number of generations between drawing new cross validation folds.
+        :type cv_refresh: int
+
+        :return: None
+        """
+        if cv_refresh is not None:
+            if type(cv_refresh) != int:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "cv_refresh", "int")
+            if cv_refresh < 1:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "cv_refresh",
+                                                 "integers greater than 0")
+
+    @staticmethod
+    def _check_mode_parameters(mode):
+        """
+        Check mode of the algorithm.
+        :param mode: Accepted values are "generational" and "steady_state".
+        :type mode: str
+
+        :return: None
+        """
+        if mode not in GA.modes:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "mode", str(GA.modes))
+
+    @staticmethod
+    def _check_strategy_parameters(strategy, adaptation, ga_parameters):
+        """
+        Check mutation strategy and parameter adaptation.
+        :param strategy: Mutation strategy.
+        :type strategy: str
+
+        :param adaptation: Method of parameter adaptation.
+        :type adaptation: str
+
+        :param ga_parameters: Parameters of the genetic algorithm.
+        :type ga_parameters: dict
+
+        :return: None
+        """
+        if strategy not in GA.strategies:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "strategy",
+                                             str(list(GA.strategies.keys())))
+        # donors are different from each other and from the parent
+        if ga_parameters["pop_size"] <= GA.strategies[strategy]:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "strategy",
+                                             "strategies using fewer than pop_size donors")
+        if adaptation is not None and adaptation not in Adaptation.methods:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "adaptation",
+                                             str(Adaptation.methods))
+
+    @staticmethod
+    def _check_init_parameters(init, opposition):
+        """
+        Check parameters of population initialization.
+        :param init: Method the initial population is drawn with.
+        :type init: str
+
+        :param opposition: Whether opposition-based initialization is used.
+        :type opposition: bool
+
+        :return: None
+        """
+        if init not in SearchSpace.samplers:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "init",
+                                             str(SearchSpace.samplers))
+        if type(opposition) != bool:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "opposition", "bool")
+
+    @staticmethod
+    def _check_objectives(objectives, mode, cache_size, cache_path, racing_bound, fidelities, n_islands):
+        """
+        Check objectives of multi-objective optimization, and that every evaluation is complete and measured.
+        :param objectives: A list of objectives minimized together with the score.
+        :type objectives: list
+
+        :param mode: mode of the algorithm.
+        :type mode: str
+
+        :param cache_size: Number of scores kept in the fitness cache.
+        :type cache_size: int
+
+        :param cache_path: Path of the cache file.
+        :type cache_path: str
+
+        :param racing_bound: Margin used for racing.
+        :type racing_bound: int or float
+
+        :param fidelities: A list of fractions of training data.
+        :type fidelities: list
+
+        :param n_islands: Number of populations of the island model.
+        :type n_islands: int
+
+        :return: None
+        """
+        if objectives is None:
+            return
+        if type(objectives) != list or any(type(name) != str for name in objectives):
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "objectives",
+                                             "list of str")
+        if not objectives or len(set(objectives)) != len(objectives) or \
+                any(name not in Pareto.objectives for name in objectives):
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "objectives",
+                                             "non-empty lists of distinct values of " + str(Pareto.objectives))
+        # cached evaluations are not timed, raced and low fidelity evaluations are partial
+        for name, conflict, accepted in [("mode", mode != "generational", "\"generational\""),
+                                         ("cache_size", cache_size != 0, "0"),
+                                         ("cache_path", cache_path is not None, "None"),
+                                         ("racing_bound", racing_bound is not None, "None"),
+                                         ("fidelities", fidelities is not None, "None"),
+                                         ("n_islands", n_islands != 1, "1")]:
+            if conflict:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, name,
+                                                 accepted + " when objectives are given")
+
+    @staticmethod
+    def _check_callbacks(callbacks):
+        """
+        Check callbacks.
+        :param callbacks: A list of callbacks.
+        :type callbacks: list
+
+        :return: None
+        """
+        if callbacks is not None:
+            if type(callbacks) != list:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "callbacks", "list")
+            for callback in callbacks:
+                if not isinstance(callback, Callback):
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "callbacks",
+                                                     "list of Callback")
+
+    @staticmethod
+    def _check_surrogate_parameters(surrogate, surrogate_candidates):
+        """
+        Check parameters of surrogate pre-screening.
+        :param surrogate: Type of regression model.
+        :type surrogate: str
+
+        :param surrogate_candidates: Number of candidate children created for each parent.
+        :type surrogate_candidates: int
+
+        :return: None
+        """
+        if surrogate is not None and surrogate not in Surrogate.models:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "surrogate",
+                                             str(Surrogate.models))
+        if type(surrogate_candidates) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "surrogate_candidates",
+                                             "int")
+        if surrogate_candidates < 1:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE,
+                                             "surrogate_candidates", "integers greater than 0")
+
+    @staticmethod
+    def _check_stop_parameters(stop_patience, stop_min_delta, stop_spread, max_seconds, max_fits):
+        """
+        Check parameters of stop criteria.
+        :param stop_patience: Number of generations without improvement before stopping.
+        :type stop_patience: int
+
+        :param stop_min_delta: Minimum improvement counted by stop_patience.
+        :type stop_min_delta: int or float
+
+        :param stop_spread: Spread of population below which the algorithm stops.
+        :type stop_spread: float
+
+        :param max_seconds: Wall-clock seconds after which the algorithm stops.
+        :type max_seconds: int or float
+
+        :param max_fits: Number of model fits after which the algorithm stops.
+        :type max_fits: int
+
+        :return: None
+        """
+        for name, value in [("stop_patience", stop_patience), ("max_fits", max_fits)]:
+            if value is not None:
+                if type(value) != int:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, name, "int")
+                if value < 1:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, name,
+                                                     "integers greater than 0")
+        for name, value in [("stop_min_delta", stop_min_delta), ("stop_spread", stop_spread),
+                            ("max_seconds", max_seconds)]:
+            if value is not None:
+                if type(value) != int and type(value) != float:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, name, "number")
+                if value < 0:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, name,
+                                                     "numbers greater than or equal to 0")
+
+    @staticmethod
+    def _check_fidelity_parameters(fidelities, promotion_rate, mode):
+        """
+        Check parameters of multi-fidelity evaluation.
+        :param fidelities: A list of fractions of training data.
+        :type fidelities: list
+
+        :param promotion_rate: Fraction of children promoted from each fidelity to the next.
+        :type promotion_rate: float
+
+        :param mode: mode of the algorithm.
+        :type mode: str
+
+        :return: None
+        """
+        if fidelities is not None:
+            if type(fidelities) != list:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "fidelities", "list")
+            for fidelity in fidelities:
+                if type(fidelity) != float and type(fidelity) != int:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "fidelities",
+                                                     "list of numbers")
+                if fidelity <= 0 or fidelity > 1:
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "fidelities",
+                                                     "numbers greater than 0 and less than or equal to 1")
+            if mode != "generational":
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "mode",
+                                                 "\"generational\" when fidelities are given")
+        if type(promotion_rate) != float:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "promotion_rate", "float")
+        if promotion_rate <= 0 or promotion_rate > 1:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "promotion_rate",
+                                             "floats greater than 0 and less than or equal to 1")
+
+    @staticmethod
+    def _check_island_parameters(n_islands, topology, migration_interval, migration_size, island_parameters,
+                                 ga_parameters, checkpoint_path):
+        """
+        Check parameters of island model.
+        :param n_islands: Number of populations of the island model.
+        :type n_islands: int
+
+        :param topology: Which islands exchange individuals.
+        :type topology: str
+
+        :param migration_interval: Number of generations between migrations.
+        :type migration_interval: int
+
+        :param migration_size: Number of best individuals each island sends to each neighbor.
+        :type migration_size: int
+
+        :param island_parameters: A list of GA parameters of each island.
+        :type island_parameters: list
+
+        :param ga_parameters: Parameters of the genetic algorithm.
+        :type ga_parameters: dict
+
+        :param checkpoint_path: Path of the checkpoint file.
+        :type checkpoint_path: str
+
+        :return: None
+        """
+        for name, value in [("n_islands", n_islands), ("migration_interval", migration_interval),
+                            ("migration_size", migration_size)]:
+            if type(value) != int:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, name, "int")
+            if value < 1:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, name,
+                                                 "integers greater than 0")
+        if topology not in Archipelago.topologies:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "topology",
+                                             str(Archipelago.topologies))
+        if migration_size > ga_parameters["pop_size"]:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "migration_size",
+                                             "integers less than or equal to pop_size")
+        if island_parameters is not None:
+            if type(island_parameters) != list or any(type(p) != dict for p in island_parameters):
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE,
+                                                 "island_parameters", "list of dict")
+            if len(island_parameters) != n_islands:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE,
+                                                 "island_parameters", "lists with a dictionary for each island")
+            for parameters in island_parameters:
+                Tuner._check_ga_params(dict(ga_parameters, **parameters))
+        if n_islands > 1 and checkpoint_path is not None:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "checkpoint_path",
+                                             "None when n_islands is greater than 1")
+
+    @staticmethod
+    def _check_broker_parameters(broker_address, broker_authkey):
+        """
+        Check parameters of distributed backend.
+        :param broker_address: "host:port" the broker listens on.
+        :type broker_address: str
+
+        :param broker_authkey: Key workers authenticate with.
+        :type broker_authkey: str
+
+        :return: None
+        """
+        if broker_address is not None:
+            if type(broker_address) != str:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "broker_address",
+                                                 "str")
+            host, _, port = broker_address.rpartition(":")
+            if not host or not port.isdigit():
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "broker_address",
+                                                 "strings like \"host:port\"")
+        if broker_authkey is not None and type(broker_authkey) != str:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "broker_authkey", "str")
+
+    @staticmethod
+    def _check_timeout_parameters(timeout, timeout_penalty):
+        """
+        Check parameters of evaluation timeout.
+        :param timeout: Number of seconds an evaluation may take.
+        :type timeout: int or float
+
+        :param timeout_penalty: Score of individuals whose evaluation timed out.
+        :type timeout_penalty: int or float
+
+        :return: None
+        """
+        if timeout is not None:
+            if type(timeout) != int and type(timeout) != float:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "timeout",
+                                                 "int or float")
+            if timeout <= 0:
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "timeout",
+                                                 "numbers greater than 0")
+        if timeout_penalty is not None and type(timeout_penalty) != int and type(timeout_penalty) != float:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "timeout_penalty",
+                                             "int or float")
+
+    @staticmethod
+    def _check_plot_path(plot_path):
+        """
+        Check path of the progress plot image.
+        :param plot_path: Path of the image file.
+        :type plot_path: str
+
+        :return: None
+        """
+        if plot_path is not None and type(plot_path) != str:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "plot_path", "str")
+
+    @staticmethod
+    def _check_history_path(history_path):
+        """
+        Check path of the evaluation history file.
+        :param history_path: Path of the history file.
+        :type history_path: str
+
+        :return: None
+        """
+        if history_path is not None and type(history_path) != str:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "history_path", "str")
+
+    @staticmethod
+    def _check_warm_start(warm_start, warm_start_rescore):
+        """
+        Check parameters of warm start.
+        :param warm_start: Seeds of the initial population, or path of a history or checkpoint file.
+        :type warm_start: list or str
+
+        :param warm_start_rescore: Whether seeds are scored again.
+        :type warm_start_rescore: bool
+
+        :return: None
+        """
+        if warm_start is not None:
+            if type(warm_start) == str:
+                if not os.path.exists(warm_start):
+                    raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "warm_start",
+                                                     "paths of existing history or checkpoint files")
+            elif type(warm_start) != list or any(type(params) != dict for params in warm_start):
+                raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "warm_start",
+                                                 "list of dictionaries or str")
+        if type(warm_start_rescore) != bool:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "warm_start_rescore",
+                                             "bool")
+
+    @staticmethod
+    def _check_cpu_budget(cpu_budget, backend):
+        """
+        Check CPU budget.
+        :param cpu_budget: Number of cores split between workers, folds and model threads.
+        :type cpu_budget: int
+
+        :param backend: Backend used for evaluating individuals.
+        :type backend: str
+
+        :return: None
+        """
+        if cpu_budget is None:
+            return
+        if type(cpu_budget) != int:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_WRONG_TYPE, "cpu_budget", "int")
+        if cpu_budget < 1 and cpu_budget != -1:
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "cpu_budget",
+                                             "-1 or integers greater than 0")
+        if backend == "distributed":
+            raise GaHypertunerParamException(GaHypertunerParamException.PARAMETER_INVALID_VALUE, "cpu_budget",
+                                             "None when backend is \"distributed\"")
@@ -1,11 +1,14 @@
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
+import os
 
 
 class Visualize:
     """
-    A class containing methods for visualizing progress of optimization.
+    A class containing methods for visualizing progress of optimization. matplotlib is imported on first use, so runs without plots never pay for it.
+
+    :ivar progress_figure: number of the pyplot figure the progress plot is redrawn on.
     """
+    progress_figure = "ga_hypertuner progress"
+
     @staticmethod
     def progress_band(maxs, mins, means, score_name):
         """
@@ -22,22 +25,84 @@ class Visualize:
         :param score_name: The scoring criteria that the algorithm tries to optimize. Accepted values are scores that scikit cross validation accepts.
         :type score_name: str
 
-        :return: None, but displays a line chart of the score progress by generation.
+        :return: None, but displays a line chart of the score progress by generation, without waiting for its window to be closed.
         """
 
+        import matplotlib.pyplot as plt
+
         print("-" * 50)
-        plt.figure(figsize=(8, 4))
+        # the same figure is redrawn, so figures and windows do not pile up during a long run
+        figure = plt.figure(num=Visualize.progress_figure, figsize=(8, 4))
+        figure.clf()
+        Visualize.draw_progress_band(figure.gca(), maxs, mins, means, score_name)
+        # a blocking show would stop the optimization until the window is closed
+        plt.show(block=False)
+        plt.pause(0.001)
+
+    @staticmethod
+    def close_progress_band():
+        """
+        Closes the figure of :meth:`Visualize.progress_band`, if it is open.
+
+        :return: None
+        """
+        import matplotlib.pyplot as plt
+
+        plt.close(Visualize.progress_figure)
+
+    @staticmethod
+    def save_progress_band(maxs, mins, means, score_name, path):
+        """
+        Renders the chart of :meth:`Visualize.progress_band` to an image file, without pyplot, so it is safe to call from a background thread and needs no display. The image is written to a temporary file first and then moved over path, so readers never see a partial image.
+
+        :param maxs: a list of the maximum scores for each generation.
+        :type maxs: list
+
+        :param mins: a list of the minimum scores for each generation.
+        :type mins: list
+
+        :param means: a list of the mean scores for each generation.
+        :type means: list
+
+        :param score_name: The scoring criteria that the algorithm tries to optimize.
+        :type score_name: str
+
+        :param path: Path of the image. Its extension selects the format, for example ".png" or ".svg".
+        :type path: str
+
+        :return: None
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=(8, 4))
+        FigureCanvasAgg(figure)
+        Visualize.draw_progress_band(figure.gca(), maxs, mins, means, score_name)
+        root, extension = os.path.splitext(path)
+        tmp_path = root + ".tmp" + extension
+        figure.savefig(tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def draw_progress_band(ax, maxs, mins, means, score_name):
+        """
+        Draws the line chart of score progress on axes.
+
+        :param ax: matplotlib axes the chart is drawn on.
+
+        :return: None
+        """
+        from matplotlib.ticker import MaxNLocator
+
         x = range(1, len(maxs) + 1)
-        plt.xticks(x)
-        plt.grid()
-        plt.title(score_name + " Progress By Generation", fontsize=12)
-        plt.ylabel(score_name, fontsize=12)
-        plt.xlabel("Generation", fontsize=12)
-        plt.plot(x, maxs, label="Max " + score_name, linewidth=2, color="blue")
-        plt.plot(x, means, label="Mean " + score_name, linewidth=2, color="#9C27B0")
-        plt.plot(x, mins, label="Min " + score_name, linewidth=2, color="red")
-        plt.fill_between(x, maxs, mins, color="#9C27B0", alpha=0.2)
-        plt.legend(loc="upper left", prop={'size': 8})
-        ax = plt.gca()
+        ax.set_xticks(x)
+        ax.grid()
+        ax.set_title(score_name + " Progress By Generation", fontsize=12)
+        ax.set_ylabel(score_name, fontsize=12)
+        ax.set_xlabel("Generation", fontsize=12)
+        ax.plot(x, maxs, label="Max " + score_name, linewidth=2, color="blue")
+        ax.plot(x, means, label="Mean " + score_name, linewidth=2, color="#9C27B0")
+        ax.plot(x, mins, label="Min " + score_name, linewidth=2, color="red")
+        ax.fill_between(x, maxs, mins, color="#9C27B0", alpha=0.2)
+        ax.legend(loc="upper left", prop={'size': 8})
         ax.xaxis.set_major_locator(MaxNLocator(integer=True, prune='both', nbins=15))
-        plt.show()
@@ -0,0 +1,102 @@
+import argparse
+import os
+import socket
+import threading
+import time
+import traceback
+from ga_hypertuner.broker import AUTHKEY_ENV, BrokerManager
+
+
+def run(address, authkey, heartbeat_interval=2.0):
+    """
+    Connects to a broker, and evaluates its tasks until the broker is closed or goes away. A background thread sends heartbeats, so the broker can tell a worker running a long evaluation from a lost one.
+
+    :param address: "host:port" of the broker.
+    :type address: str
+
+    :param authkey: Key of the broker.
+    :type authkey: str
+
+    :param heartbeat_interval: Number of seconds between heartbeats. Default is 2.
+    :type heartbeat_interval: int or float
+
+    :return: number of evaluated tasks.
+    :rtype: int
+    """
+    host, port = address.rsplit(":", 1)
+    manager = BrokerManager(address=(host, int(port)), authkey=authkey.encode())
+    manager.connect()
+    state = manager.broker()
+    worker = socket.gethostname() + ":" + str(os.getpid())
+    scorer = state.register(worker)
+    if scorer is None:
+        return 0
+    scorer.limit_threads()
+
+    stop = threading.Event()
+
+    def heartbeat():
+        while not stop.wait(heartbeat_interval):
+            try:
+                if not state.heartbeat(worker):
+                    stop.set()
+            except (EOFError, OSError):
+                stop.set()
+
+    threading.Thread(target=heartbeat, name="ga_hypertuner-heartbeat", daemon=True).start()
+    done = 0
+    try:
+        while not stop.is_set():
+            task = state.get_task(worker, 1.0)
+            if task is False:
+                break
+            if task is None:
+                continue
+            task_id, (params, threshold, epoch, fidelity) = task
+            try:
+                scorer.folds.set_epoch(epoch)
+                record = scorer.race(params, threshold, fidelity)
+            except Exception:
+                state.put_result(worker, task_id, None, traceback.format_exc())
+            else:
+                state.put_result(worker, task_id, record)
+            done += 1
+    except (EOFError, OSError):
+        # the broker went away, its driver collects what was already streamed back
+        pass
+    finally:
+        stop.set()
+    return done
+
+
+def main(argv=None):
+    """
+    Entry point of the ga_hypertuner-worker command, which starts a worker that evaluates individuals for a driver running with the "distributed" backend.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Worker that evaluates individuals for a ga_hypertuner broker.")
+    parser.add_argument("address", help="host:port of the broker.")
+    parser.add_argument("--authkey", default=os.environ.get(AUTHKEY_ENV),
+                        help="Key of the broker. Default is the " + AUTHKEY_ENV + " environment variable.")
+    parser.add_argument("--heartbeat", type=float, default=2.0, help="Seconds between heartbeats. Default is 2.")
+    parser.add_argument("--retry", type=float, default=None,
+                        help="If given, keep waiting for brokers, reconnecting every this many seconds, instead of "
+                             "exiting when the broker is closed or not reachable.")
+    args = parser.parse_args(argv)
+    if args.authkey is None:
+        parser.error("--authkey or " + AUTHKEY_ENV + " is required")
+
+    while True:
+        try:
+            run(args.address, args.authkey, args.heartbeat)
+        except (ConnectionError, EOFError, OSError):
+            if args.retry is None:
+                raise
+        if args.retry is None:
+            return
+        time.sleep(args.retry)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,5 +9,8 @@ setup(
     author='Amirali Omidvar',
     author_email='amirali.omidvar80@gmail.com',
     description='A Hyperparameter Tuner for Machine Learning Algorithms Powered By Genetic Algorithm (Differential Evolution) ',
-    include_package_data=False
+    include_package_data=False,
+    entry_points={
+        'console_scripts': ['ga_hypertuner-worker=ga_hypertuner.worker:main'],
+    }
 )
@@ -0,0 +1,20 @@
+import pytest
+from sklearn import datasets
+from sklearn.linear_model import LogisticRegression
+
+
+@pytest.fixture(scope="session")
+def iris():
+    return datasets.load_iris(return_X_y=True)
+
+
+@pytest.fixture
+def settings():
+    """
+    Settings of a small seeded optimization, accepted by GA as keyword arguments.
+    """
+    return {"ga_parameters": {"pop_size": 6, "fscale": 0.5, "gmax": 3, "direction": "max", "cp": 0.5},
+            "model_class": LogisticRegression,
+            "model_parameters": {"solver": "lbfgs", "C": [None, float], "max_iter": [None, int]},
+            "boundaries": {"C": [0.01, 1.0], "max_iter": [100, 400]},
+            "scoring": "accuracy", "k": 3, "stratified": True, "verbosity": 0, "random_state": 0}
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from ga_hypertuner.ga import GA
+
+
+def run(iris, settings, **overrides):
+    ga = GA(x_train=iris[0], y_train=iris[1], **dict(settings, **overrides))
+    best_params = ga.main()
+    return ga, best_params
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_backend_matches_serial(iris, settings, backend):
+    serial, serial_best = run(iris, settings)
+    parallel, parallel_best = run(iris, settings, backend=backend, n_workers=2)
+    assert parallel.max_scores == serial.max_scores
+    assert parallel.mean_scores == serial.mean_scores
+    assert parallel_best == serial_best
+
+
+def test_seed_makes_runs_reproducible(iris, settings):
+    first, _ = run(iris, settings)
+    second, _ = run(iris, settings)
+    assert first.mean_scores == second.mean_scores
+    assert first.best_params == second.best_params
+    assert np.all(np.isfinite(first.max_scores))
+    assert len(first.max_scores) == settings["ga_parameters"]["gmax"] - 1
@@ -0,0 +1,123 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from sklearn.linear_model import LogisticRegression
+from ga_hypertuner.broker import AUTHKEY_ENV, Broker, BrokerManager, BrokerState
+from ga_hypertuner.evaluation import Scorer
+from ga_hypertuner.ga import GA
+
+
+class SlowOnce(LogisticRegression):
+    """
+    Logistic regression whose first fit, across processes, hangs, so its worker can be killed mid-task.
+    """
+
+    def __init__(self, marker=None, C=1.0, max_iter=100):
+        super().__init__(C=C, max_iter=max_iter)
+        self.marker = marker
+
+    def fit(self, X, y, sample_weight=None):
+        if not os.path.exists(self.marker):
+            open(self.marker, "w").close()
+            time.sleep(60)
+        return super().fit(X, y, sample_weight)
+
+
+def wait_for(condition, timeout=30.0):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.1)
+
+
+def test_distributed_backend_matches_serial(iris, settings):
+    serial = GA(x_train=iris[0], y_train=iris[1], **settings)
+    serial_best = serial.main()
+    distributed = GA(x_train=iris[0], y_train=iris[1], backend="distributed", n_workers=2, **settings)
+    distributed_best = distributed.main()
+    assert distributed.max_scores == serial.max_scores
+    assert distributed.mean_scores == serial.mean_scores
+    assert distributed_best == serial_best
+
+
+def test_requeue_lost_queues_task_of_silent_worker_again():
+    state = BrokerState(None, heartbeat_timeout=1.0)
+    state.register("lost")
+    state.add_task(0, ("args",))
+    assert state.get_task("lost", 0) == (0, ("args",))
+    assert state.requeue_lost() == 0
+
+    state.heartbeats["lost"] -= 2.0
+    assert state.requeue_lost() == 1
+    assert state.workers() == 0
+    state.register("other")
+    assert state.get_task("other", 0) == (0, ("args",))
+    state.put_result("other", 0, "record")
+    # the lost worker comes back and finishes the task as well
+    state.put_result("lost", 0, "late record")
+    assert state.take_results(0) == [(0, "record", None), (0, "late record", None)]
+    assert state.get_task("other", 0) is None
+
+
+def test_task_of_killed_worker_completes_once(iris, tmp_path):
+    scorer = Scorer(SlowOnce, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0)
+    params = {"marker": str(tmp_path / "started"), "C": 0.5, "max_iter": 200}
+    broker = Broker(scorer, n_workers=1, heartbeat_timeout=3.0)
+    try:
+        future = broker.submit(params, None, 0, 1.0)
+        completions = []
+        future.add_done_callback(completions.append)
+
+        # the worker hangs in its first fit, and stops sending heartbeats once killed
+        wait_for(lambda: os.path.exists(params["marker"]))
+        broker.processes[0].kill()
+        broker.processes[0].wait()
+        env = dict(os.environ, **{AUTHKEY_ENV: broker.authkey.decode()})
+        broker.processes.append(subprocess.Popen([sys.executable, "-m", "ga_hypertuner.worker", broker.address,
+                                                  "--heartbeat", "0.5"], env=env))
+
+        record = future.result(timeout=60)
+        assert record["score"] == scorer.race(params, None)["score"]
+        assert record["folds"] == 3
+
+        # a late result of the same task is dropped
+        host, port = broker.address.rsplit(":", 1)
+        manager = BrokerManager(address=(host, int(port)), authkey=broker.authkey)
+        manager.connect()
+        manager.broker().put_result("killed", 0, {"score": -1.0})
+        time.sleep(1.5)
+        assert completions == [future]
+        assert future.result()["score"] == record["score"]
+    finally:
+        broker.shutdown()
+
+
+def test_pending_evaluations_fail_once_every_worker_died(iris, tmp_path):
+    scorer = Scorer(SlowOnce, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0)
+    params = {"marker": str(tmp_path / "started"), "C": 0.5, "max_iter": 200}
+    broker = Broker(scorer, n_workers=1, heartbeat_timeout=1.0, grace_period=2.0)
+    try:
+        future = broker.submit(params, None, 0, 1.0)
+        wait_for(lambda: os.path.exists(params["marker"]))
+        broker.processes[0].kill()
+        broker.processes[0].wait()
+        with pytest.raises(RuntimeError, match="No worker was alive"):
+            future.result(timeout=30)
+    finally:
+        broker.shutdown()
+
+
+def test_evaluations_wait_for_late_workers(iris):
+    scorer = Scorer(LogisticRegression, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0)
+    broker = Broker(scorer, heartbeat_timeout=1.0, grace_period=30.0)
+    try:
+        future = broker.submit({"C": 0.5}, None, 0, 1.0)
+        time.sleep(2.0)
+        env = dict(os.environ, **{AUTHKEY_ENV: broker.authkey.decode()})
+        broker.processes.append(subprocess.Popen([sys.executable, "-m", "ga_hypertuner.worker", broker.address],
+                                                 env=env))
+        assert future.result(timeout=60)["score"] == scorer.race({"C": 0.5}, None)["score"]
+    finally:
+        broker.shutdown()
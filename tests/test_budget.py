@@ -0,0 +1,103 @@
+import pytest
+from sklearn.base import BaseEstimator
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.svm import SVC
+from ga_hypertuner.budget import CpuBudget
+from ga_hypertuner.ga import GA
+
+
+class ThreadCounter(BaseEstimator):
+    """
+    Model whose score is the smallest number of BLAS and OpenMP threads of the process it is fitted in.
+    """
+
+    def __init__(self, alpha=0.0, n_jobs=None):
+        self.alpha = alpha
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y):
+        return self
+
+    def score(self, X, y):
+        from threadpoolctl import threadpool_info
+
+        return float(min(pool["num_threads"] for pool in threadpool_info()))
+
+
+class Required(BaseEstimator):
+    """
+    Model that can not be created without arguments.
+    """
+
+    def __init__(self, alpha, nthread=1):
+        raise AssertionError("model should not be created")
+
+
+def record(fold_times, **overrides):
+    return dict({"fold_times": fold_times, "cached": False, "complete": True, "fidelity": 1.0}, **overrides)
+
+
+def test_split_is_chosen_from_recorded_fold_times():
+    budget = CpuBudget(4, pop_size=4, k=4, backend="process")
+    assert budget.split == (4, 1, 1)
+    for _ in range(2):
+        budget.on_eval_end(record([1.0, 1.0, 1.0, 1.0]))
+    # raced out, partial, cached and timed out evaluations are not recorded
+    budget.on_eval_end(record([9.0], complete=False))
+    budget.on_eval_end(record([9.0, 9.0, 9.0, 9.0], fidelity=0.5))
+    budget.on_eval_end(record([9.0, 9.0, 9.0, 9.0], cached=True))
+    assert len(budget.records) == 2
+    # fold times are replayed at the split they were measured with
+    budget.measured_split = budget.split
+    # 4 workers leave two idle and fit the 4 folds one at a time, while (2, 2, 1) and (1, 4, 1) both take 2 seconds
+    assert budget.generation_time((4, 1, 1)) == 4.0
+    assert budget.generation_time((2, 2, 1)) == budget.generation_time((1, 4, 1)) == 2.0
+    assert budget.allocate() == (2, 2, 1)
+    assert budget.allocated and budget.records == []
+    budget.on_eval_end(record([1.0, 1.0, 1.0, 1.0]))
+    assert budget.records == []
+
+
+def test_model_threads_are_scaled_by_amdahls_law():
+    budget = CpuBudget(4, pop_size=1, k=1, model_class=RandomForestClassifier, backend="thread")
+    assert budget.split == (1, 1, 4)
+    budget.on_eval_end(record([2.0]))
+    budget.measured_split = budget.split
+    # measured on 4 threads, so a single thread is 1 / (0.2 + 0.8 / 4) = 2.5 times slower
+    assert budget.generation_time((1, 1, 1)) == pytest.approx(2.0 * 2.5)
+    assert budget.generation_time((1, 1, 2)) == pytest.approx(2.0 * 2.5 / (1 / (0.2 + 0.8 / 2)))
+    assert budget.allocate() == (1, 1, 4)
+
+
+@pytest.mark.parametrize("model_class, name", [(RandomForestClassifier, "n_jobs"), (ThreadCounter, "n_jobs"),
+                                               (Required, "nthread"), (SVC, None), (None, None)])
+def test_thread_parameter_of(model_class, name):
+    assert CpuBudget.thread_parameter_of(model_class) == name
+
+
+@pytest.mark.parametrize("backend, n_workers", [("serial", 1), ("thread", 2), ("process", 2), ("process", 1)])
+def test_thread_limits_are_applied_in_workers(iris, backend, n_workers):
+    ga = GA(x_train=iris[0], y_train=iris[1], model_class=ThreadCounter, scoring=None, k=3, verbosity=0,
+            ga_parameters={"pop_size": 4, "fscale": 0.5, "gmax": 2, "direction": "max", "cp": 0.5},
+            model_parameters={"alpha": [None, float]}, boundaries={"alpha": [0.0, 1.0]}, random_state=0,
+            backend=backend, n_workers=n_workers, cpu_budget=1)
+    try:
+        # a single process worker evaluates in the driver
+        ga.evaluator.configure(n_workers, 1, 3)
+        assert ga.scorer.model_parameters({"alpha": 0.5}) == {"alpha": 0.5, "n_jobs": 3}
+        future = ga.evaluator.submit({"alpha": 0.5}, None)
+        assert list(ga.evaluator.wait([future]).values()) == [3.0]
+    finally:
+        ga.evaluator.close()
+
+
+def test_split_is_picked_after_first_generation(iris, settings):
+    ga = GA(x_train=iris[0], y_train=iris[1], backend="thread", n_workers=1, cpu_budget=2,
+            **dict(settings, model_class=RandomForestClassifier, model_parameters={"n_estimators": [None, int]},
+                   boundaries={"n_estimators": [2, 5]}))
+    assert not ga.cpu_budget.allocated
+    ga.main()
+    assert ga.cpu_budget.allocated
+    workers, folds, threads = ga.cpu_budget.split
+    assert workers * folds * threads <= 2
+    assert (ga.evaluator.n_workers, ga.scorer.fold_jobs, ga.scorer.model_threads) == ga.cpu_budget.split
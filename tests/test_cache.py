@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from ga_hypertuner.cache import FitnessCache, SqliteFitnessCache
+
+
+def test_lru_eviction():
+    cache = FitnessCache(max_size=2)
+    cache.put("a", 1.0)
+    cache.put("b", 2.0)
+    cache.get("a")
+    cache.put("c", 3.0)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1.0
+    assert cache.reset_counters() == (2, 1)
+
+
+def test_key_rounds_floats_to_decimals():
+    cache = FitnessCache(decimals=3)
+    assert cache.key({"C": 0.12341, "n": np.int64(3)}) == cache.key({"C": 0.12339, "n": 3})
+    assert cache.key({"C": 0.1234}) != cache.key({"C": 0.1244})
+
+
+def test_sqlite_cache_persists_scores(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteFitnessCache(path)
+    cache.put("a", 0.5)
+    cache.close()
+    cache = SqliteFitnessCache(path)
+    assert cache.get("a") == 0.5
+    assert cache.get("b") is None
+    cache.close()
+
+
+def test_sqlite_cache_reads_nan_back_as_a_hit(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteFitnessCache(path)
+    cache.put("failed", np.nan)
+    cache.close()
+    cache = SqliteFitnessCache(path)
+    score = cache.get("failed")
+    assert score is not None and np.isnan(score)
+    assert cache.reset_counters() == (1, 0)
+    cache.close()
+
+
+def write_scores(path, prefix, n):
+    cache = SqliteFitnessCache(path, max_size=1)
+    for i in range(n):
+        cache.put(prefix + str(i), float(i))
+        cache.flush()
+        # reads of other writers do not block writes
+        cache.get(prefix[::-1] + str(i))
+    cache.close()
+
+
+def test_sqlite_cache_is_shared_by_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(write_scores, path, prefix, 200) for prefix in ["ab", "ba", "cd"]]
+        for future in futures:
+            future.result()
+    cache = SqliteFitnessCache(path)
+    assert cache.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert [cache.get(prefix + "199") for prefix in ["ab", "ba", "cd"]] == [199.0] * 3
+    assert cache.connection.execute("SELECT COUNT(*) FROM fitness").fetchone()[0] == 600
+    cache.close()
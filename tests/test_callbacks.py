@@ -0,0 +1,84 @@
+import os
+import numpy as np
+import pytest
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.ga import GA
+
+RECORD_KEYS = {"params", "score", "folds", "fold_scores", "fit_time", "score_time", "fold_times", "model_size", "start",
+               "end", "worker", "fidelity", "timed_out", "submitted", "queue_wait", "cached", "complete"}
+
+
+class Recorder(Callback):
+    def __init__(self):
+        self.events = []
+
+    def on_eval_start(self, params):
+        self.events.append(("start", os.getpid(), params))
+
+    def on_eval_end(self, record):
+        self.events.append(("end", os.getpid(), record))
+
+    def on_generation_end(self, generation, stats):
+        self.events.append(("generation", os.getpid(), generation, stats))
+
+    def on_run_end(self):
+        self.events.append(("run_end", os.getpid()))
+
+
+class Failing(Callback):
+    def __init__(self):
+        self.calls = 0
+
+    def on_eval_end(self, record):
+        self.calls += 1
+        raise ValueError("callback failed")
+
+    def on_generation_end(self, generation, stats):
+        raise KeyError("generation")
+
+
+@pytest.mark.parametrize("backend, n_workers", [("serial", 1), ("process", 2)])
+def test_hooks_fire_in_order_with_documented_records(iris, settings, backend, n_workers):
+    recorder = Recorder()
+    ga = GA(x_train=iris[0], y_train=iris[1], backend=backend, n_workers=n_workers, callbacks=[recorder], **settings)
+    ga.main()
+    events = recorder.events
+    # callbacks run in the process running the algorithm
+    assert {event[1] for event in events} == {os.getpid()}
+    assert [event[0] for event in events].count("run_end") == 1 and events[-1][0] == "run_end"
+
+    # each generation reports after its 6 evaluations, and each evaluation starts before it ends
+    generations = [i for i, event in enumerate(events) if event[0] == "generation"]
+    assert [events[i][2] for i in generations] == [1, 2, 3]
+    start = 0
+    for g, i in enumerate(generations, 1):
+        batch = events[start:i]
+        starts = [event[2] for event in batch if event[0] == "start"]
+        ends = [event[2] for event in batch if event[0] == "end"]
+        assert len(starts) == len(ends) == 6
+        assert sorted(map(str, starts)) == sorted(str(record["params"]) for record in ends)
+        for record in ends:
+            assert set(record) == RECORD_KEYS
+            assert record["folds"] == 3 and len(record["fold_scores"]) == 3 and not record["cached"]
+            assert record["start"] <= record["end"] and record["queue_wait"] >= 0
+            assert (record["worker"].split(":")[0] == str(os.getpid())) == (backend == "serial")
+        stats = events[i][3]
+        assert stats["generation"] == g and stats["evaluations"] == 6
+        # children only replace worse parents, so the population is at least as good as the best child
+        assert stats["max_score"] >= max(record["score"] for record in ends)
+        start = i + 1
+    assert events[generations[-1] + 1:] == [("run_end", os.getpid())]
+
+
+def test_raising_callback_does_not_break_run(iris, settings):
+    failing, recorder = Failing(), Recorder()
+    ga = GA(x_train=iris[0], y_train=iris[1], callbacks=[failing, recorder], **settings)
+    with pytest.raises(ValueError, match="callback failed"):
+        ga.main()
+    # every generation ran and later callbacks received every event
+    assert len(ga.max_scores) == 2 and np.all(np.isfinite(ga.max_scores))
+    assert ga.stop_reason == "maximum number of generations reached"
+    assert failing.calls == 18
+    assert [event[0] for event in recorder.events].count("end") == 18
+    assert [event[2] for event in recorder.events if event[0] == "generation"] == [1, 2, 3]
+    assert recorder.events[-1][0] == "run_end"
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.checkpoint import Checkpoint
+from ga_hypertuner.ga import GA
+from ga_hypertuner.tuner import Tuner
+
+
+class Interrupt(KeyboardInterrupt):
+    # errors of callbacks do not stop a run, an interruption does
+    pass
+
+
+class InterruptAfter(Callback):
+    def __init__(self, generation):
+        self.generation = generation
+
+    def on_generation_end(self, generation, stats):
+        if generation == self.generation:
+            raise Interrupt()
+
+
+def with_gmax(settings, gmax):
+    return dict(settings, ga_parameters=dict(settings["ga_parameters"], gmax=gmax))
+
+
+@pytest.mark.parametrize("cache_size", [0, 100])
+def test_resumed_run_matches_uninterrupted_run(iris, settings, tmp_path, cache_size):
+    settings = dict(with_gmax(settings, 5), cache_size=cache_size)
+    full_path = str(tmp_path / "full.ckpt")
+    GA(x_train=iris[0], y_train=iris[1], checkpoint_path=full_path, **settings).main()
+
+    path = str(tmp_path / "interrupted.ckpt")
+    ga = GA(x_train=iris[0], y_train=iris[1], checkpoint_path=path, callbacks=[InterruptAfter(3)], **settings)
+    with pytest.raises(Interrupt):
+        ga.main()
+    assert Checkpoint.load(path)["generation"] == 3
+    # the cache of the interrupted run is not checkpointed, so the resumed run starts with an empty one
+    Tuner.resume(path, iris[0], iris[1])
+
+    full, resumed = Checkpoint.load(full_path), Checkpoint.load(path)
+    assert resumed["generation"] == full["generation"] == 5
+    assert resumed["max_scores"] == full["max_scores"]
+    assert resumed["mean_scores"] == full["mean_scores"]
+    assert np.array_equal(resumed["population"], full["population"])
+    assert np.array_equal(resumed["scores"], full["scores"])
+    assert resumed["best_params"] == full["best_params"]
@@ -0,0 +1,66 @@
+import numpy as np
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.ga import GA
+
+
+class Records(Callback):
+    def __init__(self):
+        self.records = []
+
+    def on_eval_end(self, record):
+        self.records.append(record)
+
+
+def halving_ga(iris, settings, **kwargs):
+    return GA(x_train=iris[0], y_train=iris[1], fidelities=[0.3, 0.6, 1.0], promotion_rate=0.5, cache_size=100,
+              **dict(settings, **kwargs))
+
+
+def best(scores, n):
+    return np.argsort(-np.asarray(scores), kind="stable")[:n]
+
+
+def test_best_children_are_promoted_at_each_rung(iris, settings):
+    records = Records()
+    ga = halving_ga(iris, settings, callbacks=[records])
+    children = ga.space.sample(np.random.default_rng(0), 8)
+    params = ga.decode(children)
+    scores = ga.successive_halving(children)
+
+    assert ga.rungs == [{"fidelity": 0.3, "evaluated": 8, "promoted": 4},
+                        {"fidelity": 0.6, "evaluated": 4, "promoted": 2},
+                        {"fidelity": 1.0, "evaluated": 2, "promoted": 2}]
+    assert [r["fidelity"] for r in records.records] == [0.3] * 8 + [0.6] * 4 + [1.0] * 2
+
+    # promotion follows scores of each fraction
+    first = best([ga.scorer.race(p, None, 0.3)["score"] for p in params], 4)
+    second = first[best([ga.scorer.race(params[i], None, 0.6)["score"] for i in first], 2)]
+    assert set(np.flatnonzero(np.isfinite(scores))) == set(second)
+    # promoted children are scored on full data, the others get the worst score
+    for i in range(8):
+        expected = ga.scorer.race(params[i], None)["score"] if i in second else -np.inf
+        assert scores[i] == expected
+
+
+def test_partial_fidelity_scores_are_not_cached(iris, settings):
+    ga = halving_ga(iris, settings)
+    children = ga.space.sample(np.random.default_rng(0), 8)
+    scores = ga.successive_halving(children)
+    for params, score in zip(ga.decode(children), scores):
+        cached = ga.cache.get(ga.cache.key(params))
+        if np.isfinite(score):
+            assert cached == score
+        else:
+            assert cached is None
+
+
+def test_children_that_are_not_promoted_keep_their_parents(iris, settings):
+    ga = halving_ga(iris, settings, ga_parameters=dict(settings["ga_parameters"], pop_size=8))
+    population = ga.space.sample(np.random.default_rng(1), 8)
+    parent_scores = np.zeros(8)
+    children = ga.space.sample(np.random.default_rng(0), 8)
+    children_scores = ga.successive_halving(children)
+    new_population, new_scores = ga.selection(population, parent_scores, children, children_scores)
+    lost = ~np.isfinite(children_scores)
+    assert np.array_equal(new_population[lost], population[lost])
+    assert np.array_equal(new_scores[lost], parent_scores[lost])
@@ -0,0 +1,67 @@
+import pickle
+import numpy as np
+import pytest
+from ga_hypertuner.folds import Folds
+from ga_hypertuner.ga import GA
+
+
+def test_same_seed_and_epoch_give_identical_folds(iris):
+    first = Folds(iris[0], iris[1], k=3, stratified=True, random_state=5)
+    second = Folds(iris[0], iris[1], k=3, stratified=True, random_state=5)
+    first.set_epoch(2)
+    second.set_epoch(2)
+    # a copy sent to a worker process computes the same splits
+    worker = pickle.loads(pickle.dumps(first))
+    for a, b, c in zip(first.indices(), second.indices(), worker.indices()):
+        for i in range(2):
+            np.testing.assert_array_equal(a[i], b[i])
+            np.testing.assert_array_equal(a[i], c[i])
+    lazy = Folds(iris[0], iris[1], k=3, stratified=True, random_state=5, materialize=False)
+    lazy.set_epoch(2)
+    for a, b in zip(first.get(), lazy.get()):
+        for i in range(4):
+            np.testing.assert_array_equal(a[i], b[i])
+
+
+def test_epochs_give_different_folds(iris):
+    folds = Folds(iris[0], iris[1], k=3, stratified=True, random_state=5)
+    test_sets = [sorted(test.tolist()) for _, test in folds.indices()]
+    sliced = folds.get()
+    folds.refresh()
+    assert folds.epoch == 1
+    assert [sorted(test.tolist()) for _, test in folds.indices()] != test_sets
+    assert not np.array_equal(folds.get()[0][2], sliced[0][2])
+    # going back to an epoch gives its folds again
+    folds.set_epoch(0)
+    assert [sorted(test.tolist()) for _, test in folds.indices()] == test_sets
+    # test sets of an epoch cover the data once
+    assert sorted(np.concatenate([test for _, test in folds.indices()]).tolist()) == list(range(150))
+
+
+@pytest.mark.parametrize("mode", ["generational", "steady_state"])
+@pytest.mark.parametrize("cv_refresh, refreshed", [(None, []), (1, [0, 1, 2, 3, 4]), (2, [1, 3])])
+def test_folds_follow_refresh_schedule(iris, settings, mode, cv_refresh, refreshed):
+    ga = GA(x_train=iris[0], y_train=iris[1], cv_refresh=cv_refresh, mode=mode,
+            **dict(settings, ga_parameters=dict(settings["ga_parameters"], gmax=6)))
+    done = []
+    refresh = ga.scorer.folds.refresh
+
+    def recording_refresh():
+        done.append(len(ga.max_scores))
+        refresh()
+
+    ga.scorer.folds.refresh = recording_refresh
+    ga.main()
+    # folds change after every cv_refresh generations, counting from the initial population
+    assert done == refreshed
+    assert ga.scorer.folds.epoch == len(refreshed)
+
+
+def test_workers_use_folds_of_driver(iris, settings):
+    settings = dict(settings, cv_refresh=1)
+    serial = GA(x_train=iris[0], y_train=iris[1], **settings)
+    serial.main()
+    parallel = GA(x_train=iris[0], y_train=iris[1], backend="process", n_workers=2, **settings)
+    parallel.main()
+    assert parallel.max_scores == serial.max_scores
+    assert parallel.mean_scores == serial.mean_scores
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from ga_hypertuner.exceptions import GaHypertunerParamException
+from ga_hypertuner.ga import GA
+from ga_hypertuner.history import History
+
+
+def test_history_is_off_by_default(iris, settings):
+    ga = GA(x_train=iris[0], y_train=iris[1], **settings)
+    population, scores = ga.initiation()
+    assert ga.history is None
+    assert ga.checkpoint_state(population, scores)["history"] is None
+
+
+def test_memory_mapped_history_records_every_evaluation(iris, settings, tmp_path):
+    path = str(tmp_path / "history.bin")
+    ga = GA(x_train=iris[0], y_train=iris[1], history_path=path, **settings)
+    ga.main()
+    evaluations = sum(s["evaluations"] + s["cached"] for s in ga.generation_stats)
+    # checkpoints only record the number of rows, not the rows
+    assert ga.history.state() == {"count": evaluations, "rows": None}
+    history = History.load(path)
+    assert len(history) == evaluations
+    assert sorted(set(history.table()["generation"].tolist())) == [1, 2, 3]
+    best = history.top(1)
+    assert best["score"][0] == max(ga.max_scores)
+    assert history.params(best)[0]["solver"] == "lbfgs"
+
+
+def test_history_exports_to_sqlite(iris, settings, tmp_path):
+    import sqlite3
+
+    ga = GA(x_train=iris[0], y_train=iris[1], history_path=str(tmp_path / "history.bin"), **settings)
+    ga.main()
+    ga.history.to_sqlite(str(tmp_path / "history.db"))
+    connection = sqlite3.connect(str(tmp_path / "history.db"))
+    rows = connection.execute("SELECT generation, score, C FROM evaluations").fetchall()
+    connection.close()
+    assert len(rows) == len(ga.history)
+    assert np.isclose(max(r[1] for r in rows), max(ga.max_scores))
+
+
+def test_sqlite_export_round_trips_rows(iris, settings, tmp_path):
+    import json
+    import sqlite3
+
+    ga = GA(x_train=iris[0], y_train=iris[1], history_path=str(tmp_path / "history.bin"), **settings)
+    ga.main()
+    path = str(tmp_path / "history.db")
+    ga.history.to_sqlite(path, table="run_1")
+    # an existing table is replaced
+    ga.history.to_sqlite(path, table="run_1")
+    connection = sqlite3.connect(path)
+    cursor = connection.execute("SELECT * FROM run_1")
+    names = [column[0] for column in cursor.description]
+    rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+    connection.close()
+    table = ga.history.table()
+    assert names == History.columns + ["fold_scores", "solver", "C", "max_iter"]
+    assert len(rows) == len(table)
+    for row, expected, params in zip(rows, table, ga.history.params(table)):
+        for column in History.columns:
+            # SQLite stores nan, like the size of models that are not measured, as NULL
+            value = expected[column].item()
+            assert row[column] == value or (row[column] is None and np.isnan(value))
+        assert json.loads(row["fold_scores"]) == expected["fold_scores"].tolist()
+        assert {p: row[p] for p in params} == params
+
+
+@pytest.mark.parametrize("table", ['evaluations"; DROP TABLE x; --', "1st", "", None])
+def test_sqlite_export_rejects_table_names(iris, settings, tmp_path, table):
+    ga = GA(x_train=iris[0], y_train=iris[1], history_path=str(tmp_path / "history.bin"), **settings)
+    ga.main()
+    with pytest.raises(GaHypertunerParamException, match="table"):
+        ga.history.to_sqlite(str(tmp_path / "history.db"), table=table)
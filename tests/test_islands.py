@@ -0,0 +1,106 @@
+import os
+import queue
+import numpy as np
+import pytest
+from ga_hypertuner.cache import SqliteFitnessCache
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.exceptions import GaHypertunerParamException
+from ga_hypertuner.ga import GA
+from ga_hypertuner.islands import Archipelago, Island
+from ga_hypertuner.tuner import Tuner
+
+
+class Recorder(Callback):
+    def __init__(self):
+        self.evaluations = []
+        self.generations = []
+        self.ended = 0
+
+    def on_eval_end(self, record):
+        self.evaluations.append(record["island"])
+
+    def on_generation_end(self, generation, stats):
+        self.generations.append((stats["island"], generation))
+
+    def on_run_end(self):
+        self.ended += 1
+
+
+def archipelago(iris, settings, n_islands, **kwargs):
+    # settings of GA with defaults of every parameter, like those given by Tuner
+    full = dict(GA(x_train=iris[0], y_train=iris[1], **settings).settings, callbacks=settings.get("callbacks"))
+    return Archipelago(full, iris[0], iris[1], n_islands, **kwargs)
+
+
+def test_edges_of_topologies(iris, settings):
+    assert archipelago(iris, settings, 3).edges() == [(0, 1), (1, 2), (2, 0)]
+    assert archipelago(iris, settings, 3, topology="full").edges() == [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0),
+                                                                         (2, 1)]
+
+
+def test_migrants_replace_worse_individuals(iris, settings):
+    inboxes = {1: queue.Queue(), 2: queue.Queue()}
+    outboxes = {1: queue.Queue()}
+    island = Island(0, inboxes, outboxes, 1, 2, x_train=iris[0], y_train=iris[1], **settings)
+    population = np.array([[0.1, 100.0], [0.2, 200.0], [0.3, 300.0]])
+    scores = np.array([0.5, 0.9, 0.7])
+    inboxes[1].put((np.array([[0.8, 150.0], [0.6, 250.0]]), np.array([0.95, 0.6])))
+    # the island of the second neighbor is done
+    inboxes[2].put(None)
+
+    island.migrate(population, scores)
+    sent = outboxes[1].get_nowait()
+    assert np.array_equal(sent[0], [[0.2, 200.0], [0.3, 300.0]])
+    assert np.array_equal(sent[1], [0.9, 0.7])
+    # the best migrant replaces the worst individual, the other migrant is not better than the next worst
+    assert np.array_equal(population, [[0.8, 150.0], [0.2, 200.0], [0.3, 300.0]])
+    assert np.array_equal(scores, [0.95, 0.9, 0.7])
+    assert island.senders == [1]
+
+
+@pytest.mark.parametrize("topology", ["ring", "full"])
+def test_best_of_all_islands_is_returned(iris, settings, topology):
+    settings = dict(settings, ga_parameters=dict(settings["ga_parameters"], gmax=4))
+    islands = archipelago(iris, settings, 3, topology=topology, migration_interval=1, migration_size=2)
+    best_params = islands.main()
+    assert len(islands.results) == 3
+    best = max(islands.results, key=lambda r: r["best_score"])
+    assert best_params == best["best_params"]
+    assert all(result["generation"] == 4 for result in islands.results)
+
+
+def test_callbacks_receive_events_of_every_island(iris, settings):
+    recorder = Recorder()
+    islands = archipelago(iris, dict(settings, callbacks=[recorder]), 2, migration_interval=1)
+    islands.main()
+    assert set(recorder.evaluations) == {0, 1}
+    assert sorted(recorder.generations) == [(i, g) for i in range(2) for g in range(1, 4)]
+    assert recorder.ended == 1
+
+
+def test_each_island_writes_its_own_files(iris, settings, tmp_path):
+    plot_path = str(tmp_path / "progress.png")
+    history_path = str(tmp_path / "history.bin")
+    archipelago(iris, dict(settings, plot_path=plot_path, history_path=history_path), 2).main()
+    for i in range(2):
+        assert os.path.exists(str(tmp_path / ("progress_island" + str(i) + ".png")))
+        assert os.path.exists(str(tmp_path / ("history_island" + str(i) + ".bin")))
+    assert not os.path.exists(plot_path)
+    assert not os.path.exists(history_path)
+
+
+def test_checkpoints_are_rejected_with_islands(iris, settings, tmp_path):
+    with pytest.raises(GaHypertunerParamException, match="checkpoint_path"):
+        Tuner.tune(iris[0], iris[1], settings["model_class"], settings["ga_parameters"],
+                   settings["model_parameters"], settings["boundaries"], "accuracy", verbosity=0,
+                   n_islands=2, checkpoint_path=str(tmp_path / "run.ckpt"))
+
+
+def test_islands_share_cache_file(iris, settings, tmp_path):
+    path = str(tmp_path / "cache.db")
+    islands = archipelago(iris, dict(settings, cache_size=100, cache_path=path), 3, migration_interval=1)
+    islands.main()
+    assert all(result is not None for result in islands.results)
+    cache = SqliteFitnessCache(path)
+    assert cache.connection.execute("SELECT COUNT(*) FROM fitness").fetchone()[0] > 0
+    cache.close()
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from ga_hypertuner.exceptions import GaHypertunerParamException
+from ga_hypertuner.ga import GA
+from ga_hypertuner.pareto import Pareto
+from ga_hypertuner.tuner import Tuner
+
+
+def fronts(values):
+    return [sorted(front.tolist()) for front in Pareto.non_dominated_sort(np.array(values, dtype=float))]
+
+
+def test_non_dominated_sort():
+    # (2, 3) is dominated by (1, 3) and (2, 2), and (3, 3) is dominated by (2, 3) as well
+    assert fronts([[1, 3], [2, 2], [3, 1], [2, 3], [3, 3]]) == [[0, 1, 2], [3], [4]]
+    # equal individuals do not dominate each other
+    assert fronts([[1, 1], [1, 1], [2, 2]]) == [[0, 1], [2]]
+
+
+def test_crowding_distance():
+    values = np.array([[1, 4], [2, 2], [3, 1.5], [4, 1]])
+    distance = Pareto.crowding_distance(values)
+    assert np.isinf(distance[0]) and np.isinf(distance[3])
+    # (3 - 1) / 3 + (4 - 1.5) / 3 and (4 - 2) / 3 + (2 - 1) / 3
+    assert np.allclose(distance[1:3], [1.5, 1.0])
+    assert np.all(np.isinf(Pareto.crowding_distance(values[:2])))
+
+
+def test_select_keeps_whole_fronts_then_least_crowded():
+    values = np.array([[1, 4], [2, 2], [3, 1.5], [4, 1], [5, 5]])
+    assert Pareto.select(values, 3).tolist() == [0, 3, 1]
+    assert sorted(Pareto.select(values, 5).tolist()) == [0, 1, 2, 3, 4]
+
+
+def test_nan_and_inf_objectives_are_dominated():
+    values = Pareto.finite([[1, np.nan], [2, 3], [np.inf, 1]])
+    assert np.array_equal(values, [[1, 5], [2, 3], [3, 1]])
+    assert fronts([[np.nan, np.nan], [1, 1]]) == [[1], [0]]
+    assert fronts([[np.inf, 0], [1, 1], [2, 2]]) == [[0, 1], [2]]
+
+
+def test_pareto_selection_keeps_population_size(iris, settings):
+    settings = dict(settings, ga_parameters=dict(settings["ga_parameters"], pop_size=3))
+    ga = GA(x_train=iris[0], y_train=iris[1], objectives=["fit_time"], **settings)
+    ga.costs = np.array([[3.0], [2.0], [1.0]])
+    population = np.array([[0.1, 100.0], [0.2, 200.0], [0.3, 300.0]])
+    children = np.array([[0.4, 150.0], [0.5, 250.0], [0.6, 350.0]])
+    survivors, scores = ga.pareto_selection(population, np.array([0.9, 0.8, 0.7]), children,
+                                            np.array([0.95, 0.6, 0.85]), np.array([[0.5], [4.0], [2.5]]))
+    # the first child dominates every other individual, and the second front keeps its two extremes
+    assert np.array_equal(survivors, [[0.4, 150.0], [0.1, 100.0], [0.3, 300.0]])
+    assert np.array_equal(scores, [0.95, 0.9, 0.7])
+    assert np.array_equal(ga.costs, [[0.5], [3.0], [1.0]])
+
+
+def test_run_returns_front(iris, settings):
+    front = GA(x_train=iris[0], y_train=iris[1], objectives=["fit_time", "model_size"], **settings).main()
+    scores = [member["score"] for member in front]
+    assert scores == sorted(scores, reverse=True)
+    values = np.array([[-m["score"], m["fit_time"], m["model_size"]] for m in front])
+    assert fronts(values) == [list(range(len(front)))]
+
+
+@pytest.mark.parametrize("conflict", [{"cache_size": 10}, {"cache_path": "cache.db"}, {"racing_bound": 0.0},
+                                      {"fidelities": [0.5, 1.0]}, {"mode": "steady_state"}, {"n_islands": 2}])
+def test_objectives_reject_partial_evaluations(iris, settings, conflict):
+    with pytest.raises(GaHypertunerParamException, match=list(conflict)[0]):
+        Tuner.tune(iris[0], iris[1], settings["model_class"], settings["ga_parameters"],
+                   settings["model_parameters"], settings["boundaries"], "accuracy", verbosity=0,
+                   objectives=["fit_time"], **conflict)
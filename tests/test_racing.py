@@ -0,0 +1,68 @@
+from sklearn.linear_model import LogisticRegression
+from ga_hypertuner.cache import FitnessCache
+from ga_hypertuner.evaluation import Evaluator, Scorer
+
+WORSE = {"C": 0.0001, "max_iter": 500}
+BETTER = {"C": 1.0, "max_iter": 500}
+
+
+def scorer_of(iris, racing_bound=0.0):
+    return Scorer(LogisticRegression, iris[0], iris[1], "accuracy", k=5, stratified=True, random_state=0,
+                  racing_bound=racing_bound)
+
+
+def test_worse_child_is_raced_out_early(iris):
+    scorer = scorer_of(iris)
+    parent = scorer.race(BETTER, None)["score"]
+    record = scorer.race(WORSE, parent)
+    assert record["folds"] < 5
+    assert record["score"] < parent
+
+
+def test_racing_bound_delays_race(iris):
+    scorer = scorer_of(iris, racing_bound=0.5)
+    parent = scorer.race(BETTER, None)["score"]
+    assert scorer.race(WORSE, parent)["folds"] == 5
+
+
+def test_better_child_is_scored_on_all_folds(iris):
+    scorer = scorer_of(iris)
+    parent = scorer.race(WORSE, None)["score"]
+    record = scorer.race(BETTER, parent)
+    assert record["folds"] == 5
+    assert record["score"] == scorer.race(BETTER, None)["score"]
+
+
+def test_raced_out_score_is_not_cached(iris):
+    scorer = scorer_of(iris)
+    cache = FitnessCache()
+    evaluator = Evaluator(scorer, cache=cache)
+    parent = scorer.race(BETTER, None)["score"]
+    worse, better = evaluator.evaluate([WORSE, BETTER], thresholds=[parent, 0.5], records=True)
+    assert not worse["complete"] and better["complete"]
+    assert evaluator.reset_counters() == (1, 0)
+    assert cache.get(cache.key(WORSE)) is None
+    assert cache.get(cache.key(BETTER)) == better["score"]
+    evaluator.close()
+
+
+def test_repeated_individual_races_against_loosest_threshold(iris):
+    scorer = scorer_of(iris)
+    evaluator = Evaluator(scorer, cache=FitnessCache())
+    parent = scorer.race(BETTER, None)["score"]
+    # the first repeat would lose its race, the second one has no parent to beat
+    first, second = evaluator.evaluate([WORSE, WORSE], thresholds=[parent, 0.0], records=True)
+    assert first is second
+    assert first["complete"] and first["score"] == scorer.race(WORSE, None)["score"]
+    assert evaluator.reset_counters() == (0, 0)
+    evaluator.close()
+
+    # for a minimized score, the loosest threshold is the largest
+    scorer = Scorer(LogisticRegression, iris[0], iris[1], "neg_log_loss", k=5, stratified=True, random_state=0,
+                    racing_bound=0.0, direction="min")
+    evaluator = Evaluator(scorer)
+    assert evaluator._loosest([0.1, 0.3, 0.2], [0, 1]) == 0.3
+    assert evaluator._loosest([0.1, None], [0, 1]) is None
+    assert evaluator._loosest([0.1, float("nan")], [0, 1]) is None
+    assert evaluator._loosest(None, [0]) is None
+    evaluator.close()
@@ -0,0 +1,72 @@
+import os
+import pytest
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.ga import GA
+from ga_hypertuner.metrics import MetricsReporter, MetricsSink
+from ga_hypertuner.reporting import Reporting
+from ga_hypertuner.visualization import Visualize
+
+
+class FailingSink(MetricsSink):
+    def write(self, kind, row):
+        raise IOError("disk full")
+
+
+class FailingGeneration(Callback):
+    def on_generation_end(self, generation, stats):
+        raise ValueError("callback failed")
+
+
+class RunEnd(Callback):
+    def __init__(self):
+        self.ended = False
+
+    def on_run_end(self):
+        self.ended = True
+
+
+def test_failing_callback_does_not_skip_later_callbacks(iris, settings, tmp_path):
+    path = str(tmp_path / "history.bin")
+    later = RunEnd()
+    ga = GA(x_train=iris[0], y_train=iris[1], history_path=path,
+            callbacks=[MetricsReporter([FailingSink()]), later], **settings)
+    with pytest.raises(RuntimeError, match="disk full"):
+        ga.main()
+    assert later.ended
+    # the history is flushed after the failing reporter
+    assert os.path.exists(path + ".meta")
+
+
+def test_failing_callback_does_not_mask_error_of_run(iris, settings):
+    later = RunEnd()
+    ga = GA(x_train=iris[0], y_train=iris[1],
+            callbacks=[FailingGeneration(), MetricsReporter([FailingSink()]), later], **settings)
+
+    def failing_mutation(population, scores):
+        raise ArithmeticError("run failed")
+
+    ga.mutation = failing_mutation
+    with pytest.raises(ArithmeticError, match="run failed"):
+        ga.main()
+    assert later.ended
+
+
+def test_progress_plot_reuses_one_figure():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    for n in range(1, 4):
+        Visualize.progress_band([0.9] * n, [0.5] * n, [0.7] * n, "accuracy")
+    assert plt.get_fignums() == [plt.figure(num=Visualize.progress_figure).number]
+    Visualize.close_progress_band()
+    assert plt.get_fignums() == []
+
+
+def test_summary_matches_dataframe_describe(capsys):
+    import pandas as pd
+
+    vectors = [{"params": {"C": c, "max_iter": m, "solver": "lbfgs"}, "score": s}
+               for c, m, s in [(0.1, 100, 0.9), (0.5, 150, 0.95), (0.9, 120, 0.8)]]
+    Reporting.verbose2(vectors)
+    assert str(pd.DataFrame([v["params"] for v in vectors]).describe()) in capsys.readouterr().out
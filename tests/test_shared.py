@@ -0,0 +1,64 @@
+import pickle
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from ga_hypertuner import evaluation
+from ga_hypertuner.evaluation import Evaluator, Scorer
+from ga_hypertuner.shared import SharedArray, SharedDataset
+
+
+def mixed_frame(n=3000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"count": rng.integers(0, 10, n), "ratio": rng.random(n),
+                         "small": rng.random(n).astype(np.float32), "flag": rng.random(n) > 0.5,
+                         "other": rng.random(n)}, index=pd.Index(np.arange(n) * 2, name="id"))
+
+
+def worker_data():
+    x_train = evaluation._worker_scorer.x_t
+    return list(x_train.dtypes), list(x_train.columns), x_train.index, x_train.to_numpy(dtype=float), \
+        all(not x_train[c].to_numpy().flags.writeable for c in x_train.columns)
+
+
+def test_mixed_dataframe_round_trips(tmp_path):
+    x_train = mixed_frame()
+    assert SharedArray.supports(x_train)
+    handle = SharedArray.create(x_train, str(tmp_path), "x_train")
+    attached = handle.attach()
+    pd.testing.assert_frame_equal(attached, x_train, check_index_type=True)
+    # columns are views of read-only mapped files, not copies
+    assert not any(attached[c].to_numpy().flags.writeable for c in attached.columns)
+    # the handle holds no data
+    assert len(pickle.dumps(handle)) < 2000
+
+
+def test_series_and_labels_round_trip(tmp_path):
+    y_train = pd.Series(np.arange(4), index=["a", "b", "c", "d"], name="target")
+    pd.testing.assert_series_equal(SharedArray.create(y_train, str(tmp_path), "y").attach(), y_train)
+    x_train = pd.DataFrame([[1, 2.0], [3, 4.0]], columns=["a", "a"])
+    pd.testing.assert_frame_equal(SharedArray.create(x_train, str(tmp_path), "x").attach(), x_train)
+
+
+def test_object_and_categorical_columns_are_not_shared():
+    x_train = mixed_frame(4)
+    assert not SharedArray.supports(x_train.assign(name=["a", "b", "c", "d"]))
+    assert not SharedArray.supports(x_train.assign(kind=pd.Categorical(["a", "b", "a", "b"])))
+    assert not SharedArray.supports(np.array(["a", 1], dtype=object))
+
+
+def test_workers_attach_shared_mixed_dataframe():
+    x_train = mixed_frame(300)
+    y_train = pd.Series((x_train["ratio"] > 0.5).astype(int), name="target")
+    scorer = Scorer(LogisticRegression, x_train, y_train, "accuracy", k=3, random_state=0)
+    evaluator = Evaluator(scorer, backend="process", n_workers=2)
+    try:
+        evaluator.evaluate([{"C": 0.5}, {"C": 1.0}])
+        assert isinstance(evaluator.shared, SharedDataset)
+        dtypes, columns, index, values, read_only = evaluator._get_executor().submit(worker_data).result()
+        assert dtypes == list(x_train.dtypes)
+        assert columns == list(x_train.columns)
+        pd.testing.assert_index_equal(index, x_train.index)
+        assert np.array_equal(values, x_train.to_numpy(dtype=float))
+        assert read_only
+    finally:
+        evaluator.close()
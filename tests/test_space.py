@@ -0,0 +1,195 @@
+import numpy as np
+import pytest
+from ga_hypertuner.callbacks import Callback
+from ga_hypertuner.ga import GA
+from ga_hypertuner.space import SearchSpace
+
+model_parameters = {"C": [None, float, "log"], "max_iter": [None, int, "linear", 50],
+                    "tol": [None, float, "linear", 0.25], "solver": [None, "categorical"],
+                    "n": [None, int], "class_weight": "balanced"}
+boundaries = {"C": [1e-4, 1e2], "max_iter": [100, 1000], "tol": [0.0, 1.0], "solver": ["lbfgs", "saga", "sag"],
+              "n": [1, 5]}
+
+
+def test_decode_encode_round_trip():
+    space = SearchSpace(model_parameters, boundaries)
+    rng = np.random.default_rng(0)
+    for row in space.sample(rng, 200):
+        params = space.decode(row)
+        assert params["class_weight"] == "balanced"
+        assert 1e-4 <= params["C"] <= 1e2
+        assert params["max_iter"] in range(100, 1001, 50)
+        assert params["tol"] in (0.0, 0.25, 0.5, 0.75, 1.0)
+        assert params["solver"] in boundaries["solver"]
+        decoded = space.decode(space.encode(params))
+        assert np.isclose(decoded.pop("C"), params.pop("C"), rtol=1e-12)
+        assert decoded == params
+
+
+def test_log_parameters_are_encoded_as_logarithm():
+    space = SearchSpace(model_parameters, boundaries)
+    j = space.optimized.index("C")
+    assert np.isclose(space.lower[j], np.log(1e-4)) and np.isclose(space.upper[j], np.log(1e2))
+    assert np.isclose(space.encode_value("C", 1.0), 0.0)
+    # log-uniform sampling puts about as many values in each decade
+    values = np.exp(space.sample(np.random.default_rng(1), 6000)[:, j])
+    counts = np.histogram(np.log10(values), bins=6, range=(-4, 2))[0]
+    assert counts.min() > 800
+
+
+def test_opposite_mirrors_numeric_and_redraws_categorical():
+    space = SearchSpace(model_parameters, boundaries)
+    rng = np.random.default_rng(2)
+    population = space.sample(rng, 300)
+    opposites = space.clip(space.opposite(population, rng))
+    numeric = ~space.cat_mask
+    np.testing.assert_allclose(opposites[:, numeric], space.clip(space.lower + space.upper - population)[:, numeric])
+    j = space.optimized.index("C")
+    # mirrored in log space: C and its opposite multiply to the product of the bounds
+    np.testing.assert_allclose(np.exp(population[:, j] + opposites[:, j]), 1e-4 * 1e2)
+    k = space.optimized.index("solver")
+    assert (opposites[:, k] != population[:, k]).all()
+    assert set(opposites[:, k].astype(int).tolist()) == {0, 1, 2}
+    for row in opposites:
+        space.decode(row)
+
+
+def test_opposite_of_numeric_space_draws_nothing():
+    space = SearchSpace({"C": [None, float]}, {"C": [0.0, 1.0]})
+    rng = np.random.default_rng(3)
+    state = rng.bit_generator.state
+    np.testing.assert_allclose(space.opposite(np.array([[0.25]]), rng), [[0.75]])
+    assert rng.bit_generator.state == state
+
+
+def test_encode_and_decode_of_each_kind():
+    space = SearchSpace(model_parameters, boundaries)
+    params = {"C": 0.01, "max_iter": 250, "tol": 0.5, "solver": "sag", "n": 3, "class_weight": "balanced"}
+    row = space.encode(params)
+    np.testing.assert_allclose(row, [np.log(0.01), 250.0, 0.5, 2.0, 3.0])
+    assert space.decode(row) == pytest.approx(params)
+    # quantized values are rounded to their grid, and kept on the grid inside the bounds
+    assert space.decode(np.array([0.0, 274.0, 0.13, 0.0, 1.0]))["max_iter"] == 250
+    assert space.decode(np.array([0.0, 276.0, 0.13, 0.0, 1.0]))["tol"] == 0.25
+    assert space.decode(np.array([0.0, 1020.0, 1.1, 0.0, 1.0]))["max_iter"] == 1000
+    # log-scale integers are rounded after exponentiation
+    space = SearchSpace({"n_estimators": [None, int, "log"]}, {"n_estimators": [1, 1000]})
+    assert not space.int_mask[0]
+    assert space.decode(np.array([np.log(41.6)])) == {"n_estimators": 42}
+    assert space.decode(space.encode({"n_estimators": 500})) == {"n_estimators": 500}
+
+
+def test_clip_insets_floats_and_truncates_ints():
+    space = SearchSpace(model_parameters, boundaries)
+    low, high = space.lower, space.upper
+    population = np.array([high + 1.0, low - 1.0, [0.0, 500.0, 0.5, 1.7, 3.9], [0.0, 500.0, 0.5, -0.5, 5.2]])
+    clipped = space.clip(population)
+    # floats are clipped 1e-10 inside their bounds, in their encoding, and ints exactly to their bounds
+    np.testing.assert_array_equal(clipped[0], np.where(space.int_mask, high, high - 1e-10))
+    np.testing.assert_array_equal(clipped[1], np.where(space.int_mask, low, low + 1e-10))
+    np.testing.assert_array_equal(clipped[2], [0.0, 500.0, 0.5, 1.0, 3.0])
+    np.testing.assert_array_equal(clipped[3], [0.0, 500.0, 0.5, 0.0, 5.0])
+    assert space.decode(clipped[0])["C"] == pytest.approx(1e2) and space.decode(clipped[0])["C"] <= 1e2
+    # values inside the bounds are not changed
+    inside = space.sample(np.random.default_rng(4), 50)
+    np.testing.assert_array_equal(space.clip(inside), inside)
+
+
+def per_individual_children(population, keys, masks, space, fscale, cp):
+    """
+    Children of rand/1 built one individual and one hyperparameter at a time, like the code before population was
+    held as a matrix, drawing donors from the same random keys and crossover from the same random numbers.
+    """
+    vectors = [space.decode(row) for row in population]
+    children = []
+    for i, parent in enumerate(vectors):
+        others = [j for j in range(len(vectors)) if j != i]
+        chosen = [others[k] for k in np.argsort(keys[i])[:3]]
+        child = {}
+        for j, p in enumerate(space.optimized):
+            start, end = space.bounds[p]
+            x = vectors[chosen[0]][p] + fscale * (vectors[chosen[1]][p] - vectors[chosen[2]][p])
+            if p in space.int_names:
+                x = min(max(int(x), start), end)
+            elif x > end:
+                x = end - 1e-10
+            elif x < start:
+                x = start + 1e-10
+            child[p] = x if masks[i, j] < cp else parent[p]
+        children.append(child)
+    return children
+
+
+def test_breed_matches_per_individual_code(iris, settings):
+    ga = GA(x_train=iris[0], y_train=iris[1], **settings)
+    for seed in range(5):
+        population = ga.space.sample(np.random.default_rng(seed), 6)
+        scores = np.random.default_rng(seed).random(6)
+        rng = np.random.default_rng(seed)
+        keys, masks = rng.random((6, 5)), rng.random((6, 2))
+        ga.rng = np.random.default_rng(seed)
+        # a large scaling factor sends many trials out of bounds
+        children = ga.breed(population, scores, np.arange(6), np.full(6, 1.5), np.full(6, 0.5))
+        expected = per_individual_children(population, keys, masks, ga.space, 1.5, 0.5)
+        for row, child in zip(children, expected):
+            assert ga.space.decode(row) == pytest.approx(dict(child, solver="lbfgs"))
+
+
+@pytest.mark.parametrize("method", ["lhs", "sobol", "halton"])
+def test_space_filling_samples_are_valid(method):
+    space = SearchSpace(model_parameters, boundaries)
+    population = space.sample(np.random.default_rng(5), 7, method)
+    assert population.shape == (7, space.dim)
+    assert np.all(population >= space.lower) and np.all(population <= space.upper)
+    # integers and categorical indices are whole numbers
+    ints = population[:, space.int_mask]
+    np.testing.assert_array_equal(ints, np.floor(ints))
+    for row in population:
+        params = space.decode(row)
+        assert params["solver"] in boundaries["solver"] and type(params["n"]) == int
+    np.testing.assert_array_equal(space.sample(np.random.default_rng(5), 7, method), population)
+
+
+def test_latin_hypercube_puts_one_individual_in_each_stratum():
+    space = SearchSpace(model_parameters, boundaries)
+    population = space.sample(np.random.default_rng(6), 10, "lhs")
+    floats = ~space.int_mask
+    strata = np.floor((population[:, floats] - space.lower[floats]) / (space.upper - space.lower)[floats] * 10)
+    for column in strata.T:
+        assert sorted(column.tolist()) == list(range(10))
+    # each of the 3 choices gets a third of the individuals, give or take one
+    k = space.optimized.index("solver")
+    assert np.bincount(population[:, k].astype(int), minlength=3).min() >= 3
+
+
+class Evaluations(Callback):
+    def __init__(self):
+        self.records = []
+        self.stats = []
+
+    def on_eval_end(self, record):
+        self.records.append(record)
+
+    def on_generation_end(self, generation, stats):
+        self.stats.append(stats)
+
+
+def test_opposition_keeps_best_of_individuals_and_opposites(iris, settings):
+    evaluations = Evaluations()
+    ga = GA(x_train=iris[0], y_train=iris[1], opposition=True, callbacks=[evaluations], **settings)
+    population, scores = ga.initiation()
+    assert population.shape == (6, 2)
+    assert len(evaluations.records) == 12
+    all_scores = sorted((record["score"] for record in evaluations.records), reverse=True)
+    assert sorted(scores.tolist(), reverse=True) == all_scores[:6]
+    # each individual keeps the score of its own hyperparameters
+    scored = {tuple(sorted(record["params"].items())): record["score"] for record in evaluations.records}
+    for row, score in zip(population, scores):
+        assert scored[tuple(sorted(ga.space.decode(row).items()))] == score
+
+
+def test_opposite_evaluations_are_counted(iris, settings):
+    evaluations = Evaluations()
+    GA(x_train=iris[0], y_train=iris[1], opposition=True, callbacks=[evaluations], **settings).main()
+    # the initial population is scored twice over, later generations once
+    assert [stats["evaluations"] for stats in evaluations.stats] == [12, 6, 6]
@@ -0,0 +1,68 @@
+import math
+import pytest
+from sklearn.base import BaseEstimator
+from ga_hypertuner.ga import GA
+
+
+class Quadratic(BaseEstimator):
+    """
+    Model whose score only depends on its hyperparameter, best for values between 3 and 4.
+    """
+
+    def __init__(self, x=0):
+        self.x = x
+
+    def fit(self, X, y):
+        return self
+
+    def score(self, X, y):
+        return -float(math.floor(self.x) - 3) ** 2
+
+
+def steady_ga(iris, backend="serial", n_workers=1, gmax=8, **kwargs):
+    return GA(x_train=iris[0], y_train=iris[1], model_class=Quadratic, scoring=None, k=3, verbosity=0,
+              ga_parameters={"pop_size": 6, "fscale": 0.8, "gmax": gmax, "direction": "max", "cp": 0.9},
+              model_parameters={"x": [None, float]}, boundaries={"x": [0, 7]}, random_state=0,
+              mode="steady_state", backend=backend, n_workers=n_workers, **kwargs)
+
+
+def test_children_are_dispatched_as_workers_free_up(iris):
+    ga = steady_ga(iris, backend="thread", n_workers=2)
+    submit, wait = ga.evaluator.submit, ga.evaluator.wait
+    running, peak, submitted = [0], [0], [0]
+
+    def counting_submit(*args, **kwargs):
+        running[0] += 1
+        submitted[0] += 1
+        peak[0] = max(peak[0], running[0])
+        return submit(*args, **kwargs)
+
+    def counting_wait(futures):
+        done = wait(futures)
+        running[0] -= len(done)
+        return done
+
+    ga.evaluator.submit, ga.evaluator.wait = counting_submit, counting_wait
+    ga.main()
+    assert peak[0] == 2
+    # the initial population is scored as a batch, every later child on its own
+    assert submitted[0] == (8 - 1) * 6
+    assert len(ga.max_scores) == 8 - 1
+    # a child only replaces a parent it is at least as good as
+    assert ga.max_scores == sorted(ga.max_scores)
+    assert ga.mean_scores == sorted(ga.mean_scores)
+
+
+@pytest.mark.parametrize("backend, n_workers", [("thread", 2), ("thread", 3)])
+def test_parallel_run_finds_serial_best(iris, backend, n_workers):
+    serial = steady_ga(iris, gmax=15).main()
+    parallel = steady_ga(iris, backend=backend, n_workers=n_workers, gmax=15).main()
+    assert math.floor(serial["x"]) == math.floor(parallel["x"]) == 3
+
+
+def test_stop_criteria_end_steady_state_run(iris):
+    ga = steady_ga(iris, backend="thread", n_workers=2, gmax=50, stop_criteria=True, stop_value=-0.5)
+    assert math.floor(ga.main()["x"]) == 3
+    assert "stop value" in ga.stop_reason
+    assert len(ga.max_scores) < 50 - 1
+    assert ga.max_scores[-1] == 0.0
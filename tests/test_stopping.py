@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from ga_hypertuner.ga import GA
+from ga_hypertuner.stopping import Deadline, DiversityCollapse, FitBudget, Stagnation, StopValue
+
+
+def fake_ga(direction="max", max_scores=(), min_scores=(), elapsed=0.0, fits=0):
+    space = SimpleNamespace(lower=np.array([0.0, 100.0]), upper=np.array([1.0, 400.0]), dim=2)
+    return SimpleNamespace(gp={"direction": direction}, max_scores=list(max_scores), min_scores=list(min_scores),
+                           space=space, elapsed=lambda: elapsed, fits=fits)
+
+
+def test_stop_value_maximizing():
+    stopper = StopValue(0.9)
+    assert stopper.check(fake_ga("max"), None, np.array([0.5, 0.9])) is None
+    assert "stop value 0.9" in stopper.check(fake_ga("max"), None, np.array([0.5, 0.95]))
+
+
+def test_stop_value_minimizing():
+    stopper = StopValue(0.1)
+    assert stopper.check(fake_ga("min"), None, np.array([0.5, 0.1])) is None
+    assert "stop value 0.1" in stopper.check(fake_ga("min"), None, np.array([0.5, 0.05]))
+
+
+def test_stagnation_maximizing():
+    stopper = Stagnation(2, min_delta=0.01)
+    assert stopper.check(fake_ga("max", max_scores=[0.5, 0.5]), None, None) is None
+    assert stopper.check(fake_ga("max", max_scores=[0.5, 0.6, 0.7]), None, None) is None
+    assert "for 2 generations" in stopper.check(fake_ga("max", max_scores=[0.5, 0.7, 0.705, 0.709]), None, None)
+
+
+def test_stagnation_minimizing():
+    stopper = Stagnation(1)
+    assert stopper.check(fake_ga("min", min_scores=[0.5, 0.4]), None, None) is None
+    assert stopper.check(fake_ga("min", min_scores=[0.5, 0.4, 0.4]), None, None) is not None
+
+
+def test_diversity_collapse():
+    stopper = DiversityCollapse(0.01)
+    spread = np.array([[0.2, 200.0], [0.8, 210.0]])
+    collapsed = np.array([[0.5, 200.0], [0.501, 201.0]])
+    assert stopper.check(fake_ga(), spread, None) is None
+    assert "below 0.01" in stopper.check(fake_ga(), collapsed, None)
+
+
+def test_deadline():
+    assert Deadline(10).check(fake_ga(elapsed=9.5), None, None) is None
+    assert "10 seconds" in Deadline(10).check(fake_ga(elapsed=10.0), None, None)
+
+
+def test_fit_budget():
+    assert FitBudget(30).check(fake_ga(fits=29), None, None) is None
+    assert "30 model fits" in FitBudget(30).check(fake_ga(fits=30), None, None)
+
+
+@pytest.mark.parametrize("criteria, reason", [
+    ({"stop_criteria": True, "stop_value": 0.0}, "reached stop value"),
+    ({"max_fits": 1}, "model fits reached"),
+    ({"max_seconds": 0}, "deadline"),
+    ({"stop_spread": 1.0}, "population spread"),
+])
+def test_stop_reason_of_run(iris, settings, criteria, reason):
+    ga = GA(x_train=iris[0], y_train=iris[1], **dict(settings, **criteria))
+    ga.main()
+    assert reason in ga.stop_reason
+    # criteria are checked at the end of the first generation after the initial population
+    assert len(ga.max_scores) == 1
+
+
+def test_stop_reason_without_criteria(iris, settings):
+    ga = GA(x_train=iris[0], y_train=iris[1], **settings)
+    ga.main()
+    assert ga.stop_reason == "maximum number of generations reached"
+    assert len(ga.max_scores) == settings["ga_parameters"]["gmax"] - 1
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from ga_hypertuner.adaptation import Adaptation
+from ga_hypertuner.ga import GA
+
+
+def float_ga(iris, strategy, **kwargs):
+    return GA(x_train=iris[0], y_train=iris[1], model_class=LogisticRegression, scoring="accuracy", verbosity=0,
+              ga_parameters={"pop_size": 6, "fscale": 0.5, "gmax": 3, "direction": "max", "cp": 0.5},
+              model_parameters={"C": [None, float], "tol": [None, float]},
+              boundaries={"C": [0.0, 10.0], "tol": [0.0, 10.0]}, random_state=0, strategy=strategy, **kwargs)
+
+
+def expected_trials(strategy, population, scores, rng, fscale):
+    """
+    Trial individuals of each strategy, one parent at a time, drawing random numbers like GA.breed.
+    """
+    n = len(population)
+    keys = rng.random((n, n - 1))
+    best = population[np.argmax(scores)]
+    if strategy == "current-to-pbest/1":
+        # with 6 individuals, the best pbest_rate of the population is the best individual
+        rng.integers(1, size=n)
+    trials = []
+    for i in range(n):
+        others = [j for j in range(n) if j != i]
+        d = [population[others[k]] for k in np.argsort(keys[i])]
+        if strategy == "rand/1":
+            trials.append(d[0] + fscale * (d[1] - d[2]))
+        elif strategy == "rand/2":
+            trials.append(d[0] + fscale * (d[1] - d[2]) + fscale * (d[3] - d[4]))
+        elif strategy == "best/1":
+            trials.append(best + fscale * (d[0] - d[1]))
+        else:
+            trials.append(population[i] + fscale * (best - population[i]) + fscale * (d[0] - d[1]))
+    return np.array(trials)
+
+
+@pytest.mark.parametrize("strategy", list(GA.strategies))
+def test_strategy_matches_formula(iris, strategy):
+    ga = float_ga(iris, strategy)
+    population = 4.0 + 2.0 * np.random.default_rng(1).random((6, 2))
+    scores = np.array([0.5, 0.9, 0.6, 0.7, 0.8, 0.4])
+    rng = np.random.default_rng(2)
+    ga.rng = np.random.default_rng(2)
+    # crossover probability 1 keeps every parameter of the trial individual
+    children = ga.breed(population, scores, np.arange(6), np.full(6, 0.5), np.full(6, 1.0))
+    assert np.allclose(children, expected_trials(strategy, population, scores, rng, 0.5))
+
+
+@pytest.mark.parametrize("strategy", list(GA.strategies))
+def test_strategy_trials_are_in_bounds(iris, strategy):
+    ga = float_ga(iris, strategy)
+    population = ga.space.sample(ga.rng, 6)
+    scores = np.linspace(0.1, 0.6, 6)
+    children = ga.breed(population, scores, np.arange(6), np.full(6, 2.0), np.full(6, 1.0))
+    assert np.all(children > 0.0) and np.all(children < 10.0)
+
+
+def test_jade_moves_centers_toward_successful_values():
+    adaptation = Adaptation("jade", 0.5, 0.5)
+    adaptation.success(np.array([0.8, 0.6]), np.array([0.9, 0.7]), np.array([1.0, 3.0]))
+    adaptation.update()
+    # Lehmer mean of scaling factors, arithmetic mean of crossover probabilities, unweighted
+    lehmer = (0.8 ** 2 + 0.6 ** 2) / (0.8 + 0.6)
+    assert adaptation.memory_f[0] == pytest.approx(0.9 * 0.5 + 0.1 * lehmer)
+    assert adaptation.memory_cr[0] == pytest.approx(0.9 * 0.5 + 0.1 * 0.8)
+    assert adaptation.successes == []
+
+
+def test_shade_weights_by_improvement_and_wraps_memory():
+    adaptation = Adaptation("shade", 0.5, 0.5, memory_size=3)
+    adaptation.success(np.array([0.8, 0.4]), np.array([0.9, 0.1]), np.array([3.0, 1.0]))
+    adaptation.update()
+    assert adaptation.memory_f[0] == pytest.approx((0.75 * 0.64 + 0.25 * 0.16) / (0.75 * 0.8 + 0.25 * 0.4))
+    assert adaptation.memory_cr[0] == pytest.approx(0.75 * 0.9 + 0.25 * 0.1)
+    assert adaptation.slot == 1
+    for f in [0.2, 0.3, 0.6]:
+        adaptation.success(np.array([f]), np.array([f]), np.array([1.0]))
+        adaptation.update()
+    assert adaptation.slot == 1
+    assert np.allclose(adaptation.memory_f, [0.6, 0.2, 0.3])
+
+
+def test_centers_do_not_move_without_successes():
+    adaptation = Adaptation("shade", 0.5, 0.4, memory_size=2)
+    adaptation.update()
+    assert adaptation.slot == 0
+    assert adaptation.means() == (0.5, 0.4)
+
+
+def test_sampled_controls_are_in_range():
+    adaptation = Adaptation("jade", 0.05, 0.95)
+    f, cr = adaptation.sample(np.random.default_rng(0), 1000)
+    assert np.all(f > 0) and np.all(f <= 1)
+    assert np.all(cr >= 0) and np.all(cr <= 1)
+
+
+def test_only_strictly_better_children_are_successes(iris):
+    ga = float_ga(iris, "rand/1", adaptation="jade")
+    scores = np.array([0.5, 0.5, 0.5, 0.5])
+    children_scores = np.array([0.7, 0.5, 0.4, np.inf])
+    ga.adapt(scores, children_scores, np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.5, 0.6, 0.7, 0.8]))
+    assert len(ga.adaptation.successes) == 1
+    assert ga.adaptation.successes[0] == pytest.approx((0.1, 0.5, 0.2))
@@ -0,0 +1,70 @@
+import copy
+import numpy as np
+import pytest
+from ga_hypertuner.ga import GA
+
+
+def record(params, score, complete=True, fidelity=1.0, cached=False):
+    return {"params": params, "score": score, "complete": complete, "fidelity": fidelity, "cached": cached}
+
+
+def surrogate_ga(iris, settings, model="random_forest"):
+    return GA(x_train=iris[0], y_train=iris[1], surrogate=model, surrogate_candidates=4, **settings)
+
+
+def test_only_complete_full_evaluations_are_collected(iris, settings):
+    surrogate = surrogate_ga(iris, settings).surrogate
+    surrogate.on_eval_end(record({"C": 0.5, "max_iter": 100}, 0.9, complete=False))
+    surrogate.on_eval_end(record({"C": 0.5, "max_iter": 100}, 0.9, fidelity=0.5))
+    surrogate.on_eval_end(record({"C": 0.5, "max_iter": 100}, 0.9, cached=True))
+    surrogate.on_eval_end(record({"C": 0.5, "max_iter": 100}, np.nan))
+    surrogate.on_eval_end(record({"C": 0.5, "max_iter": 100}, 0.9))
+    assert surrogate.scores == [0.9]
+    assert not surrogate.ready()
+
+
+def test_candidates_are_not_screened_before_surrogate_is_ready(iris, settings):
+    ga = surrogate_ga(iris, settings)
+    population = ga.space.sample(ga.rng, 6)
+    scores = np.linspace(0.5, 0.9, 6)
+    parents, fscale, cp = np.arange(6), np.full(6, 0.5), np.full(6, 0.5)
+    expected = copy.deepcopy(ga)
+    children = ga.offspring(population, scores, parents, fscale, cp)
+    assert np.array_equal(children, expected.breed(population, scores, parents, fscale, cp))
+    assert ga.surrogate.regressor is None
+
+
+def test_candidate_with_highest_expected_improvement_is_kept(iris, settings):
+    ga = surrogate_ga(iris, settings)
+    rng = np.random.default_rng(1)
+    population = ga.space.sample(ga.rng, 6)
+    scores = rng.random(6)
+    for row, score in zip(ga.space.sample(rng, 20), rng.random(20)):
+        ga.surrogate.on_eval_end(record(ga.space.decode(row), score))
+    assert ga.surrogate.ready()
+    parents, fscale, cp = np.arange(6), np.full(6, 0.5), np.full(6, 0.5)
+
+    expected = copy.deepcopy(ga)
+    children = ga.offspring(population, scores, parents, fscale, cp)
+    candidates = expected.breed(population, scores, np.repeat(parents, 4), np.repeat(fscale, 4), np.repeat(cp, 4))
+    expected.surrogate.fit(int(expected.rng.integers(2 ** 31 - 1)))
+    ei = expected.surrogate.expected_improvement(candidates, scores.max()).reshape(6, 4)
+    assert np.array_equal(children, candidates.reshape(6, 4, -1)[np.arange(6), np.argmax(ei, axis=1)])
+    assert ga.surrogate.fit_time > 0
+
+
+@pytest.mark.filterwarnings("ignore::sklearn.exceptions.ConvergenceWarning")
+@pytest.mark.parametrize("model", ["random_forest", "gaussian_process"])
+def test_surrogate_runs_are_reproducible(iris, settings, model):
+    first, second = surrogate_ga(iris, settings, model), surrogate_ga(iris, settings, model)
+    assert first.main() == second.main()
+    assert first.max_scores == second.max_scores
+    assert first.mean_scores == second.mean_scores
+
+
+def test_surrogate_time_is_reported(iris, settings):
+    ga = surrogate_ga(iris, settings)
+    ga.main()
+    assert all("surrogate_time" in stats for stats in ga.generation_stats)
+    # the surrogate is ready after the initial population, so later generations spend time in it
+    assert all(stats["surrogate_time"] > 0 for stats in ga.generation_stats[1:])
@@ -0,0 +1,101 @@
+import os
+import time
+from sklearn.linear_model import LogisticRegression
+from ga_hypertuner.cache import FitnessCache
+from ga_hypertuner.evaluation import Evaluator, Scorer
+from ga_hypertuner.shared import SharedDataset
+
+
+class Sleepy(LogisticRegression):
+    """
+    Logistic regression whose fit sleeps first, to run past the timeout of an evaluation.
+    """
+
+    def __init__(self, sleep=0.0, C=1.0, max_iter=200):
+        super().__init__(C=C, max_iter=max_iter)
+        self.sleep = sleep
+
+    def fit(self, X, y, sample_weight=None):
+        time.sleep(self.sleep)
+        return super().fit(X, y, sample_weight)
+
+
+class Crashing(LogisticRegression):
+    """
+    Logistic regression whose fit can end its process, like a crash in native code.
+    """
+
+    def __init__(self, crash=False, C=1.0, max_iter=200):
+        super().__init__(C=C, max_iter=max_iter)
+        self.crash = crash
+
+    def fit(self, X, y, sample_weight=None):
+        if self.crash:
+            os._exit(1)
+        return super().fit(X, y, sample_weight)
+
+
+def test_evaluation_past_timeout_gets_penalty(iris):
+    scorer = Scorer(Sleepy, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0, timeout=1.0,
+                    penalty=-1.0)
+    cache = FitnessCache()
+    evaluator = Evaluator(scorer, cache=cache)
+    slow, fast = {"sleep": 30.0}, {"sleep": 0.0}
+    try:
+        warm = evaluator.evaluate([fast], records=True)[0]
+        assert not warm["timed_out"]
+        sandbox = scorer.sandbox_list[0]
+        killed = sandbox.process
+
+        record = evaluator.evaluate([slow], records=True)[0]
+        assert record["timed_out"]
+        assert record["score"] == -1.0
+        assert record["folds"] == 0
+        assert record["end"] - record["start"] < 10.0
+        assert not killed.is_alive()
+        assert cache.get(cache.key(slow)) is None
+        assert evaluator.reset_counters()[1] == 1
+
+        # the next evaluation runs in a new sandbox process
+        after = evaluator.evaluate([dict(fast, C=0.5)], records=True)[0]
+        assert not after["timed_out"]
+        assert after["folds"] == 3
+        assert sandbox.process is not None and sandbox.process is not killed
+        assert sandbox.process.is_alive()
+    finally:
+        evaluator.close()
+
+
+def test_crashed_sandbox_is_penalized_and_restarted(iris):
+    scorer = Scorer(Crashing, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0, timeout=30.0,
+                    penalty=-1.0)
+    cache = FitnessCache()
+    evaluator = Evaluator(scorer, cache=cache)
+    crash = {"crash": True}
+    try:
+        record = evaluator.evaluate([crash], records=True)[0]
+        assert record["timed_out"]
+        assert record["score"] == -1.0
+        assert cache.get(cache.key(crash)) is None
+        assert scorer.sandbox_list[0].process is None
+
+        after = evaluator.evaluate([{"crash": False}], records=True)[0]
+        assert not after["timed_out"]
+        assert after["folds"] == 3
+        assert scorer.sandbox_list[0].process.is_alive()
+    finally:
+        evaluator.close()
+
+
+def test_sandbox_maps_shared_data(iris):
+    scorer = Scorer(Crashing, iris[0], iris[1], "accuracy", k=3, stratified=True, random_state=0, timeout=30.0)
+    scorer.shared = SharedDataset(iris[0], iris[1])
+    try:
+        record = scorer.race({"C": 0.5}, None)
+        # the sandbox received the scorer without training data
+        assert scorer.sandbox_list[0].scorer.x_t is None
+        scorer.timeout = None
+        assert record["fold_scores"] == scorer.race({"C": 0.5}, None)["fold_scores"]
+    finally:
+        scorer.close()
+        scorer.shared.close()
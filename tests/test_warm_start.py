@@ -0,0 +1,50 @@
+import numpy as np
+from ga_hypertuner.ga import GA
+from ga_hypertuner.history import History
+
+
+def seeded(iris, settings, warm_start, **kwargs):
+    ga = GA(x_train=iris[0], y_train=iris[1], warm_start=warm_start, **dict(settings, **kwargs))
+    population, scores = ga.initiation()
+    return ga, population, scores
+
+
+def test_seeds_of_list_enter_population(iris, settings):
+    seeds = [{"C": 0.5, "max_iter": 200}, {"C": 0.25, "max_iter": 300}]
+    ga, population, scores = seeded(iris, settings, seeds)
+    for i, seed in enumerate(seeds):
+        assert {p: ga.space.decode(population[i])[p] for p in seed} == seed
+    assert population.shape == (6, 2)
+    assert np.all(np.isfinite(scores))
+
+
+def test_out_of_space_seeds_are_clipped_or_drawn(iris, settings):
+    seeds = [{"C": 5.0, "max_iter": 99.7}, {"C": "large"}, {"max_iter": 250}]
+    ga, population, _ = seeded(iris, settings, seeds)
+    assert population[0, 0] == 1.0 - 1e-10
+    assert population[0, 1] == 100
+    # values that can not be encoded, and missing hyperparameters, keep their random values
+    assert 0.01 < population[1, 0] < 1.0 and 100 <= population[1, 1] <= 400
+    assert population[2, 1] == 250
+    assert np.all(population >= ga.space.lower) and np.all(population <= ga.space.upper)
+
+
+def test_population_size_is_kept_with_more_seeds(iris, settings):
+    seeds = [{"C": 0.1 * i, "max_iter": 100 + i} for i in range(1, 10)]
+    # duplicates are dropped before seeds are counted
+    seeds.insert(1, dict(seeds[0]))
+    ga, population, scores = seeded(iris, settings, seeds)
+    assert population.shape == (6, 2) and scores.shape == (6,)
+    assert [ga.space.decode(row)["max_iter"] for row in population] == [101, 102, 103, 104, 105, 106]
+
+
+def test_best_evaluations_of_history_are_seeded(iris, settings, tmp_path):
+    path = str(tmp_path / "history.bin")
+    GA(x_train=iris[0], y_train=iris[1], history_path=path, **settings).main()
+    history = History.load(path)
+    top = history.top(6)
+    ga, population, scores = seeded(iris, settings, path, warm_start_rescore=False)
+    assert [ga.space.decode(row) for row in population] == history.params(top)
+    # previous scores are kept, so no individual is evaluated again
+    assert np.array_equal(scores, top["score"])
+    assert ga.evaluator.drain_records() == []